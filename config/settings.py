@@ -1,9 +1,13 @@
+import os
 from typing import Tuple, Dict
 
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 900
 WINDOW_TITLE = "Lost Cities"
 FPS = 60
+# Intervalo curto de troca do GIL, aplicado pelo main.py, para os workers não
+# atrasarem os frames. Só muda a latência: o trabalho deles continua preso ao GIL.
+WORKER_SWITCH_INTERVAL = 0.001
 
 DEFAULT_RANDOM_SEED = 21
 
@@ -147,3 +151,22 @@ def get_discard_positions() -> list:
         positions.append((x, y))
 
     return positions
+
+
+class AIConfig:
+    # Padrão é dois jogadores humanos; a IA entra com main.py --ia ou a tecla I.
+    ENABLED = False
+    PLAYER = 2
+    ALGORITHM = 'ismcts'
+
+    TIME_BUDGET = 1.0
+    MAX_ITERATIONS = 0
+    FRAME_BUDGET = 0.008
+
+    EXPLORATION = 1.4
+    SEED = None
+
+    ROLLOUT_DEPTH = 12
+    EVALUATION_SCALE = 20.0
+
+    WORKERS = os.cpu_count() or 1
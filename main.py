@@ -1,9 +1,36 @@
+import argparse
+import sys
+from pathlib import Path
+
+from config.settings import WORKER_SWITCH_INTERVAL, AIConfig
+from src.analysis.arquivo import ArquivoPartidas
 from src.game.manager import GameFactory
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Lost Cities')
+    parser.add_argument('--arquivo', type=Path,
+                        help='arquivo de partidas indexado para reproduzir')
+    parser.add_argument('--partida', type=int, default=0,
+                        help='número da partida no arquivo')
+    parser.add_argument('--jogada', type=int,
+                        help='jogada em que a reprodução começa (padrão: a última)')
+    parser.add_argument('--ia', action='store_true', default=AIConfig.ENABLED,
+                        help=f'IA no lugar do jogador {AIConfig.PLAYER} (a tecla I alterna durante o jogo)')
+    parser.add_argument('--intervalo-troca', type=float, default=WORKER_SWITCH_INTERVAL,
+                        help='intervalo de troca do GIL em segundos, para os workers não atrasarem os frames')
+    args = parser.parse_args()
+    if args.intervalo_troca <= 0:
+        parser.error('--intervalo-troca deve ser positivo')
+    sys.setswitchinterval(args.intervalo_troca)
+
     try:
-        jogo = GameFactory.criar_jogo_padrao(seed=1)
+        if args.arquivo:
+            with ArquivoPartidas(args.arquivo) as arquivo:
+                registro = arquivo[args.partida]
+            jogo = GameFactory.reproduzir_partida(registro, args.jogada)
+        else:
+            jogo = GameFactory.criar_jogo_padrao(seed=1, ia=args.ia)
         jogo.executar()
     except Exception as e:
         print(f"Erro inesperado: {e}")
@@ -0,0 +1,70 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from config.settings import AIConfig
+from src.ai.playout import POLITICA_LEVE, POLITICAS
+from src.analysis.sementes import (
+    TABELA_SEMENTES,
+    TAMANHO_LOTE,
+    analisar_sementes,
+    mais_equilibradas,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Vantagem do primeiro jogador e qualidade da distribuição por seed.')
+    parser.add_argument('--inicio', type=int, default=0)
+    parser.add_argument('--quantidade', type=int, default=100000)
+    parser.add_argument('--rollouts', type=int, default=32,
+                        help='partidas simuladas por seed (no máximo 65535)')
+    parser.add_argument('--politica', choices=POLITICAS, default=POLITICA_LEVE)
+    parser.add_argument('--seed-rollouts', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=AIConfig.WORKERS)
+    parser.add_argument('--lote', type=int, default=TAMANHO_LOTE,
+                        help='seeds por tarefa enviada ao pool')
+    parser.add_argument('--saida', type=Path, default=Path('files') / 'sementes.npy')
+    parser.add_argument('--melhores', type=int, default=10)
+    args = parser.parse_args()
+    if not 0 < args.rollouts <= np.iinfo(np.uint16).max:
+        parser.error('--rollouts deve estar entre 1 e 65535')
+
+    args.saida.parent.mkdir(parents=True, exist_ok=True)
+    tabela = np.lib.format.open_memmap(args.saida, mode='w+', dtype=TABELA_SEMENTES,
+                                       shape=(args.quantidade,))
+    analisadas = 0
+    inicio = time.perf_counter()
+    for lote in analisar_sementes(args.inicio, args.quantidade, args.rollouts,
+                                  max(1, args.workers), args.lote, args.politica,
+                                  args.seed_rollouts):
+        deslocamento = lote['seed'][0] - args.inicio
+        tabela[deslocamento:deslocamento + len(lote)] = lote
+        analisadas += len(lote)
+        decorrido = time.perf_counter() - inicio
+        print(f'{analisadas}/{args.quantidade} seeds ({analisadas / decorrido:.0f}/s)',
+              file=sys.stderr)
+    tabela.flush()
+    decorrido = time.perf_counter() - inicio
+
+    partidas = args.quantidade * args.rollouts
+    taxa1 = tabela['vitorias1'].sum(dtype=np.int64) / partidas
+    taxa2 = tabela['vitorias2'].sum(dtype=np.int64) / partidas
+    erro = 1.96 * np.sqrt(taxa1 * (1 - taxa1) / partidas)
+    print(f'{args.quantidade} seeds x {args.rollouts} rollouts ({args.politica}) em '
+          f'{decorrido:.2f}s: {args.quantidade / decorrido:.0f} seeds/s, '
+          f'tabela em {args.saida}')
+    print(f'primeiro jogador: {taxa1:.4f} ± {erro:.4f} vitórias, segundo: {taxa2:.4f}, '
+          f'diferença média {tabela["diferenca"].mean():+.2f} pontos')
+    print(f'{"seed":>12} {"v1":>5} {"v2":>5} {"dif":>7} {"est1":>7} {"est2":>7}')
+    for linha in mais_equilibradas(tabela, args.melhores):
+        print(f'{linha["seed"]:>12} {linha["vitorias1"]:>5} {linha["vitorias2"]:>5} '
+              f'{linha["diferenca"]:>+7.2f} {linha["estimativa1"]:>7.2f} '
+              f'{linha["estimativa2"]:>7.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+from typing import List, Sequence, Tuple
+
+from config.settings import CardConfig, GameConfig
+from src.core.rules import (
+    INVESTIMENTOS_POR_MASCARA,
+    MASCARA_BLOQUEIO,
+    QUANTIDADE_POR_MASCARA,
+    SOMA_POR_MASCARA,
+)
+from src.game.compact_state import FASE_JOGAR, CompactState
+from src.game.state import GameState
+from src.models.card_codes import (
+    CARTAS_POR_COR,
+    INDICE_COR_CARTA,
+    MASCARA_COR,
+    NUM_CORES,
+    TOTAL_CARTAS,
+)
+
+PESO_DESCARTE = 0.5
+PESO_DECK = 0.3
+CARTAS_DECK_INICIAL = TOTAL_CARTAS - GameConfig.NUM_PLAYERS * CardConfig.HAND_SIZE
+
+_MASCARAS = range(1 << CARTAS_POR_COR)
+
+# Posições que ainda podem ser jogadas numa expedição com essas cartas.
+JOGAVEIS_POR_MASCARA: Tuple[int, ...] = tuple(
+    sum(1 << bit for bit in range(CARTAS_POR_COR)
+        if not mascara & MASCARA_BLOQUEIO[bit] and not mascara >> bit & 1)
+    for mascara in _MASCARAS)
+
+
+def estimar_expedicao(expedicao: int, mao: int, descarte: int, deck: int,
+                      peso_mao: float, peso_deck: float) -> float:
+    jogaveis = JOGAVEIS_POR_MASCARA[expedicao]
+    mao &= jogaveis
+    descarte &= jogaveis & ~mao
+    deck &= jogaveis
+    peso_descarte = PESO_DESCARTE * peso_mao
+
+    quantidade = (QUANTIDADE_POR_MASCARA[expedicao] +
+                  peso_mao * QUANTIDADE_POR_MASCARA[mao] +
+                  peso_descarte * QUANTIDADE_POR_MASCARA[descarte] +
+                  peso_deck * QUANTIDADE_POR_MASCARA[deck])
+    if quantidade == 0:
+        return 0.0
+
+    soma = (SOMA_POR_MASCARA[expedicao] +
+            peso_mao * SOMA_POR_MASCARA[mao] +
+            peso_descarte * SOMA_POR_MASCARA[descarte] +
+            peso_deck * SOMA_POR_MASCARA[deck])
+    investimentos = (INVESTIMENTOS_POR_MASCARA[expedicao] +
+                     peso_mao * INVESTIMENTOS_POR_MASCARA[mao] +
+                     peso_descarte * INVESTIMENTOS_POR_MASCARA[descarte] +
+                     peso_deck * INVESTIMENTOS_POR_MASCARA[deck])
+
+    valor = (soma - 20) * (1 + investimentos)
+    if quantidade >= 8:
+        valor += 20
+    if not expedicao:
+        return max(0.0, valor)
+    return valor
+
+
+def _pesos(expedicoes: Sequence[int], maos: Sequence[int], cartas_deck: int) -> Tuple[float, float]:
+    jogadas_restantes = cartas_deck // 2 + 1
+    candidatas = 0
+    for expedicao, mao in zip(expedicoes, maos):
+        candidatas += QUANTIDADE_POR_MASCARA[mao & JOGAVEIS_POR_MASCARA[expedicao]]
+    peso_mao = min(1.0, jogadas_restantes / candidatas) if candidatas else 1.0
+    peso_deck = PESO_DECK * peso_mao * cartas_deck / CARTAS_DECK_INICIAL
+    return peso_mao, peso_deck
+
+
+def estimar_jogador(expedicoes: Sequence[int], maos: Sequence[int], descartes: Sequence[int],
+                    decks: Sequence[int], cartas_deck: int) -> float:
+    peso_mao, peso_deck = _pesos(expedicoes, maos, cartas_deck)
+    total = 0.0
+    for indice_cor in range(NUM_CORES):
+        total += estimar_expedicao(expedicoes[indice_cor], maos[indice_cor],
+                                   descartes[indice_cor], decks[indice_cor],
+                                   peso_mao, peso_deck)
+    return total
+
+
+def _por_cor(mascara: int) -> List[int]:
+    return [(mascara >> (indice_cor * CARTAS_POR_COR)) & MASCARA_COR
+            for indice_cor in range(NUM_CORES)]
+
+
+def _mascaras_mao(mao: Sequence[int]) -> List[int]:
+    mascaras = [0] * NUM_CORES
+    for carta in mao:
+        mascaras[INDICE_COR_CARTA[carta]] |= 1 << (carta % CARTAS_POR_COR)
+    return mascaras
+
+
+def avaliar_estado(state: GameState, jogador: int) -> float:
+    oponente = 3 - jogador
+    deck_manager = state.deck_manager
+    montes = list(deck_manager.montes_descarte.values())
+    descartes = []
+    for monte in montes:
+        topo = monte.ver_carta_topo()
+        descartes.append(0 if topo is None else 1 << (topo % CARTAS_POR_COR))
+
+    expedicoes = {j: [slot.get_mascara() for slot in state.get_player_slots(j)]
+                  for j in (jogador, oponente)}
+    maos = {j: _mascaras_mao(state.get_player_hand(j)) for j in (jogador, oponente)}
+    decks = [
+        MASCARA_COR & ~(expedicoes[jogador][indice_cor] | expedicoes[oponente][indice_cor] |
+                        maos[jogador][indice_cor] | maos[oponente][indice_cor] |
+                        montes[indice_cor].get_mascara())
+        for indice_cor in range(NUM_CORES)
+    ]
+    cartas_deck = deck_manager.deck.quantidade_cartas()
+
+    return (estimar_jogador(expedicoes[jogador], maos[jogador], descartes, decks, cartas_deck) -
+            estimar_jogador(expedicoes[oponente], maos[oponente], descartes, decks, cartas_deck))
+
+
+def avaliar_compacto(estado: CompactState, jogador: int) -> float:
+    indice = jogador - 1
+    descartes = []
+    ocupadas = estado.expedicoes[0] | estado.expedicoes[1] | \
+        estado.mascaras_mao[0] | estado.mascaras_mao[1]
+    for monte in estado.descartes:
+        descartes.append(1 << (monte[-1] % CARTAS_POR_COR) if monte else 0)
+        for carta in monte:
+            ocupadas |= 1 << carta
+    decks = _por_cor(((1 << TOTAL_CARTAS) - 1) & ~ocupadas)
+
+    return (estimar_jogador(_por_cor(estado.expedicoes[indice]),
+                            _por_cor(estado.mascaras_mao[indice]),
+                            descartes, decks, estado.cartas_deck) -
+            estimar_jogador(_por_cor(estado.expedicoes[1 - indice]),
+                            _por_cor(estado.mascaras_mao[1 - indice]),
+                            descartes, decks, estado.cartas_deck))
+
+
+def _prioridade(estado: CompactState, codigo: int) -> int:
+    tipo = codigo >> 6
+    if tipo >= 2:
+        return 0 if tipo == 2 else 1
+
+    indice = estado.jogador_atual - 1
+    carta = estado.maos[indice][(codigo >> 3) & 7]
+    deslocamento = INDICE_COR_CARTA[carta] * CARTAS_POR_COR
+    expedicao = (estado.expedicoes[indice] >> deslocamento) & MASCARA_COR
+    jogaveis = JOGAVEIS_POR_MASCARA[expedicao]
+    posicao = carta - deslocamento
+    pulos = QUANTIDADE_POR_MASCARA[jogaveis & ((1 << posicao) - 1)]
+    if tipo == 0:
+        return pulos
+    if not jogaveis >> posicao & 1:
+        return CARTAS_POR_COR
+    return 2 * CARTAS_POR_COR - pulos
+
+
+def ordenar_movimentos(estado: CompactState, movimentos: List[int]) -> List[int]:
+    if estado.fase == FASE_JOGAR:
+        return sorted(movimentos, key=lambda codigo: _prioridade(estado, codigo))
+    return sorted(movimentos, key=lambda codigo: codigo >> 6 != 2)
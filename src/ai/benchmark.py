@@ -0,0 +1,49 @@
+import argparse
+from typing import List
+
+from config.settings import AIConfig, DEFAULT_RANDOM_SEED
+from src.ai.paralelo import ALGORITMOS, BuscaParalela
+from src.core.game_manager import GameManager
+from src.game.compact_state import CompactState
+
+
+def contagens_de_workers(maximo: int) -> List[int]:
+    contagens = []
+    workers = 1
+    while workers < maximo:
+        contagens.append(workers)
+        workers *= 2
+    contagens.append(maximo)
+    return contagens
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Escalabilidade da busca paralela na raiz.')
+    parser.add_argument('--workers', type=int, default=AIConfig.WORKERS)
+    parser.add_argument('--tempo', type=float, default=AIConfig.TIME_BUDGET)
+    parser.add_argument('--seed', type=int, default=DEFAULT_RANDOM_SEED)
+    parser.add_argument('--algoritmo', choices=sorted(ALGORITMOS),
+                        default=AIConfig.ALGORITHM)
+    args = parser.parse_args()
+
+    estado = CompactState.from_game_state(
+        GameManager.create_default(seed=args.seed).state)
+
+    print(f"{'workers':>7} {'iterações':>10} {'it/s':>10} {'speedup':>8} {'eficiência':>10}")
+    base = None
+    for workers in contagens_de_workers(max(1, args.workers)):
+        with BuscaParalela(workers, args.algoritmo) as busca:
+            busca.buscar(estado, max_iteracoes=1, seed=args.seed)
+            resultado = busca.buscar(estado, tempo_limite=args.tempo, seed=args.seed)
+
+        taxa = resultado.iteracoes_por_segundo
+        if base is None:
+            base = taxa
+        speedup = taxa / base if base else 0.0
+        print(f"{workers:>7} {resultado.iteracoes:>10} {taxa:>10.0f} "
+              f"{speedup:>7.2f}x {speedup / workers:>9.0%}")
+
+
+if __name__ == '__main__':
+    main()
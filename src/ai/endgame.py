@@ -0,0 +1,144 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from src.ai.avaliacao import ordenar_movimentos
+from src.core.zobrist import TranspositionTable
+from src.game.compact_state import CompactState
+from src.game.moves import MOVIMENTO_COMPRAR_DESCARTE
+
+EXATO = 0
+LIMITE_INFERIOR = 1
+LIMITE_SUPERIOR = 2
+
+INFINITO = 1 << 30
+COMPRAS_DESCARTE_PADRAO = 1
+MAX_COMPRAS_DESCARTE = 16
+
+_rng = random.Random(0xE2D6A3E)
+# Misturadas à chave zobrist: o mesmo estado com orçamentos diferentes tem
+# valores diferentes.
+_CHAVES_ORCAMENTO: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_rng.getrandbits(64) for _ in range(MAX_COMPRAS_DESCARTE + 1)) for _ in range(2))
+
+
+def diferenca_pontuacao(estado: CompactState) -> int:
+    jogador = estado.jogador_atual
+    return estado.calcular_pontuacao(jogador) - estado.calcular_pontuacao(3 - jogador)
+
+
+def chave_orcamento(estado: CompactState, compras: Tuple[int, int]) -> int:
+    return estado.zobrist ^ _CHAVES_ORCAMENTO[0][compras[0]] ^ _CHAVES_ORCAMENTO[1][compras[1]]
+
+
+@dataclass
+class ResultadoFinal:
+    movimento: Optional[int]
+    valor: int
+    nos: int
+    consultas: int
+    acertos: int
+    tempo: float
+    compras_descarte: int
+
+    @property
+    def taxa_acerto(self) -> float:
+        return self.acertos / self.consultas if self.consultas else 0.0
+
+
+# Descartar e recomprar do descarte pode repetir posições para sempre. Cada
+# jogador tem compras_descarte compras dos montes de descarte até o fim; sem
+# orçamento só resta o deck, que sempre diminui, e toda folha é um fim de jogo
+# real. O valor é exato para partidas com esse limite.
+class SolverFinal:
+    def __init__(self, capacidade: int = 1 << 20,
+                 compras_descarte: int = COMPRAS_DESCARTE_PADRAO):
+        if not 0 <= compras_descarte <= MAX_COMPRAS_DESCARTE:
+            raise ValueError(f"compras_descarte deve estar entre 0 e {MAX_COMPRAS_DESCARTE}")
+        self.tabela = TranspositionTable(capacidade)
+        self.compras_descarte = compras_descarte
+        self.nos = 0
+
+    def resolver(self, estado: CompactState) -> ResultadoFinal:
+        self.nos = 0
+        consultas = self.tabela.consultas
+        acertos = self.tabela.acertos
+        inicio = time.perf_counter()
+
+        compras = (self.compras_descarte, self.compras_descarte)
+        valor = self._negamax(estado, compras, -INFINITO, INFINITO)
+        entrada = self.tabela.get(chave_orcamento(estado, compras))
+        movimento = entrada[2] if entrada is not None else None
+
+        return ResultadoFinal(movimento, valor, self.nos,
+                              self.tabela.consultas - consultas,
+                              self.tabela.acertos - acertos,
+                              time.perf_counter() - inicio, self.compras_descarte)
+
+    def _movimentos(self, estado: CompactState, compras: Tuple[int, int]) -> list:
+        movimentos = estado.gerar_movimentos()
+        if not compras[estado.jogador_atual - 1]:
+            movimentos = [codigo for codigo in movimentos
+                          if codigo >> 6 != MOVIMENTO_COMPRAR_DESCARTE]
+        return ordenar_movimentos(estado, movimentos)
+
+    def _negamax(self, estado: CompactState, compras: Tuple[int, int],
+                 alfa: int, beta: int) -> int:
+        self.nos += 1
+        if estado.jogo_terminado:
+            return diferenca_pontuacao(estado)
+
+        alfa_original = alfa
+        movimento_tabela = None
+        chave = chave_orcamento(estado, compras)
+        entrada = self.tabela.get(chave)
+        if entrada is not None:
+            valor, limite, movimento_tabela = entrada
+            if limite == EXATO:
+                return valor
+            if limite == LIMITE_INFERIOR:
+                alfa = max(alfa, valor)
+            else:
+                beta = min(beta, valor)
+            if alfa >= beta:
+                return valor
+
+        movimentos = self._movimentos(estado, compras)
+        if movimento_tabela is not None and movimento_tabela in movimentos:
+            movimentos.remove(movimento_tabela)
+            movimentos.insert(0, movimento_tabela)
+
+        jogador = estado.jogador_atual
+        melhor = -INFINITO
+        melhor_movimento = None
+        for codigo in movimentos:
+            filho = estado.clone()
+            filho.aplicar(codigo)
+            compras_filho = compras
+            if codigo >> 6 == MOVIMENTO_COMPRAR_DESCARTE:
+                compras_filho = (compras[0] - 1, compras[1]) if jogador == 1 else \
+                    (compras[0], compras[1] - 1)
+            if filho.jogador_atual == jogador:
+                valor = self._negamax(filho, compras_filho, alfa, beta)
+            else:
+                valor = -self._negamax(filho, compras_filho, -beta, -alfa)
+
+            if valor > melhor:
+                melhor = valor
+                melhor_movimento = codigo
+            if melhor > alfa:
+                alfa = melhor
+            if alfa >= beta:
+                break
+
+        if melhor <= alfa_original:
+            limite = LIMITE_SUPERIOR
+        elif melhor >= beta:
+            limite = LIMITE_INFERIOR
+        else:
+            limite = EXATO
+        # Subárvores maiores têm prioridade na substituição da tabela.
+        self.tabela.put(chave, (melhor, limite, melhor_movimento),
+                        estado.cartas_deck + compras[0] + compras[1])
+        return melhor
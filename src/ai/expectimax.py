@@ -0,0 +1,234 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.core.rules import PONTUACAO_POR_MASCARA
+from src.game.compact_state import CompactState, cartas_da_mascara
+from src.game.moves import MOVIMENTO_COMPRAR_DECK
+from src.models.card_codes import CARTAS_POR_COR, NUM_CORES
+
+Avaliador = Callable[[CompactState, int], float]
+Ordenador = Callable[[CompactState, List[int]], List[int]]
+
+_COMPRAR_DECK = MOVIMENTO_COMPRAR_DECK << 6
+
+LIMITE_PONTUACAO = NUM_CORES * (max(PONTUACAO_POR_MASCARA) - min(PONTUACAO_POR_MASCARA))
+
+# Maior variação de pontuação causada por uma única carta jogada numa expedição.
+VARIACAO_POR_JOGADA = max(
+    abs(PONTUACAO_POR_MASCARA[mascara | 1 << bit] - PONTUACAO_POR_MASCARA[mascara])
+    for mascara in range(len(PONTUACAO_POR_MASCARA))
+    for bit in range(CARTAS_POR_COR)
+    if mascara >> bit == 0)
+
+
+def avaliar_pontuacao(estado: CompactState, jogador: int) -> float:
+    return estado.calcular_pontuacao(jogador) - estado.calcular_pontuacao(3 - jogador)
+
+
+def comprar_carta_especifica(estado: CompactState, carta: int) -> CompactState:
+    filho = estado.clone()
+    deck = list(filho.get_cartas_deck())
+    indice = deck.index(carta)
+    deck[indice], deck[-1] = deck[-1], deck[indice]
+    filho.deck = tuple(deck)
+    filho.aplicar(_COMPRAR_DECK)
+    return filho
+
+
+# Cartas que o observador não vê: o deck e a parte da mão do oponente que não
+# veio dos descartes.
+def cartas_nao_vistas(estado: CompactState, observador: int) -> List[int]:
+    oponente = 2 - observador
+    escondidas = estado.mascaras_mao[oponente] & ~estado.conhecidas[oponente]
+    return list(estado.get_cartas_deck()) + cartas_da_mascara(escondidas)
+
+
+# Compra uma carta não vista. Se ela estiver na mão do oponente, troca de lugar
+# com o topo do deck antes, o que mantém o estado coerente com o que o
+# observador sabe.
+def comprar_carta_nao_vista(estado: CompactState, carta: int, observador: int) -> CompactState:
+    oponente = 2 - observador
+    if not (estado.mascaras_mao[oponente] >> carta) & 1:
+        return comprar_carta_especifica(estado, carta)
+    filho = estado.clone()
+    deck = list(filho.get_cartas_deck())
+    topo = deck[-1]
+    mao = list(filho.maos[oponente])
+    mao[mao.index(carta)] = topo
+    filho.maos[oponente] = tuple(mao)
+    filho.mascaras_mao[oponente] ^= (1 << carta) | (1 << topo)
+    deck[-1] = carta
+    filho.deck = tuple(deck)
+    filho.aplicar(_COMPRAR_DECK)
+    return filho
+
+
+@dataclass
+class ResultadoExpectimax:
+    movimento: Optional[int]
+    valor: float
+    profundidade: int
+    nos: int
+    cortes: int
+    tempo: float
+
+    @property
+    def nos_por_segundo(self) -> float:
+        return self.nos / self.tempo if self.tempo > 0 else 0.0
+
+
+class Expectimax:
+    def __init__(self, avaliar: Avaliador = avaliar_pontuacao,
+                 ordenar: Optional[Ordenador] = None,
+                 limites: Optional[Tuple[float, float]] = None,
+                 poda: bool = True, seed: Optional[int] = None):
+        self.avaliar = avaliar
+        self.ordenar = ordenar
+        self.limites = limites
+        self.limite_inferior = -LIMITE_PONTUACAO
+        self.limite_superior = LIMITE_PONTUACAO
+        self.poda = poda
+        self.melhores: Optional[Dict[int, int]] = None
+        self.observador = 1
+        self.nos = 0
+        self.cortes = 0
+        self.rng = random.Random(seed)
+
+    # A busca só enxerga o que o jogador da vez sabe: a mão do oponente é
+    # sorteada de novo entre as cartas não vistas antes de começar.
+    def buscar(self, estado: CompactState, profundidade: int) -> ResultadoExpectimax:
+        return self._buscar(self.determinizar(estado), profundidade)
+
+    def determinizar(self, estado: CompactState) -> CompactState:
+        observador = estado.jogador_atual
+        oponente = 2 - observador
+        # Ordenadas antes do sorteio para não carregar a ordem real do deck.
+        nao_vistas = sorted(cartas_nao_vistas(estado, observador))
+        self.rng.shuffle(nao_vistas)
+
+        determinizado = estado.clone()
+        mao = list(estado.maos[oponente])
+        for posicao, carta in enumerate(mao):
+            if not (estado.conhecidas[oponente] >> carta) & 1:
+                mao[posicao] = nao_vistas.pop()
+        determinizado.maos[oponente] = tuple(mao)
+        determinizado.mascaras_mao[oponente] = sum(1 << carta for carta in mao)
+        determinizado.deck = tuple(nao_vistas)
+        determinizado.cartas_deck = len(nao_vistas)
+        determinizado.zobrist = determinizado.calcular_hash()
+        return determinizado
+
+    # Recebe um estado já determinizado pela visão do jogador da vez.
+    def _buscar(self, estado: CompactState, profundidade: int) -> ResultadoExpectimax:
+        self.observador = estado.jogador_atual
+        self.nos = 0
+        self.cortes = 0
+        inicio = time.perf_counter()
+        self.limite_inferior, self.limite_superior = self._limites(estado, profundidade)
+
+        melhor_movimento = None
+        alfa = self.limite_inferior
+        beta = self.limite_superior
+        for codigo in self._movimentos(estado):
+            valor = self._valor_movimento(estado, codigo, profundidade - 1, alfa, beta)
+            if melhor_movimento is None or valor > alfa:
+                melhor_movimento = codigo
+                alfa = max(alfa, valor)
+
+        return ResultadoExpectimax(melhor_movimento, alfa, profundidade, self.nos,
+                                   self.cortes, time.perf_counter() - inicio)
+
+    def _limites(self, estado: CompactState, profundidade: int) -> Tuple[float, float]:
+        if self.limites is not None:
+            return self.limites
+        if self.avaliar is not avaliar_pontuacao:
+            return -LIMITE_PONTUACAO, LIMITE_PONTUACAO
+
+        atual = avaliar_pontuacao(estado, self.observador)
+        variacao = VARIACAO_POR_JOGADA * ((profundidade + 1) // 2)
+        return atual - variacao, atual + variacao
+
+    def _movimentos(self, estado: CompactState) -> List[int]:
+        movimentos = estado.gerar_movimentos()
+        if self.ordenar is not None:
+            movimentos = self.ordenar(estado, movimentos)
+        if self.melhores:
+            melhor = self.melhores.get(estado.zobrist)
+            if melhor is not None and melhor in movimentos:
+                movimentos.remove(melhor)
+                movimentos.insert(0, melhor)
+        return movimentos
+
+    def _valor_movimento(self, estado: CompactState, codigo: int, profundidade: int,
+                         alfa: float, beta: float) -> float:
+        if codigo == _COMPRAR_DECK:
+            return self._valor_chance(estado, profundidade, alfa, beta)
+        filho = estado.clone()
+        filho.aplicar(codigo)
+        return self._valor(filho, profundidade, alfa, beta)
+
+    def _valor(self, estado: CompactState, profundidade: int, alfa: float, beta: float) -> float:
+        self.nos += 1
+        if estado.jogo_terminado or profundidade <= 0:
+            return self.avaliar(estado, self.observador)
+
+        maximizar = estado.jogador_atual == self.observador
+        melhor = self.limite_inferior if maximizar else self.limite_superior
+        melhor_movimento = None
+        for codigo in self._movimentos(estado):
+            valor = self._valor_movimento(estado, codigo, profundidade - 1, alfa, beta)
+            if maximizar:
+                if valor > melhor:
+                    melhor = valor
+                    melhor_movimento = codigo
+                if self.poda and melhor > alfa:
+                    alfa = melhor
+            else:
+                if valor < melhor:
+                    melhor = valor
+                    melhor_movimento = codigo
+                if self.poda and melhor < beta:
+                    beta = melhor
+            if self.poda and alfa >= beta:
+                self.cortes += 1
+                break
+
+        if self.melhores is not None and melhor_movimento is not None:
+            self.melhores[estado.zobrist] = melhor_movimento
+        return melhor
+
+    def _valor_chance(self, estado: CompactState, profundidade: int,
+                      alfa: float, beta: float) -> float:
+        self.nos += 1
+        if profundidade <= 0:
+            return self.avaliar(estado, self.observador)
+
+        cartas = cartas_nao_vistas(estado, self.observador)
+        quantidade = len(cartas)
+        inferior = self.limite_inferior
+        superior = self.limite_superior
+        soma = 0.0
+
+        for indice, carta in enumerate(cartas):
+            filho = comprar_carta_nao_vista(estado, carta, self.observador)
+            if not self.poda:
+                soma += self._valor(filho, profundidade, inferior, superior)
+                continue
+
+            restantes = quantidade - indice - 1
+            minimo = quantidade * alfa - soma - superior * restantes
+            maximo = quantidade * beta - soma - inferior * restantes
+            valor = self._valor(filho, profundidade,
+                                max(minimo, inferior), min(maximo, superior))
+            if valor <= minimo:
+                self.cortes += 1
+                return alfa
+            if valor >= maximo:
+                self.cortes += 1
+                return beta
+            soma += valor
+
+        return soma / quantidade
+
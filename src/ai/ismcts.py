@@ -0,0 +1,132 @@
+import math
+from typing import Dict, List, Optional
+
+from src.ai.mcts import MCTS, retropropagar
+from src.game.compact_state import CompactState, cartas_da_mascara, mascara_das_cartas
+from src.models.card_codes import TOTAL_CARTAS
+
+_TODAS_AS_CARTAS = (1 << TOTAL_CARTAS) - 1
+
+
+def chave_movimento(estado: CompactState, codigo: int) -> int:
+    if codigo >> 6 >= 2:
+        return codigo
+    mao = estado.maos[estado.jogador_atual - 1]
+    return (codigo & 0xC0) | mao[(codigo >> 3) & 7]
+
+
+class NoISMCTS:
+    __slots__ = ('chave', 'jogador', 'pai', 'filhos',
+                 'visitas', 'vitorias', 'disponibilidade')
+
+    def __init__(self, chave: Optional[int], jogador: int, pai: Optional["NoISMCTS"]):
+        self.chave = chave
+        self.jogador = jogador
+        self.pai = pai
+        self.filhos: Dict[int, "NoISMCTS"] = {}
+        self.visitas = 0
+        self.vitorias = 0.0
+        self.disponibilidade = 1
+
+
+class ISMCTS(MCTS):
+    def _definir_raiz(self, estado: CompactState, raiz: Optional[NoISMCTS]) -> None:
+        self.estado = estado
+        self.raiz = NoISMCTS(None, 0, None)
+        self.iteracoes = 0
+        self.tempo = 0.0
+
+        self.observador = estado.jogador_atual
+        oponente = 2 - self.observador
+        self._indice_oponente = oponente
+        self._conhecidas_oponente = tuple(
+            cartas_da_mascara(estado.conhecidas[oponente]))
+        self._tamanho_mao_oponente = len(estado.maos[oponente])
+        self._nao_vistas = self.cartas_nao_vistas(estado)
+
+    def cartas_nao_vistas(self, estado: CompactState) -> List[int]:
+        observador = self.observador - 1
+        vistas = (estado.mascaras_mao[observador] | estado.expedicoes[0] |
+                  estado.expedicoes[1] | estado.conhecidas[1 - observador])
+        for monte in estado.descartes:
+            vistas |= mascara_das_cartas(monte)
+        return cartas_da_mascara(_TODAS_AS_CARTAS & ~vistas)
+
+    def determinizar(self) -> CompactState:
+        estado = self.estado.clone()
+        nao_vistas = self._nao_vistas
+        self._rng.shuffle(nao_vistas)
+
+        sorteadas = self._tamanho_mao_oponente - len(self._conhecidas_oponente)
+        mao = self._conhecidas_oponente + tuple(nao_vistas[:sorteadas])
+        estado.maos[self._indice_oponente] = mao
+        estado.mascaras_mao[self._indice_oponente] = mascara_das_cartas(mao)
+        estado.deck = tuple(nao_vistas[sorteadas:])
+        estado.cartas_deck = len(estado.deck)
+        return estado
+
+    def iterar(self) -> None:
+        estado = self.determinizar()
+        no = self.raiz
+        movimentos = self._movimentos
+
+        while not estado.jogo_terminado:
+            movimentos.clear()
+            estado.gerar_movimentos(movimentos)
+            filhos = no.filhos
+            novos = []
+            legais = []
+            for codigo in movimentos:
+                chave = chave_movimento(estado, codigo)
+                filho = filhos.get(chave)
+                if filho is None:
+                    novos.append(codigo)
+                else:
+                    legais.append((filho, codigo))
+
+            if novos:
+                for filho, _ in legais:
+                    filho.disponibilidade += 1
+                codigo = novos[self._rng.randrange(len(novos))]
+                chave = chave_movimento(estado, codigo)
+                filho = NoISMCTS(chave, estado.jogador_atual, no)
+                filhos[chave] = filho
+                estado.aplicar(codigo)
+                no = filho
+                break
+
+            melhor = None
+            melhor_codigo = None
+            melhor_valor = -1.0
+            for filho, codigo in legais:
+                filho.disponibilidade += 1
+                valor = (filho.vitorias / filho.visitas + self.exploracao *
+                         math.sqrt(math.log(filho.disponibilidade) / filho.visitas))
+                if valor > melhor_valor:
+                    melhor = filho
+                    melhor_codigo = codigo
+                    melhor_valor = valor
+            estado.aplicar(melhor_codigo)
+            no = melhor
+
+        retropropagar(no, self._simular(estado))
+
+    def _codigos_raiz(self) -> Dict[int, int]:
+        return {chave_movimento(self.estado, codigo): codigo
+                for codigo in self.estado.gerar_movimentos()}
+
+    def visitas_raiz(self) -> Dict[int, int]:
+        codigos = self._codigos_raiz()
+        return {codigos[chave]: filho.visitas
+                for chave, filho in self.raiz.filhos.items() if chave in codigos}
+
+    def melhor_movimento(self) -> Optional[int]:
+        visitas = self.visitas_raiz()
+        if visitas:
+            return max(visitas, key=visitas.get)
+        movimentos = self.estado.gerar_movimentos()
+        return movimentos[0] if movimentos else None
+
+    def avancar(self, movimento: int) -> None:
+        self.estado.aplicar(movimento)
+        self._definir_raiz(self.estado, None)
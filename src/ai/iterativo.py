@@ -0,0 +1,103 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from config.settings import AIConfig
+from src.ai.avaliacao import avaliar_compacto, ordenar_movimentos
+from src.ai.expectimax import Avaliador, Expectimax, Ordenador, ResultadoExpectimax
+from src.game.compact_state import CompactState
+
+Cancelamento = Callable[[], bool]
+
+INTERVALO_VERIFICACAO = 256
+
+
+class BuscaInterrompida(Exception):
+    pass
+
+
+@dataclass
+class ResultadoIterativo:
+    movimento: Optional[int]
+    valor: float
+    profundidade: int
+    nos: int
+    tempo: float
+    interrompida: bool
+    iteracoes: List[ResultadoExpectimax] = field(default_factory=list)
+
+    @property
+    def nos_por_segundo(self) -> float:
+        return self.nos / self.tempo if self.tempo > 0 else 0.0
+
+
+class BuscaIterativa(Expectimax):
+    def __init__(self, avaliar: Avaliador = avaliar_compacto,
+                 ordenar: Optional[Ordenador] = ordenar_movimentos,
+                 poda: bool = True, capacidade_pv: int = 1 << 16,
+                 seed: Optional[int] = None):
+        super().__init__(avaliar, ordenar, poda=poda, seed=seed)
+        self.melhores = {}
+        self.capacidade_pv = capacidade_pv
+        self._prazo: Optional[float] = None
+        self._cancelar: Optional[Cancelamento] = None
+
+    def aprofundar(self, estado: CompactState, tempo_limite: Optional[float] = None,
+                   profundidade_maxima: Optional[int] = None,
+                   cancelar: Optional[Cancelamento] = None) -> ResultadoIterativo:
+        if tempo_limite is None and not profundidade_maxima:
+            tempo_limite = AIConfig.TIME_BUDGET
+        inicio = time.perf_counter()
+        self._prazo = inicio + tempo_limite if tempo_limite is not None else None
+        self._cancelar = cancelar
+        if len(self.melhores) > self.capacidade_pv:
+            self.melhores.clear()
+        # Todas as profundidades usam a mesma determinização.
+        estado = self.determinizar(estado)
+
+        movimentos = self._movimentos(estado)
+        movimento = movimentos[0] if movimentos else None
+        valor = self.avaliar(estado, estado.jogador_atual)
+        iteracoes: List[ResultadoExpectimax] = []
+        nos = 0
+        interrompida = False
+
+        profundidade = 1
+        while len(movimentos) > 1 and (not profundidade_maxima or profundidade <= profundidade_maxima):
+            try:
+                resultado = self._buscar(estado, profundidade)
+            except BuscaInterrompida:
+                nos += self.nos
+                interrompida = True
+                break
+
+            nos += resultado.nos
+            iteracoes.append(resultado)
+            movimento = resultado.movimento
+            valor = resultado.valor
+            self.melhores[estado.zobrist] = movimento
+            if self._deve_parar():
+                interrompida = True
+                break
+            profundidade += 1
+
+        self._prazo = None
+        self._cancelar = None
+        return ResultadoIterativo(movimento, valor, len(iteracoes), nos,
+                                  time.perf_counter() - inicio, interrompida, iteracoes)
+
+    def _deve_parar(self) -> bool:
+        if self._prazo is not None and time.perf_counter() >= self._prazo:
+            return True
+        return self._cancelar is not None and self._cancelar()
+
+    def _valor(self, estado: CompactState, profundidade: int, alfa: float, beta: float) -> float:
+        if self.nos % INTERVALO_VERIFICACAO == 0 and self._deve_parar():
+            raise BuscaInterrompida()
+        return super()._valor(estado, profundidade, alfa, beta)
+
+
+def escolher_movimento_iterativo(estado: CompactState, tempo_limite: Optional[float] = None,
+                                 profundidade_maxima: Optional[int] = None,
+                                 cancelar: Optional[Cancelamento] = None) -> ResultadoIterativo:
+    return BuscaIterativa().aprofundar(estado, tempo_limite, profundidade_maxima, cancelar)
@@ -0,0 +1,171 @@
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from config.settings import AIConfig
+from src.ai.avaliacao import avaliar_compacto
+from src.ai.playout import simular
+from src.game.compact_state import CompactState
+
+
+class NoMCTS:
+    __slots__ = ('movimento', 'jogador', 'pai', 'filhos',
+                 'nao_expandidos', 'visitas', 'vitorias')
+
+    def __init__(self, movimento: Optional[int], jogador: int,
+                 pai: Optional["NoMCTS"], nao_expandidos: List[int]):
+        self.movimento = movimento
+        self.jogador = jogador
+        self.pai = pai
+        self.filhos: List["NoMCTS"] = []
+        self.nao_expandidos = nao_expandidos
+        self.visitas = 0
+        self.vitorias = 0.0
+
+    def selecionar_filho(self, exploracao: float) -> "NoMCTS":
+        log_visitas = math.log(self.visitas)
+        melhor = None
+        melhor_valor = -1.0
+        for filho in self.filhos:
+            valor = (filho.vitorias / filho.visitas +
+                     exploracao * math.sqrt(log_visitas / filho.visitas))
+            if valor > melhor_valor:
+                melhor = filho
+                melhor_valor = valor
+        return melhor
+
+
+@dataclass
+class ResultadoBusca:
+    movimento: int
+    iteracoes: int
+    tempo: float
+    visitas: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def iteracoes_por_segundo(self) -> float:
+        return self.iteracoes / self.tempo if self.tempo > 0 else 0.0
+
+
+def valor_resultado(vencedor: Optional[int], jogador: int) -> float:
+    if vencedor == jogador:
+        return 1.0
+    if vencedor == 0:
+        return 0.5
+    return 0.0
+
+
+def valor_avaliacao(estado: CompactState, jogador: int) -> float:
+    diferenca = avaliar_compacto(estado, jogador)
+    return 1.0 / (1.0 + math.exp(-diferenca / AIConfig.EVALUATION_SCALE))
+
+
+def retropropagar(no, valor_jogador1: float) -> None:
+    while no is not None:
+        no.visitas += 1
+        no.vitorias += valor_jogador1 if no.jogador == 1 else 1.0 - valor_jogador1
+        no = no.pai
+
+
+class MCTS:
+    def __init__(self, estado: CompactState, exploracao: float = AIConfig.EXPLORATION,
+                 seed: Optional[int] = AIConfig.SEED,
+                 profundidade_rollout: int = AIConfig.ROLLOUT_DEPTH):
+        self.exploracao = exploracao
+        self.profundidade_rollout = profundidade_rollout
+        self._rng = random.Random(seed)
+        self._movimentos: List[int] = []
+        self._definir_raiz(estado.clone(), None)
+
+    def _definir_raiz(self, estado: CompactState, raiz: Optional[NoMCTS]) -> None:
+        self.estado = estado
+        if raiz is None:
+            raiz = NoMCTS(None, 0, None, estado.gerar_movimentos())
+        raiz.pai = None
+        self.raiz = raiz
+        self.iteracoes = 0
+        self.tempo = 0.0
+
+    def iterar(self) -> None:
+        estado = self.estado.clone()
+        no = self.raiz
+
+        while not no.nao_expandidos and no.filhos:
+            no = no.selecionar_filho(self.exploracao)
+            estado.aplicar(no.movimento)
+
+        if no.nao_expandidos:
+            pendentes = no.nao_expandidos
+            indice = self._rng.randrange(len(pendentes))
+            pendentes[indice], pendentes[-1] = pendentes[-1], pendentes[indice]
+            movimento = pendentes.pop()
+            jogador = estado.jogador_atual
+            estado.aplicar(movimento)
+            filho = NoMCTS(movimento, jogador, no, estado.gerar_movimentos())
+            no.filhos.append(filho)
+            no = filho
+
+        retropropagar(no, self._simular(estado))
+
+    def _simular(self, estado: CompactState) -> float:
+        if simular(estado, self._rng.random, self.profundidade_rollout or -1):
+            return valor_resultado(estado.vencedor, 1)
+        return valor_avaliacao(estado, 1)
+
+    def buscar(self, tempo_limite: Optional[float] = None,
+               max_iteracoes: Optional[int] = None) -> int:
+        if tempo_limite is None and not max_iteracoes:
+            tempo_limite = AIConfig.TIME_BUDGET
+        if self.estado.jogo_terminado:
+            return 0
+
+        inicio = time.perf_counter()
+        prazo = inicio + tempo_limite if tempo_limite is not None else None
+        realizadas = 0
+        while True:
+            self.iterar()
+            realizadas += 1
+            if max_iteracoes and realizadas >= max_iteracoes:
+                break
+            if prazo is not None and time.perf_counter() >= prazo:
+                break
+
+        self.iteracoes += realizadas
+        self.tempo += time.perf_counter() - inicio
+        return realizadas
+
+    def iteracoes_por_segundo(self) -> float:
+        return self.iteracoes / self.tempo if self.tempo > 0 else 0.0
+
+    def visitas_raiz(self) -> Dict[int, int]:
+        return {filho.movimento: filho.visitas for filho in self.raiz.filhos}
+
+    def melhor_movimento(self) -> Optional[int]:
+        if self.raiz.filhos:
+            return max(self.raiz.filhos, key=lambda filho: filho.visitas).movimento
+        if self.raiz.nao_expandidos:
+            return self.raiz.nao_expandidos[0]
+        return None
+
+    def resultado(self) -> ResultadoBusca:
+        return ResultadoBusca(self.melhor_movimento(), self.iteracoes,
+                              self.tempo, self.visitas_raiz())
+
+    def avancar(self, movimento: int) -> None:
+        self.estado.aplicar(movimento)
+        proxima = None
+        for filho in self.raiz.filhos:
+            if filho.movimento == movimento:
+                proxima = filho
+                break
+        self._definir_raiz(self.estado, proxima)
+
+
+def escolher_movimento(estado: CompactState, tempo_limite: Optional[float] = None,
+                       max_iteracoes: Optional[int] = None,
+                       seed: Optional[int] = AIConfig.SEED) -> ResultadoBusca:
+    busca = MCTS(estado, seed=seed)
+    busca.buscar(tempo_limite, max_iteracoes)
+    return busca.resultado()
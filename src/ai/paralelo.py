@@ -0,0 +1,84 @@
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Optional, Tuple, Type
+
+from config.settings import AIConfig
+from src.ai.ismcts import ISMCTS
+from src.ai.mcts import MCTS, ResultadoBusca
+from src.game.compact_state import CompactState
+
+ALGORITMOS: Dict[str, Type[MCTS]] = {
+    'mcts': MCTS,
+    'ismcts': ISMCTS,
+}
+
+
+def _buscar_raiz(algoritmo: Type[MCTS], estado: CompactState, tempo_limite: Optional[float],
+                 max_iteracoes: Optional[int], seed: Optional[int]) -> Tuple[Dict[int, int], int]:
+    busca = algoritmo(estado, seed=seed)
+    busca.buscar(tempo_limite, max_iteracoes)
+    return busca.visitas_raiz(), busca.iteracoes
+
+
+def combinar_visitas(parciais) -> Dict[int, int]:
+    visitas: Dict[int, int] = {}
+    for parcial in parciais:
+        for movimento, quantidade in parcial.items():
+            visitas[movimento] = visitas.get(movimento, 0) + quantidade
+    return visitas
+
+
+class BuscaParalela:
+    def __init__(self, workers: int = AIConfig.WORKERS, algoritmo: str = AIConfig.ALGORITHM,
+                 executor: Optional[Executor] = None):
+        self.workers = max(1, workers)
+        self.algoritmo = ALGORITMOS[algoritmo]
+        self._executor = executor
+        self._executor_proprio = False
+
+    def __enter__(self) -> "BuscaParalela":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.fechar()
+
+    def _obter_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._executor_proprio = True
+        return self._executor
+
+    def fechar(self) -> None:
+        if self._executor_proprio:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_proprio = False
+
+    def buscar(self, estado: CompactState, tempo_limite: Optional[float] = None,
+               max_iteracoes: Optional[int] = None,
+               seed: Optional[int] = AIConfig.SEED) -> ResultadoBusca:
+        inicio = time.perf_counter()
+        if self.workers == 1:
+            parciais = [_buscar_raiz(self.algoritmo, estado, tempo_limite, max_iteracoes, seed)]
+        else:
+            executor = self._obter_executor()
+            futuros = [
+                executor.submit(_buscar_raiz, self.algoritmo, estado, tempo_limite,
+                                max_iteracoes, None if seed is None else seed + indice)
+                for indice in range(self.workers)
+            ]
+            parciais = [futuro.result() for futuro in futuros]
+
+        visitas = combinar_visitas(parcial for parcial, _ in parciais)
+        iteracoes = sum(quantidade for _, quantidade in parciais)
+        movimento = max(visitas, key=visitas.get) if visitas else None
+        return ResultadoBusca(movimento, iteracoes, time.perf_counter() - inicio, visitas)
+
+
+def escolher_movimento_paralelo(estado: CompactState, tempo_limite: Optional[float] = None,
+                                max_iteracoes: Optional[int] = None,
+                                workers: int = AIConfig.WORKERS,
+                                algoritmo: str = AIConfig.ALGORITHM,
+                                seed: Optional[int] = AIConfig.SEED) -> ResultadoBusca:
+    with BuscaParalela(workers, algoritmo) as busca:
+        return busca.buscar(estado, tempo_limite, max_iteracoes, seed)
@@ -0,0 +1,237 @@
+import random
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from src.core.rules import MASCARA_BLOQUEIO, PONTUACAO_POR_MASCARA
+from src.game.compact_state import FASE_COMPRAR, FASE_JOGAR, CompactState
+from src.game.moves import MOVIMENTO_COMPRAR_DECK, MOVIMENTO_COMPRAR_DESCARTE, MOVIMENTO_DESCARTAR
+from src.models.card_codes import CARTAS_POR_COR, INDICE_COR_CARTA, MASCARA_COR, NUM_CORES
+
+POLITICA_ALEATORIA = 'aleatoria'
+POLITICA_LEVE = 'leve'
+POLITICAS = (POLITICA_ALEATORIA, POLITICA_LEVE)
+
+_DESCARTAR = MOVIMENTO_DESCARTAR << 6
+_COMPRAR_DECK = MOVIMENTO_COMPRAR_DECK << 6
+_COMPRAR_DESCARTE = MOVIMENTO_COMPRAR_DESCARTE << 6
+_OPCOES_COMPRA = NUM_CORES + 1
+
+_BLOQUEIO = np.array(MASCARA_BLOQUEIO, dtype=np.uint64)
+_PONTUACAO = np.array(PONTUACAO_POR_MASCARA, dtype=np.int32)
+_DESLOCAMENTOS = np.arange(NUM_CORES, dtype=np.uint64) * np.uint64(CARTAS_POR_COR)
+_UM = np.uint64(1)
+
+
+# O playout trabalha em listas locais e só devolve o resultado ao estado
+# no final; o zobrist do estado não é atualizado.
+def simular(estado: CompactState, aleatorio: Callable[[], float] = random.random,
+            limite: int = -1, politica: str = POLITICA_ALEATORIA,
+            registro: Optional[List[int]] = None) -> bool:
+    if estado.jogo_terminado:
+        return True
+
+    maos = [list(estado.maos[0]), list(estado.maos[1])]
+    expedicoes = estado.expedicoes[:]
+    conhecidas = estado.conhecidas[:]
+    descartes = [list(monte) for monte in estado.descartes]
+    deck = list(estado.deck[:estado.cartas_deck])
+    indice_jogador = estado.jogador_atual - 1
+    fase = estado.fase
+    bloqueio = MASCARA_BLOQUEIO
+    cor_carta = INDICE_COR_CARTA
+    leve = politica == POLITICA_LEVE
+
+    while limite:
+        limite -= 1
+        mao = maos[indice_jogador]
+        if fase == FASE_JOGAR:
+            expedicao = expedicoes[indice_jogador]
+            opcoes = len(mao) << 1
+            while True:
+                sorteio = int(aleatorio() * opcoes)
+                indice = sorteio >> 1
+                carta = mao[indice]
+                jogavel = not expedicao & bloqueio[carta]
+                if leve:
+                    descartar = not jogavel
+                    break
+                descartar = sorteio & 1
+                if descartar or jogavel:
+                    break
+
+            del mao[indice]
+            conhecidas[indice_jogador] &= ~(1 << carta)
+            if descartar:
+                descartes[cor_carta[carta]].append(carta)
+            else:
+                expedicoes[indice_jogador] = expedicao | 1 << carta
+            if registro is not None:
+                registro.append((_DESCARTAR if descartar else 0) | indice << 3 | cor_carta[carta])
+            fase = FASE_COMPRAR
+            continue
+
+        if leve:
+            escolha = 0
+        else:
+            while True:
+                escolha = int(aleatorio() * _OPCOES_COMPRA)
+                if not escolha or descartes[escolha - 1]:
+                    break
+
+        if escolha:
+            carta = descartes[escolha - 1].pop()
+            mao.append(carta)
+            conhecidas[indice_jogador] |= 1 << carta
+        else:
+            mao.append(deck.pop())
+        if registro is not None:
+            registro.append(_COMPRAR_DESCARTE | (escolha - 1) if escolha else _COMPRAR_DECK)
+        fase = FASE_JOGAR
+        indice_jogador ^= 1
+        if not deck:
+            break
+
+    estado.maos = [tuple(maos[0]), tuple(maos[1])]
+    estado.mascaras_mao = [_mascara(maos[0]), _mascara(maos[1])]
+    estado.conhecidas = conhecidas
+    estado.expedicoes = expedicoes
+    estado.descartes = [tuple(monte) for monte in descartes]
+    estado.cartas_deck = len(deck)
+    estado.deck = tuple(deck)
+    estado.jogador_atual = indice_jogador + 1
+    estado.fase = fase
+
+    if deck:
+        return False
+    estado._encerrar()
+    return True
+
+
+def _mascara(cartas: List[int]) -> int:
+    mascara = 0
+    for carta in cartas:
+        mascara |= 1 << carta
+    return mascara
+
+
+def _sortear(opcoes: np.ndarray, gerador: np.random.Generator) -> np.ndarray:
+    acumulado = np.cumsum(opcoes, axis=1)
+    alvo = (gerador.random(len(opcoes)) * acumulado[:, -1]).astype(np.int64)
+    return (acumulado <= alvo[:, None]).sum(axis=1)
+
+
+def pontuar_lote(expedicoes: np.ndarray) -> np.ndarray:
+    por_cor = (expedicoes[..., None] >> _DESLOCAMENTOS) & np.uint64(MASCARA_COR)
+    return _PONTUACAO[por_cor.astype(np.intp)].sum(axis=-1)
+
+
+def simular_lote(estado: CompactState, quantidade: int, seed: Optional[int] = None,
+                 politica: str = POLITICA_ALEATORIA, embaralhar: bool = True) -> np.ndarray:
+    gerador = np.random.default_rng(seed)
+    pontuacoes = np.tile(np.array([estado.calcular_pontuacao(1), estado.calcular_pontuacao(2)],
+                                  dtype=np.int32), (quantidade, 1))
+    if estado.jogo_terminado:
+        return pontuacoes
+
+    tamanho_deck = estado.cartas_deck
+    decks = np.tile(np.array(estado.get_cartas_deck()[::-1], dtype=np.int8), (quantidade, 1))
+    if embaralhar:
+        decks = np.take_along_axis(
+            decks, gerador.random((quantidade, tamanho_deck)).argsort(axis=1), axis=1)
+
+    tamanho_mao = max(len(estado.maos[0]), len(estado.maos[1]))
+    maos = np.full((quantidade, 2, tamanho_mao), -1, dtype=np.int8)
+    for indice in (0, 1):
+        mao = estado.maos[indice]
+        maos[:, indice, :len(mao)] = mao
+    expedicoes = np.tile(np.array(estado.expedicoes, dtype=np.uint64), (quantidade, 1))
+
+    descartes = np.zeros((quantidade, NUM_CORES, CARTAS_POR_COR), dtype=np.int8)
+    alturas = np.zeros((quantidade, NUM_CORES), dtype=np.int8)
+    for indice_cor, monte in enumerate(estado.descartes):
+        descartes[:, indice_cor, :len(monte)] = monte
+        alturas[:, indice_cor] = len(monte)
+
+    return simular_arrays(decks, maos, expedicoes, descartes, alturas, pontuacoes,
+                          estado.jogador_atual - 1, estado.fase, gerador, politica)
+
+
+# Cada linha é uma partida independente: decks guarda as cartas na ordem de
+# compra e as pontuações das partidas que terminam são escritas em pontuacoes.
+def simular_arrays(decks: np.ndarray, maos: np.ndarray, expedicoes: np.ndarray,
+                   descartes: np.ndarray, alturas: np.ndarray, pontuacoes: np.ndarray,
+                   indice_jogador: int, fase: int, gerador: np.random.Generator,
+                   politica: str = POLITICA_ALEATORIA) -> np.ndarray:
+    quantidade, tamanho_deck = decks.shape
+    tamanho_mao = maos.shape[2]
+    comprados = np.zeros(quantidade, dtype=np.int16)
+    leve = politica == POLITICA_LEVE
+    # Partidas terminadas saem dos arrays; ids guarda a linha original de cada uma.
+    ids = np.arange(quantidade)
+
+    while len(ids):
+        linhas = np.arange(len(ids))
+        if fase == FASE_JOGAR:
+            # Na fase de jogar a mão do jogador da vez está sempre completa.
+            mao = maos[:, indice_jogador]
+            jogaveis = (_BLOQUEIO[mao] & expedicoes[:, indice_jogador, None]) == 0
+            if leve:
+                posicao = gerador.integers(tamanho_mao, size=len(ids))
+                descartar = ~jogaveis[linhas, posicao]
+            else:
+                escolha = _sortear(np.hstack((jogaveis, np.ones_like(jogaveis))), gerador)
+                descartar = escolha >= tamanho_mao
+                posicao = escolha % tamanho_mao
+
+            cartas = mao[linhas, posicao]
+            mao[linhas, posicao] = -1
+
+            jogar = ~descartar
+            expedicoes[jogar, indice_jogador] |= _UM << cartas[jogar].astype(np.uint64)
+
+            descarte = linhas[descartar]
+            cartas_descartadas = cartas[descartar]
+            cores = cartas_descartadas // CARTAS_POR_COR
+            descartes[descarte, cores, alturas[descarte, cores]] = cartas_descartadas
+            alturas[descarte, cores] += 1
+            fase = FASE_COMPRAR
+            continue
+
+        if leve:
+            cartas = decks[linhas, comprados]
+            comprados += 1
+        else:
+            opcoes = np.ones((len(ids), _OPCOES_COMPRA), dtype=bool)
+            opcoes[:, 1:] = alturas > 0
+            escolha = _sortear(opcoes, gerador)
+
+            cartas = np.empty(len(ids), dtype=np.int8)
+            do_deck = escolha == 0
+            cartas[do_deck] = decks[do_deck, comprados[do_deck]]
+            comprados[do_deck] += 1
+
+            do_descarte = ~do_deck
+            linhas_descarte = linhas[do_descarte]
+            cores = escolha[do_descarte] - 1
+            alturas[linhas_descarte, cores] -= 1
+            cartas[do_descarte] = descartes[linhas_descarte, cores, alturas[linhas_descarte, cores]]
+
+        mao = maos[:, indice_jogador]
+        mao[linhas, (mao < 0).argmax(axis=1)] = cartas
+
+        fase = FASE_JOGAR
+        indice_jogador ^= 1
+        terminadas = comprados >= tamanho_deck
+        if terminadas.any():
+            pontuacoes[ids[terminadas]] = pontuar_lote(expedicoes[terminadas])
+            continuam = ~terminadas
+            ids = ids[continuam]
+            decks = decks[continuam]
+            comprados = comprados[continuam]
+            maos = maos[continuam]
+            expedicoes = expedicoes[continuam]
+            descartes = descartes[continuam]
+            alturas = alturas[continuam]
+
+    return pontuacoes
@@ -0,0 +1,71 @@
+import random
+from typing import Callable, Dict, List, Optional
+
+from src.ai.avaliacao import avaliar_compacto, ordenar_movimentos
+from src.ai.expectimax import Expectimax
+from src.ai.ismcts import ISMCTS
+from src.ai.iterativo import BuscaIterativa
+from src.ai.mcts import MCTS
+from src.ai.playout import POLITICA_ALEATORIA, POLITICA_LEVE, simular
+from src.game.compact_state import CompactState
+
+Politica = Callable[[CompactState], int]
+Fabrica = Callable[[Optional[int], random.Random], Politica]
+
+
+def _politica_playout(politica: str, rng: random.Random) -> Politica:
+    registro: List[int] = []
+
+    def escolher(estado: CompactState) -> int:
+        registro.clear()
+        simular(estado.clone(), rng.random, 1, politica, registro)
+        return registro[0]
+    return escolher
+
+
+def _politica_busca(algoritmo, parametro: Optional[int], rng: random.Random) -> Politica:
+    iteracoes = parametro or 1000
+
+    def escolher(estado: CompactState) -> int:
+        busca = algoritmo(estado, seed=rng.randrange(1 << 30))
+        busca.buscar(max_iteracoes=iteracoes)
+        return busca.melhor_movimento()
+    return escolher
+
+
+def _politica_expectimax(parametro: Optional[int], _rng: random.Random) -> Politica:
+    busca = Expectimax(avaliar_compacto, ordenar_movimentos)
+    profundidade = parametro or 2
+    return lambda estado: busca.buscar(estado, profundidade).movimento
+
+
+def _politica_iterativa(parametro: Optional[int], _rng: random.Random) -> Politica:
+    busca = BuscaIterativa()
+    profundidade = parametro or 3
+    return lambda estado: busca.aprofundar(estado, profundidade_maxima=profundidade).movimento
+
+
+# O parâmetro opcional ("nome:parametro") é o número de iterações para as
+# buscas Monte Carlo e a profundidade para as buscas em árvore.
+POLITICAS: Dict[str, Fabrica] = {
+    'aleatoria': lambda _parametro, rng: _politica_playout(POLITICA_ALEATORIA, rng),
+    'leve': lambda _parametro, rng: _politica_playout(POLITICA_LEVE, rng),
+    'mcts': lambda parametro, rng: _politica_busca(MCTS, parametro, rng),
+    'ismcts': lambda parametro, rng: _politica_busca(ISMCTS, parametro, rng),
+    'expectimax': _politica_expectimax,
+    'iterativo': _politica_iterativa,
+}
+
+
+def validar_especificacao(especificacao: str) -> str:
+    nome, _, parametro = especificacao.partition(':')
+    if nome not in POLITICAS:
+        raise ValueError(f"Política desconhecida: {nome}")
+    if parametro and not parametro.isdigit():
+        raise ValueError(f"Parâmetro inválido para {nome}: {parametro}")
+    return especificacao
+
+
+def criar_politica(especificacao: str, seed: Optional[int] = None) -> Politica:
+    nome, _, parametro = validar_especificacao(especificacao).partition(':')
+    return POLITICAS[nome](int(parametro) if parametro else None, random.Random(seed))
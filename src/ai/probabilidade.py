@@ -0,0 +1,459 @@
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from math import comb
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.ai.avaliacao import ordenar_movimentos
+from src.ai.endgame import (
+    COMPRAS_DESCARTE_PADRAO,
+    EXATO,
+    LIMITE_INFERIOR,
+    LIMITE_SUPERIOR,
+    diferenca_pontuacao,
+)
+from src.ai.expectimax import LIMITE_PONTUACAO, cartas_nao_vistas, comprar_carta_especifica
+from src.core.rules import BLOQUEADAS_POR_MASCARA, MASCARA_BLOQUEIO, PONTUACAO_POR_MASCARA
+from src.game.compact_state import FASE_JOGAR, CompactState, mascara_das_cartas
+from src.game.moves import MOVIMENTO_COMPRAR_DECK, MOVIMENTO_COMPRAR_DESCARTE
+from src.models.card_codes import (
+    CARTAS_POR_COR,
+    INDICE_COR_CARTA,
+    MASCARA_COR,
+    NUM_CORES,
+    NUM_INVESTIMENTOS,
+)
+
+# (probabilidade de vitória - 0.5, diferença esperada) do ponto de vista do
+# jogador da vez. Trocar o ponto de vista é inverter o sinal, e a ordem
+# lexicográfica das tuplas se mantém em médias, o que permite podar com
+# alfa-beta nos nós de decisão e Star1 nos de sorteio sem perder exatidão.
+Valor = Tuple[float, float]
+
+VITORIA: Valor = (0.5, float(LIMITE_PONTUACAO))
+DERROTA: Valor = (-0.5, -float(LIMITE_PONTUACAO))
+
+_MASCARA_INVESTIMENTOS = (1 << NUM_INVESTIMENTOS) - 1
+
+
+def _oposto(valor: Valor) -> Valor:
+    return -valor[0], -valor[1]
+
+
+def _valor_diferenca(diferenca: int) -> Valor:
+    if diferenca > 0:
+        return 0.5, float(diferenca)
+    if diferenca < 0:
+        return -0.5, float(diferenca)
+    return 0.0, 0.0
+
+
+# Com uma carta no deck e sem compras nos descartes, a vez acaba com a última
+# compra: basta a jogada que mais soma pontos, ou um descarte.
+def _valor_ultima_vez(estado: CompactState) -> Valor:
+    diferenca = diferenca_pontuacao(estado)
+    if estado.fase == FASE_JOGAR:
+        indice = estado.jogador_atual - 1
+        expedicao = estado.expedicoes[indice]
+        ganho = 0
+        for carta in estado.maos[indice]:
+            if expedicao & MASCARA_BLOQUEIO[carta]:
+                continue
+            deslocamento = INDICE_COR_CARTA[carta] * CARTAS_POR_COR
+            cor = (expedicao >> deslocamento) & MASCARA_COR
+            ganho = max(ganho, PONTUACAO_POR_MASCARA[cor | 1 << (carta - deslocamento)] -
+                        PONTUACAO_POR_MASCARA[cor])
+        diferenca += ganho
+    return _valor_diferenca(diferenca)
+
+
+# Cartas fora das expedições que nenhum dos dois jogadores pode mais jogar.
+def mascara_mortas(expedicao1: int, expedicao2: int) -> int:
+    mortas = 0
+    for indice_cor in range(NUM_CORES):
+        deslocamento = indice_cor * CARTAS_POR_COR
+        mortas |= (BLOQUEADAS_POR_MASCARA[(expedicao1 >> deslocamento) & MASCARA_COR] &
+                   BLOQUEADAS_POR_MASCARA[(expedicao2 >> deslocamento) & MASCARA_COR]) << deslocamento
+    return mortas & ~(expedicao1 | expedicao2)
+
+
+# Cartas da mesma classe são intercambiáveis: as mortas de uma cor só servem
+# para descartar, e os investimentos de uma cor são idênticos. A classe é
+# representada pela menor carta dela.
+def classe_carta(carta: int, mortas: int) -> int:
+    base = carta - carta % CARTAS_POR_COR
+    mortas_cor = (mortas >> base) & MASCARA_COR
+    if mortas_cor >> (carta - base) & 1:
+        return base + (mortas_cor & -mortas_cor).bit_length() - 1
+    if carta - base < NUM_INVESTIMENTOS:
+        return base
+    return carta
+
+
+def _menores_bits(mascara: int, quantidade: int) -> int:
+    resultado = 0
+    for _ in range(quantidade):
+        bit = mascara & -mascara
+        resultado |= bit
+        mascara ^= bit
+    return resultado
+
+
+def _canonica_cor(bits: int, mortas: int) -> int:
+    vivos = _MASCARA_INVESTIMENTOS & ~mortas
+    resultado = bits & ~mortas & ~_MASCARA_INVESTIMENTOS
+    resultado |= _menores_bits(vivos, bin(bits & vivos).count('1'))
+    return resultado | _menores_bits(mortas, bin(bits & mortas).count('1'))
+
+
+def _distribuicoes(tamanhos: Sequence[int], total: int) -> Iterator[Tuple[int, ...]]:
+    if not tamanhos:
+        if not total:
+            yield ()
+        return
+    for quantidade in range(min(total, tamanhos[0]) + 1):
+        for resto in _distribuicoes(tamanhos[1:], total - quantidade):
+            yield (quantidade,) + resto
+
+
+def _somar_composicoes(compras_descarte: int, composicoes: List[Tuple[CompactState, int]],
+                       movimentos: List[int]) -> Tuple[List[List[float]], int, int, int]:
+    calculadora = CalculadoraVitoria(compras_descarte)
+    somas = calculadora._somar(composicoes, movimentos)
+    return somas, calculadora.nos, calculadora.consultas, calculadora.acertos
+
+
+@dataclass
+class AvaliacaoMovimento:
+    movimento: int
+    probabilidade_vitoria: float
+    diferenca_esperada: float
+
+
+@dataclass
+class ResultadoProbabilidade:
+    movimentos: List[AvaliacaoMovimento]
+    composicoes: int
+    nos: int
+    consultas: int
+    acertos: int
+    tempo: float
+
+    @property
+    def taxa_acerto(self) -> float:
+        return self.acertos / self.consultas if self.consultas else 0.0
+
+    @property
+    def melhor(self) -> Optional[AvaliacaoMovimento]:
+        if not self.movimentos:
+            return None
+        return max(self.movimentos,
+                   key=lambda item: (item.probabilidade_vitoria, item.diferenca_esperada))
+
+
+# Vitória e diferença esperadas de cada movimento pela visão do jogador da vez:
+# a mão do oponente (fora as cartas que ele pegou dos descartes) e a ordem do
+# deck são desconhecidas, então a média percorre todas as composições dessa
+# mão entre as cartas não vistas e todas as ordens do deck. Dentro de cada
+# composição as duas mãos ficam abertas e só a ordem do deck é sorteada.
+# Cada jogador pode comprar dos descartes no máximo compras_descarte vezes até
+# o fim, como no SolverFinal; o resultado é exato para partidas com esse limite.
+# As composições são independentes e podem ser divididas entre processos.
+class CalculadoraVitoria:
+    def __init__(self, compras_descarte: int = COMPRAS_DESCARTE_PADRAO, workers: int = 1,
+                 executor: Optional[Executor] = None):
+        if compras_descarte < 0:
+            raise ValueError("compras_descarte não pode ser negativo")
+        self.compras_descarte = compras_descarte
+        self.workers = max(1, workers)
+        self._executor = executor
+        self._executor_proprio = False
+        self.memo: Dict[tuple, Tuple[Valor, int, Optional[int]]] = {}
+        self._canonicas: Dict[Tuple[int, int], int] = {}
+        self._mortas: Dict[Tuple[int, int], int] = {}
+        self.nos = 0
+        self.consultas = 0
+        self.acertos = 0
+
+    def __enter__(self) -> "CalculadoraVitoria":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.fechar()
+
+    def _obter_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._executor_proprio = True
+        return self._executor
+
+    def fechar(self) -> None:
+        if self._executor_proprio:
+            self._executor.shutdown()
+            self._executor = None
+            self._executor_proprio = False
+
+    def avaliar(self, estado: CompactState) -> ResultadoProbabilidade:
+        # As tabelas só valem para a posição analisada; não crescem entre chamadas.
+        self.memo.clear()
+        self._canonicas.clear()
+        self._mortas.clear()
+        self.nos = 0
+        self.consultas = 0
+        self.acertos = 0
+        inicio = time.perf_counter()
+
+        legais = self._legais(estado, (self.compras_descarte, self.compras_descarte))
+        mortas = self._mascara_mortas(estado)
+        chaves = [self._chave_movimento(estado, codigo, mortas) for codigo in legais]
+        representantes: Dict[tuple, int] = {}
+        for chave, codigo in zip(chaves, legais):
+            representantes.setdefault(chave, codigo)
+        distintos = list(representantes.values())
+
+        composicoes = self.composicoes(estado)
+        partes = min(self.workers, len(composicoes))
+        if partes <= 1:
+            somas = self._somar(composicoes, distintos)
+        else:
+            executor = self._obter_executor()
+            futuros = [executor.submit(_somar_composicoes, self.compras_descarte,
+                                       composicoes[indice::partes], distintos)
+                       for indice in range(partes)]
+            somas = [[0.0, 0.0] for _ in distintos]
+            for futuro in futuros:
+                parcial, nos, consultas, acertos = futuro.result()
+                for soma, valor in zip(somas, parcial):
+                    soma[0] += valor[0]
+                    soma[1] += valor[1]
+                self.nos += nos
+                self.consultas += consultas
+                self.acertos += acertos
+
+        total = sum(peso for _, peso in composicoes)
+        valores = {chave: (soma[0] / total + 0.5, soma[1] / total)
+                   for chave, soma in zip(representantes, somas)}
+        avaliacoes = [AvaliacaoMovimento(codigo, *valores[chave])
+                      for chave, codigo in zip(chaves, legais)]
+        return ResultadoProbabilidade(avaliacoes, len(composicoes), self.nos, self.consultas,
+                                      self.acertos, time.perf_counter() - inicio)
+
+    # Somas ponderadas pelas composições, na ordem dos movimentos; cada par
+    # (composição, movimento) é resolvido com janela completa para ser exato.
+    def _somar(self, composicoes: List[Tuple[CompactState, int]],
+               movimentos: List[int]) -> List[List[float]]:
+        compras = (self.compras_descarte, self.compras_descarte)
+        somas = [[0.0, 0.0] for _ in movimentos]
+        for composicao, peso in composicoes:
+            for soma, codigo in zip(somas, movimentos):
+                valor = self._valor_movimento(composicao, codigo, compras, DERROTA, VITORIA)
+                soma[0] += peso * valor[0]
+                soma[1] += peso * valor[1]
+        return somas
+
+    # Uma mão por composição possível do oponente, com o peso de quantas
+    # escolhas de cartas não vistas levam a ela; o deck fica com o resto.
+    def composicoes(self, estado: CompactState) -> List[Tuple[CompactState, int]]:
+        observador = estado.jogador_atual
+        oponente = 2 - observador
+        conhecidas = estado.conhecidas[oponente]
+        mao = list(estado.maos[oponente])
+        escondidas = [posicao for posicao, carta in enumerate(mao) if not conhecidas >> carta & 1]
+
+        mortas = self._mascara_mortas(estado)
+        classes: Dict[int, List[int]] = {}
+        for carta in sorted(cartas_nao_vistas(estado, observador)):
+            classes.setdefault(classe_carta(carta, mortas), []).append(carta)
+        grupos = list(classes.values())
+
+        resultado = []
+        for quantidades in _distribuicoes([len(grupo) for grupo in grupos], len(escondidas)):
+            sorteadas: List[int] = []
+            deck: List[int] = []
+            peso = 1
+            for grupo, quantidade in zip(grupos, quantidades):
+                sorteadas += grupo[:quantidade]
+                deck += grupo[quantidade:]
+                peso *= comb(len(grupo), quantidade)
+            for posicao, carta in zip(escondidas, sorteadas):
+                mao[posicao] = carta
+
+            composicao = estado.clone()
+            composicao.maos[oponente] = tuple(mao)
+            composicao.mascaras_mao[oponente] = mascara_das_cartas(mao)
+            composicao.deck = tuple(deck)
+            composicao.cartas_deck = len(deck)
+            resultado.append((composicao, peso))
+        return resultado
+
+    def _mascara_mortas(self, estado: CompactState) -> int:
+        chave = (estado.expedicoes[0], estado.expedicoes[1])
+        mortas = self._mortas.get(chave)
+        if mortas is None:
+            mortas = self._mortas[chave] = mascara_mortas(*chave)
+        return mortas
+
+    def _canonica(self, mascara: int, mortas: int) -> int:
+        chave = (mascara, mortas)
+        canonica = self._canonicas.get(chave)
+        if canonica is None:
+            canonica = 0
+            for indice_cor in range(NUM_CORES):
+                deslocamento = indice_cor * CARTAS_POR_COR
+                canonica |= _canonica_cor((mascara >> deslocamento) & MASCARA_COR,
+                                          (mortas >> deslocamento) & MASCARA_COR) << deslocamento
+            self._canonicas[chave] = canonica
+        return canonica
+
+    # Com o orçamento restante só as compras[0] + compras[1] cartas do topo de
+    # cada monte ainda podem voltar para uma mão; o resto não muda o valor.
+    def _chave(self, estado: CompactState, compras: Tuple[int, int]) -> tuple:
+        mortas = self._mascara_mortas(estado)
+        canonica = self._canonica
+        alcance = compras[0] + compras[1]
+        return (canonica(estado.mascaras_mao[0], mortas),
+                canonica(estado.mascaras_mao[1], mortas),
+                canonica(estado.expedicoes[0], 0),
+                canonica(estado.expedicoes[1], 0),
+                tuple(tuple(classe_carta(carta, mortas) for carta in monte[len(monte) - alcance:])
+                      for monte in estado.descartes) if alcance else (),
+                canonica(mascara_das_cartas(estado.get_cartas_deck()), mortas),
+                estado.jogador_atual,
+                estado.fase,
+                compras)
+
+    def _chave_movimento(self, estado: CompactState, codigo: int, mortas: int) -> tuple:
+        tipo = codigo >> 6
+        if tipo >= MOVIMENTO_COMPRAR_DECK:
+            return tipo, codigo
+        carta = estado.maos[estado.jogador_atual - 1][(codigo >> 3) & 7]
+        return tipo, classe_carta(carta, mortas)
+
+    def _legais(self, estado: CompactState, compras: Tuple[int, int]) -> List[int]:
+        movimentos = estado.gerar_movimentos()
+        if not compras[estado.jogador_atual - 1]:
+            movimentos = [codigo for codigo in movimentos
+                          if codigo >> 6 != MOVIMENTO_COMPRAR_DESCARTE]
+        return movimentos
+
+    def _movimentos(self, estado: CompactState, compras: Tuple[int, int]) -> List[int]:
+        movimentos = self._legais(estado, compras)
+        if estado.fase == FASE_JOGAR:
+            mortas = self._mascara_mortas(estado)
+            vistos = set()
+            distintos = []
+            for codigo in movimentos:
+                chave = self._chave_movimento(estado, codigo, mortas)
+                if chave not in vistos:
+                    vistos.add(chave)
+                    distintos.append(codigo)
+            movimentos = distintos
+        return ordenar_movimentos(estado, movimentos)
+
+    def _valor_movimento(self, estado: CompactState, codigo: int, compras: Tuple[int, int],
+                         alfa: Valor, beta: Valor) -> Valor:
+        tipo = codigo >> 6
+        if tipo == MOVIMENTO_COMPRAR_DECK:
+            return self._valor_chance(estado, compras, alfa, beta)
+        if tipo == MOVIMENTO_COMPRAR_DESCARTE:
+            compras = (compras[0] - 1, compras[1]) if estado.jogador_atual == 1 else \
+                (compras[0], compras[1] - 1)
+        filho = estado.clone()
+        filho.aplicar(codigo)
+        return self._valor_filho(estado, filho, compras, alfa, beta)
+
+    def _valor_filho(self, estado: CompactState, filho: CompactState, compras: Tuple[int, int],
+                     alfa: Valor, beta: Valor) -> Valor:
+        if filho.jogador_atual == estado.jogador_atual:
+            return self._negamax(filho, compras, alfa, beta)
+        return _oposto(self._negamax(filho, compras, _oposto(beta), _oposto(alfa)))
+
+    def _valor_chance(self, estado: CompactState, compras: Tuple[int, int],
+                      alfa: Valor, beta: Valor) -> Valor:
+        if estado.cartas_deck == 1:
+            # A última carta do deck encerra a partida sem entrar numa expedição.
+            self.nos += 1
+            return _valor_diferenca(diferenca_pontuacao(estado))
+
+        mortas = self._mascara_mortas(estado)
+        grupos: Dict[int, List[int]] = {}
+        for carta in estado.get_cartas_deck():
+            grupo = grupos.setdefault(classe_carta(carta, mortas), [carta, 0])
+            grupo[1] += 1
+
+        total = estado.cartas_deck
+        restantes = total
+        probabilidade = diferenca = 0.0
+        for carta, quantidade in grupos.values():
+            restantes -= quantidade
+            # Fora desses limites a média já cai fora de (alfa, beta).
+            minimo = ((total * alfa[0] - probabilidade - restantes * VITORIA[0]) / quantidade,
+                      (total * alfa[1] - diferenca - restantes * VITORIA[1]) / quantidade)
+            maximo = ((total * beta[0] - probabilidade - restantes * DERROTA[0]) / quantidade,
+                      (total * beta[1] - diferenca - restantes * DERROTA[1]) / quantidade)
+            filho = comprar_carta_especifica(estado, carta)
+            valor = self._valor_filho(estado, filho, compras,
+                                      max(minimo, DERROTA), min(maximo, VITORIA))
+            if valor <= minimo:
+                return alfa
+            if valor >= maximo:
+                return beta
+            probabilidade += quantidade * valor[0]
+            diferenca += quantidade * valor[1]
+        return probabilidade / total, diferenca / total
+
+    def _negamax(self, estado: CompactState, compras: Tuple[int, int],
+                 alfa: Valor, beta: Valor) -> Valor:
+        self.nos += 1
+        if estado.jogo_terminado:
+            return _valor_diferenca(diferenca_pontuacao(estado))
+        if estado.cartas_deck == 1 and not compras[estado.jogador_atual - 1]:
+            return _valor_ultima_vez(estado)
+
+        alfa_original = alfa
+        movimento_memo = None
+        chave = None
+        entrada = None
+        # Só os nós de jogada vão para o memo: a compra seguinte sai barata de refazer.
+        if estado.fase == FASE_JOGAR:
+            self.consultas += 1
+            chave = self._chave(estado, compras)
+            entrada = self.memo.get(chave)
+        if entrada is not None:
+            self.acertos += 1
+            valor, limite, movimento_memo = entrada
+            if limite == EXATO:
+                return valor
+            if limite == LIMITE_INFERIOR:
+                alfa = max(alfa, valor)
+            else:
+                beta = min(beta, valor)
+            if alfa >= beta:
+                return valor
+
+        movimentos = self._movimentos(estado, compras)
+        if movimento_memo is not None and movimento_memo in movimentos:
+            movimentos.remove(movimento_memo)
+            movimentos.insert(0, movimento_memo)
+
+        melhor = DERROTA
+        melhor_movimento = None
+        for codigo in movimentos:
+            valor = self._valor_movimento(estado, codigo, compras, alfa, beta)
+            if valor > melhor:
+                melhor = valor
+                melhor_movimento = codigo
+            if melhor > alfa:
+                alfa = melhor
+            if alfa >= beta:
+                break
+
+        if melhor <= alfa_original:
+            limite = LIMITE_SUPERIOR
+        elif melhor >= beta:
+            limite = LIMITE_INFERIOR
+        else:
+            limite = EXATO
+        if chave is not None:
+            self.memo[chave] = (melhor, limite, melhor_movimento)
+        return melhor
@@ -0,0 +1,216 @@
+import mmap
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from src.core.game_manager import GameManager
+from src.game.compact_state import CompactState
+from src.game.registro import (
+    CABECALHO_ARQUIVO,
+    VERSAO_REGISTRO,
+    EscritorRegistros,
+    RegistroCorrompido,
+    RegistroPartida,
+    decodificar_registro,
+    ler_cabecalho,
+    tamanho_registro,
+)
+
+MAGICA_INDICE = b'LCIX'
+VERSAO_INDICE = 1
+SEM_VENCEDOR = -1
+BLOCO_FILTRO = 1 << 20
+
+# Uma entrada de largura fixa por partida, na mesma ordem do arquivo de dados.
+INDICE_PARTIDA = np.dtype([
+    ('deslocamento', '<u8'),
+    ('seed', '<i8'),
+    ('vencedor', 'i1'),
+    ('pontuacao1', '<i2'),
+    ('pontuacao2', '<i2'),
+    ('movimentos', '<u2'),
+])
+
+
+def caminho_indice(caminho: Path) -> Path:
+    caminho = Path(caminho)
+    return caminho.with_name(caminho.name + '.idx')
+
+
+def _ler_cabecalho_indice(arquivo: BinaryIO) -> None:
+    dados = arquivo.read(CABECALHO_ARQUIVO.size)
+    if len(dados) < CABECALHO_ARQUIVO.size:
+        raise RegistroCorrompido("Índice sem cabeçalho")
+    magica, versao = CABECALHO_ARQUIVO.unpack(dados)
+    if magica != MAGICA_INDICE:
+        raise RegistroCorrompido("Arquivo não é um índice de partidas")
+    if versao != VERSAO_INDICE:
+        raise ValueError(f"Versão de índice não suportada: {versao}")
+
+
+# Entradas que apontam além do fim dos dados vêm de uma gravação interrompida.
+def _entradas_validas(indice: np.ndarray, tamanho_dados: int, versao: int) -> int:
+    quantidade = len(indice)
+    while quantidade:
+        entrada = indice[quantidade - 1]
+        fim = int(entrada['deslocamento']) + tamanho_registro(int(entrada['movimentos']), versao)
+        if fim <= tamanho_dados:
+            break
+        quantidade -= 1
+    return quantidade
+
+
+def _mapear_indice(caminho: Path) -> np.ndarray:
+    with caminho.open('rb') as arquivo:
+        _ler_cabecalho_indice(arquivo)
+    quantidade = (caminho.stat().st_size - CABECALHO_ARQUIVO.size) // INDICE_PARTIDA.itemsize
+    if quantidade <= 0:
+        return np.zeros(0, dtype=INDICE_PARTIDA)
+    return np.memmap(caminho, dtype=INDICE_PARTIDA, mode='r',
+                     offset=CABECALHO_ARQUIVO.size, shape=(quantidade,))
+
+
+def _resumir_partida(registro: RegistroPartida) -> Tuple[int, int, int]:
+    estado = CompactState.from_game_state(GameManager.create_default(seed=registro.seed).state)
+    for codigo in registro.movimentos:
+        estado.aplicar(codigo)
+    vencedor = SEM_VENCEDOR if estado.vencedor is None else estado.vencedor
+    return vencedor, estado.calcular_pontuacao(1), estado.calcular_pontuacao(2)
+
+
+# Refaz o índice reproduzindo cada partida dos dados; para na primeira partida
+# incompleta, que o EscritorArquivo descarta em seguida.
+def reconstruir_indice(caminho: Path) -> int:
+    caminho = Path(caminho)
+    entradas = []
+    if caminho.stat().st_size:
+        with caminho.open('rb') as arquivo:
+            versao = ler_cabecalho(arquivo)
+            with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as dados:
+                deslocamento = CABECALHO_ARQUIVO.size
+                while deslocamento < len(dados):
+                    try:
+                        registro, fim = decodificar_registro(dados, deslocamento, versao)
+                    except RegistroCorrompido:
+                        break
+                    entradas.append((deslocamento, registro.seed, *_resumir_partida(registro),
+                                     len(registro.movimentos)))
+                    deslocamento = fim
+    caminho_indice(caminho).write_bytes(CABECALHO_ARQUIVO.pack(MAGICA_INDICE, VERSAO_INDICE) +
+                                        np.array(entradas, dtype=INDICE_PARTIDA).tobytes())
+    return len(entradas)
+
+
+class ArquivoPartidas:
+    def __init__(self, caminho: Path):
+        self.caminho = Path(caminho)
+        self._arquivo = self.caminho.open('rb')
+        self.versao = ler_cabecalho(self._arquivo)
+        self._dados = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        indice = _mapear_indice(caminho_indice(self.caminho))
+        self.indice = indice[:_entradas_validas(indice, len(self._dados), self.versao)]
+
+    def __len__(self) -> int:
+        return len(self.indice)
+
+    def __getitem__(self, numero: int) -> RegistroPartida:
+        deslocamento = int(self.indice[numero]['deslocamento'])
+        return decodificar_registro(self._dados, deslocamento, self.versao)[0]
+
+    def __enter__(self) -> "ArquivoPartidas":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.fechar()
+
+    def registros(self, numeros: Iterable[int]) -> Iterator[RegistroPartida]:
+        for numero in numeros:
+            yield self[int(numero)]
+
+    def filtrar(self, vencedor: Optional[int] = None, margem_minima: Optional[int] = None,
+                seed_minima: Optional[int] = None,
+                seed_maxima: Optional[int] = None) -> np.ndarray:
+        encontrados = []
+        for inicio in range(0, len(self.indice), BLOCO_FILTRO):
+            bloco = self.indice[inicio:inicio + BLOCO_FILTRO]
+            selecao = np.ones(len(bloco), dtype=bool)
+            if vencedor is not None:
+                selecao &= bloco['vencedor'] == vencedor
+            if margem_minima is not None:
+                margem = np.abs(bloco['pontuacao1'].astype(np.int32) - bloco['pontuacao2'])
+                selecao &= margem >= margem_minima
+            if seed_minima is not None:
+                selecao &= bloco['seed'] >= seed_minima
+            if seed_maxima is not None:
+                selecao &= bloco['seed'] <= seed_maxima
+            encontrados.append(np.flatnonzero(selecao) + inicio)
+        if not encontrados:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(encontrados)
+
+    def fechar(self) -> None:
+        self.indice = np.zeros(0, dtype=INDICE_PARTIDA)
+        self._dados.close()
+        self._arquivo.close()
+
+
+# Ao abrir, descarta o que uma gravação interrompida deixou depois da última
+# partida completa, nos dados e no índice. Sem o índice, ele é refeito dos dados.
+class EscritorArquivo:
+    def __init__(self, caminho: Path):
+        self.caminho = Path(caminho)
+        self.caminho.parent.mkdir(parents=True, exist_ok=True)
+        indice = caminho_indice(self.caminho)
+        if not self.caminho.exists():
+            self.caminho.write_bytes(b'')
+            indice.write_bytes(CABECALHO_ARQUIVO.pack(MAGICA_INDICE, VERSAO_INDICE))
+        elif not indice.exists():
+            reconstruir_indice(self.caminho)
+
+        self._dados = self.caminho.open('r+b')
+        self._indice = indice.open('r+b')
+        if self.caminho.stat().st_size:
+            versao = ler_cabecalho(self._dados)
+            if versao != VERSAO_REGISTRO:
+                raise ValueError(f"Não é possível acrescentar partidas a um arquivo na versão {versao}")
+        self.partidas = self._reparar()
+        self._registros = EscritorRegistros(self._dados)
+
+    def _reparar(self) -> int:
+        entradas = _mapear_indice(caminho_indice(self.caminho))
+        tamanho_dados = self.caminho.stat().st_size
+        quantidade = _entradas_validas(entradas, tamanho_dados, VERSAO_REGISTRO)
+        fim = CABECALHO_ARQUIVO.size if tamanho_dados else 0
+        if quantidade:
+            deslocamento, movimentos = entradas[['deslocamento', 'movimentos']][quantidade - 1].item()
+            fim = deslocamento + tamanho_registro(movimentos)
+        del entradas
+
+        self._dados.truncate(fim)
+        self._dados.seek(fim)
+        self._indice.truncate(CABECALHO_ARQUIVO.size + quantidade * INDICE_PARTIDA.itemsize)
+        self._indice.seek(0, 2)
+        return quantidade
+
+    def __enter__(self) -> "EscritorArquivo":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.fechar()
+
+    def adicionar(self, registro: RegistroPartida, pontuacao1: int, pontuacao2: int,
+                  vencedor: Optional[int]) -> int:
+        deslocamento = self._registros.escrever(registro)
+        entrada = np.array([(deslocamento, registro.seed,
+                             SEM_VENCEDOR if vencedor is None else vencedor,
+                             pontuacao1, pontuacao2, len(registro.movimentos))],
+                           dtype=INDICE_PARTIDA)
+        self._indice.write(entrada.tobytes())
+        self.partidas += 1
+        return self.partidas - 1
+
+    def fechar(self) -> None:
+        # Os dados vão para o disco antes do índice que aponta para eles.
+        self._dados.close()
+        self._indice.close()
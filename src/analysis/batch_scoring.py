@@ -0,0 +1,48 @@
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from src.core.rules import INVESTIMENTOS_POR_MASCARA, QUANTIDADE_POR_MASCARA, SOMA_POR_MASCARA
+from src.models.card_codes import CARTAS_POR_COR, MASCARA_COR, NUM_CORES
+
+_SOMA_POR_MASCARA = np.array(SOMA_POR_MASCARA, dtype=np.int32)
+_INVESTIMENTOS_POR_MASCARA = np.array(INVESTIMENTOS_POR_MASCARA, dtype=np.int32)
+_QUANTIDADE_POR_MASCARA = np.array(QUANTIDADE_POR_MASCARA, dtype=np.int32)
+
+
+def pontuar_expedicoes(somas: np.ndarray, investimentos: np.ndarray,
+                       quantidades: np.ndarray) -> np.ndarray:
+    somas = np.asarray(somas, dtype=np.int32)
+    investimentos = np.asarray(investimentos, dtype=np.int32)
+    quantidades = np.asarray(quantidades, dtype=np.int32)
+
+    pontuacao = (somas - 20) * (investimentos + 1)
+    pontuacao += np.where(quantidades >= 8, 20, 0).astype(np.int32)
+    return np.where(quantidades > 0, pontuacao, 0).astype(np.int32)
+
+
+def pontuar_jogadores(somas: np.ndarray, investimentos: np.ndarray,
+                      quantidades: np.ndarray) -> np.ndarray:
+    return pontuar_expedicoes(somas, investimentos, quantidades).sum(axis=-1)
+
+
+def definir_vencedores(pontuacoes: np.ndarray) -> np.ndarray:
+    pontuacoes = np.asarray(pontuacoes)
+    jogador1 = pontuacoes[..., 0]
+    jogador2 = pontuacoes[..., 1]
+    return np.where(jogador1 > jogador2, 1, np.where(jogador2 > jogador1, 2, 0)).astype(np.int8)
+
+
+def extrair_expedicoes(expedicoes: Sequence[Tuple[int, int]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    mascaras = np.asarray(expedicoes, dtype=np.uint64).reshape(-1, 2, 1)
+    deslocamentos = np.arange(NUM_CORES, dtype=np.uint64) * np.uint64(CARTAS_POR_COR)
+    por_cor = ((mascaras >> deslocamentos) & np.uint64(MASCARA_COR)).astype(np.intp)
+
+    return (_SOMA_POR_MASCARA[por_cor],
+            _INVESTIMENTOS_POR_MASCARA[por_cor],
+            _QUANTIDADE_POR_MASCARA[por_cor])
+
+
+def pontuar_estados(estados) -> np.ndarray:
+    return pontuar_jogadores(*extrair_expedicoes(
+        [estado.expedicoes for estado in estados]))
@@ -0,0 +1,137 @@
+import json
+import math
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+RATING_INICIAL = 1500.0
+RD_INICIAL = 350.0
+Z_95 = 1.96
+VERSAO_CHECKPOINT = 1
+
+_Q = math.log(10) / 400
+
+
+def _g(rd: float) -> float:
+    return 1.0 / math.sqrt(1.0 + 3.0 * _Q * _Q * rd * rd / (math.pi * math.pi))
+
+
+def _esperado(rating: float, rating_oponente: float, g: float) -> float:
+    return 1.0 / (1.0 + 10 ** (-g * (rating - rating_oponente) / 400))
+
+
+def pontos_do_resultado(vencedor: Optional[int], lado: int) -> float:
+    if vencedor == lado:
+        return 1.0
+    if vencedor == 0:
+        return 0.5
+    return 0.0
+
+
+@dataclass
+class JogadorClassificado:
+    nome: str
+    rating: float = RATING_INICIAL
+    rd: float = RD_INICIAL
+    partidas: int = 0
+    vitorias: int = 0
+    empates: int = 0
+    derrotas: int = 0
+
+    def intervalo(self, z: float = Z_95) -> Tuple[float, float]:
+        return self.rating - z * self.rd, self.rating + z * self.rd
+
+
+# Glicko com um período de avaliação por partida: cada resultado atualiza
+# os dois jogadores em O(1), sem recalcular o histórico.
+class Classificacao:
+    def __init__(self, volatilidade: float = 0.0):
+        self.volatilidade = volatilidade
+        self.jogadores: Dict[str, JogadorClassificado] = {}
+        self.partidas = 0
+
+    def jogador(self, nome: str) -> JogadorClassificado:
+        jogador = self.jogadores.get(nome)
+        if jogador is None:
+            jogador = JogadorClassificado(nome)
+            self.jogadores[nome] = jogador
+        return jogador
+
+    def esperado(self, nome: str, oponente: str) -> float:
+        jogador = self.jogador(nome)
+        outro = self.jogador(oponente)
+        return _esperado(jogador.rating, outro.rating, _g(outro.rd))
+
+    def registrar(self, jogador1: str, jogador2: str, vencedor: Optional[int]) -> None:
+        if vencedor is None or jogador1 == jogador2:
+            return
+        primeiro = self.jogador(jogador1)
+        segundo = self.jogador(jogador2)
+        pontos = pontos_do_resultado(vencedor, 1)
+
+        novo_primeiro = self._atualizar(primeiro, segundo, pontos)
+        novo_segundo = self._atualizar(segundo, primeiro, 1.0 - pontos)
+        primeiro.rating, primeiro.rd = novo_primeiro
+        segundo.rating, segundo.rd = novo_segundo
+
+        for jogador, resultado in ((primeiro, pontos), (segundo, 1.0 - pontos)):
+            jogador.partidas += 1
+            if resultado == 1.0:
+                jogador.vitorias += 1
+            elif resultado == 0.5:
+                jogador.empates += 1
+            else:
+                jogador.derrotas += 1
+        self.partidas += 1
+
+    def _atualizar(self, jogador: JogadorClassificado, oponente: JogadorClassificado,
+                   pontos: float) -> Tuple[float, float]:
+        rd = min(RD_INICIAL, math.sqrt(jogador.rd ** 2 + self.volatilidade ** 2))
+        g = _g(oponente.rd)
+        esperado = _esperado(jogador.rating, oponente.rating, g)
+        inverso_d2 = _Q * _Q * g * g * esperado * (1.0 - esperado)
+        precisao = 1.0 / (rd * rd) + inverso_d2
+        rating = jogador.rating + _Q / precisao * g * (pontos - esperado)
+        return rating, math.sqrt(1.0 / precisao)
+
+    def convergiu(self, rd_alvo: float, nomes: Optional[List[str]] = None) -> bool:
+        jogadores = [self.jogador(nome) for nome in nomes] if nomes else self.jogadores.values()
+        return bool(jogadores) and all(jogador.rd <= rd_alvo for jogador in jogadores)
+
+    def separados(self, nome: str, oponente: str, z: float = Z_95) -> bool:
+        inferior, superior = self.jogador(nome).intervalo(z)
+        inferior_oponente, superior_oponente = self.jogador(oponente).intervalo(z)
+        return inferior > superior_oponente or inferior_oponente > superior
+
+    def ranking(self) -> List[JogadorClassificado]:
+        return sorted(self.jogadores.values(), key=lambda jogador: jogador.rating, reverse=True)
+
+    def salvar(self, caminho: Path) -> None:
+        caminho = Path(caminho)
+        caminho.parent.mkdir(parents=True, exist_ok=True)
+        dados = {
+            'versao': VERSAO_CHECKPOINT,
+            'volatilidade': self.volatilidade,
+            'partidas': self.partidas,
+            'jogadores': [asdict(jogador) for jogador in self.jogadores.values()],
+        }
+        temporario = caminho.with_name(caminho.name + '.tmp')
+        with temporario.open('w', encoding='utf-8') as arquivo:
+            json.dump(dados, arquivo, indent=2)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def carregar(cls, caminho: Path) -> "Classificacao":
+        with Path(caminho).open(encoding='utf-8') as arquivo:
+            dados = json.load(arquivo)
+        if dados.get('versao') != VERSAO_CHECKPOINT:
+            raise ValueError(f"Versão de checkpoint não suportada: {dados.get('versao')}")
+
+        classificacao = cls(dados['volatilidade'])
+        classificacao.partidas = dados['partidas']
+        for jogador in dados['jogadores']:
+            classificacao.jogadores[jogador['nome']] = JogadorClassificado(**jogador)
+        return classificacao
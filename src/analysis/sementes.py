@@ -0,0 +1,119 @@
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from config.settings import GameConfig
+from src.ai.avaliacao import CARTAS_DECK_INICIAL, _mascaras_mao, estimar_jogador
+from src.ai.playout import POLITICA_LEVE, simular_arrays
+from src.game.compact_state import FASE_JOGAR
+from src.models.card_codes import (
+    CARTAS_POR_COR,
+    MASCARA_COR,
+    NUM_CORES,
+    TOTAL_CARTAS,
+    ids_em_ordem_de_criacao,
+)
+
+ORDEM_INICIAL = tuple(ids_em_ordem_de_criacao())
+TAMANHO_MAO = GameConfig.STARTING_HAND_SIZE
+TAMANHO_LOTE = 2048
+
+# Uma linha por seed: vitórias de cada lugar nos rollouts, diferença média
+# (jogador 1 - jogador 2) e a estimativa heurística da mão inicial de cada um.
+TABELA_SEMENTES = np.dtype([
+    ('seed', np.int64),
+    ('vitorias1', np.uint16),
+    ('vitorias2', np.uint16),
+    ('diferenca', np.float32),
+    ('estimativa1', np.float32),
+    ('estimativa2', np.float32),
+])
+
+
+# Mesma sequência do DeckManager(seed): o deck é embaralhado pelo Random da
+# seed e cada jogador compra a mão inicial do fim da lista.
+def embaralhar_seed(seed: int) -> List[int]:
+    cartas = list(ORDEM_INICIAL)
+    random.Random(seed).shuffle(cartas)
+    return cartas
+
+
+def maos_iniciais(cartas: Sequence[int]) -> Tuple[List[int], List[int]]:
+    return (list(cartas[:-TAMANHO_MAO - 1:-1]),
+            list(cartas[-TAMANHO_MAO - 1:-2 * TAMANHO_MAO - 1:-1]))
+
+
+def estimar_maos(cartas: Sequence[int]) -> Tuple[float, float]:
+    maos = [_mascaras_mao(mao) for mao in maos_iniciais(cartas)]
+    vazias = [0] * NUM_CORES
+    decks = [MASCARA_COR & ~(maos[0][indice_cor] | maos[1][indice_cor])
+             for indice_cor in range(NUM_CORES)]
+    return tuple(estimar_jogador(vazias, mao, vazias, decks, CARTAS_DECK_INICIAL)
+                 for mao in maos)
+
+
+def analisar_lote(inicio: int, quantidade: int, rollouts: int,
+                  politica: str = POLITICA_LEVE, seed_rollouts: int = 0) -> np.ndarray:
+    tabela = np.zeros(quantidade, dtype=TABELA_SEMENTES)
+    tabela['seed'] = np.arange(inicio, inicio + quantidade)
+    baralhos = np.empty((quantidade, TOTAL_CARTAS), dtype=np.int8)
+    for linha, seed in enumerate(range(inicio, inicio + quantidade)):
+        cartas = embaralhar_seed(seed)
+        baralhos[linha] = cartas
+        tabela['estimativa1'][linha], tabela['estimativa2'][linha] = estimar_maos(cartas)
+
+    # Cada seed ocupa rollouts linhas seguidas; o deck fica na ordem de compra.
+    partidas = quantidade * rollouts
+    decks = np.repeat(baralhos[:, TOTAL_CARTAS - 2 * TAMANHO_MAO - 1::-1], rollouts, axis=0)
+    maos = np.empty((partidas, 2, TAMANHO_MAO), dtype=np.int8)
+    maos[:, 0] = np.repeat(baralhos[:, :-TAMANHO_MAO - 1:-1], rollouts, axis=0)
+    maos[:, 1] = np.repeat(baralhos[:, -TAMANHO_MAO - 1:-2 * TAMANHO_MAO - 1:-1], rollouts, axis=0)
+    expedicoes = np.zeros((partidas, 2), dtype=np.uint64)
+    descartes = np.zeros((partidas, NUM_CORES, CARTAS_POR_COR), dtype=np.int8)
+    alturas = np.zeros((partidas, NUM_CORES), dtype=np.int8)
+    pontuacoes = np.zeros((partidas, 2), dtype=np.int32)
+
+    gerador = np.random.default_rng((seed_rollouts, inicio))
+    simular_arrays(decks, maos, expedicoes, descartes, alturas, pontuacoes,
+                   0, FASE_JOGAR, gerador, politica)
+
+    diferencas = (pontuacoes[:, 0] - pontuacoes[:, 1]).reshape(quantidade, rollouts)
+    tabela['vitorias1'] = (diferencas > 0).sum(axis=1)
+    tabela['vitorias2'] = (diferencas < 0).sum(axis=1)
+    tabela['diferenca'] = diferencas.mean(axis=1)
+    return tabela
+
+
+def analisar_sementes(inicio: int, quantidade: int, rollouts: int, workers: int,
+                      tamanho_lote: int = TAMANHO_LOTE, politica: str = POLITICA_LEVE,
+                      seed_rollouts: int = 0) -> Iterator[np.ndarray]:
+    lotes = [(lote, min(tamanho_lote, inicio + quantidade - lote))
+             for lote in range(inicio, inicio + quantidade, tamanho_lote)]
+
+    if workers <= 1:
+        for lote, tamanho in lotes:
+            yield analisar_lote(lote, tamanho, rollouts, politica, seed_rollouts)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pendentes = {executor.submit(analisar_lote, lote, tamanho, rollouts, politica,
+                                     seed_rollouts)
+                     for lote, tamanho in lotes}
+        while pendentes:
+            prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                yield futuro.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+# Ordena pelas vitórias mais parecidas, depois pela menor diferença média de
+# pontos e por fim pelas mãos iniciais de estimativa mais próxima.
+def mais_equilibradas(tabela: np.ndarray, quantidade: int) -> np.ndarray:
+    vitorias = np.abs(tabela['vitorias1'].astype(np.int32) - tabela['vitorias2'])
+    ordem = np.lexsort((np.abs(tabela['estimativa1'] - tabela['estimativa2']),
+                        np.abs(tabela['diferenca']), vitorias))
+    return tabela[ordem[:quantidade]]
@@ -0,0 +1,129 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from src.ai.politicas import criar_politica
+from src.core.game_manager import GameManager
+from src.game.compact_state import CompactState
+
+# Descartar e recomprar a mesma carta pode repetir para sempre.
+MAX_JOGADAS = 2000
+
+Partida = Tuple[int, int, bool]
+
+
+@dataclass
+class ResultadoPartida:
+    indice: int
+    seed: int
+    jogador1: str
+    jogador2: str
+    pontuacao1: int
+    pontuacao2: int
+    vencedor: Optional[int]
+    turnos: int
+    jogadas: int
+    tempo: float
+    encerrada: bool
+    movimentos: bytes = field(default=b'', repr=False)
+
+    def para_dict(self) -> dict:
+        dados = asdict(self)
+        del dados['movimentos']
+        return dados
+
+
+def jogar_partida(politicas: Sequence[str], indice: int, seed: int, trocar: bool,
+                  max_jogadas: int = MAX_JOGADAS) -> ResultadoPartida:
+    inicio = time.perf_counter()
+    especificacoes = tuple(reversed(politicas)) if trocar else tuple(politicas)
+    jogadores = [criar_politica(especificacao, seed * 2 + posicao)
+                 for posicao, especificacao in enumerate(especificacoes)]
+
+    estado = CompactState.from_game_state(GameManager.create_default(seed=seed).state)
+    movimentos = bytearray()
+    while not estado.jogo_terminado and len(movimentos) < max_jogadas:
+        codigo = jogadores[estado.jogador_atual - 1](estado)
+        estado.aplicar(codigo)
+        movimentos.append(codigo)
+    jogadas = len(movimentos)
+
+    return ResultadoPartida(indice, seed, especificacoes[0], especificacoes[1],
+                            estado.calcular_pontuacao(1), estado.calcular_pontuacao(2),
+                            estado.vencedor, jogadas // 2, jogadas,
+                            time.perf_counter() - inicio, estado.jogo_terminado,
+                            bytes(movimentos))
+
+
+def jogar_partidas(politicas: Sequence[str], partidas: Sequence[Partida],
+                   max_jogadas: int = MAX_JOGADAS) -> List[ResultadoPartida]:
+    return [jogar_partida(politicas, indice, seed, trocar, max_jogadas)
+            for indice, seed, trocar in partidas]
+
+
+def gerar_partidas(quantidade: int, seed_inicial: int, alternar: bool = True) -> List[Partida]:
+    if alternar:
+        return [(indice, seed_inicial + indice // 2, indice % 2 == 1)
+                for indice in range(quantidade)]
+    return [(indice, seed_inicial + indice, False) for indice in range(quantidade)]
+
+
+def executar_torneio(politicas: Sequence[str], partidas: Sequence[Partida], workers: int,
+                     tamanho_lote: int = 0,
+                     max_jogadas: int = MAX_JOGADAS) -> Iterator[ResultadoPartida]:
+    if not tamanho_lote:
+        tamanho_lote = max(1, min(32, len(partidas) // (workers * 8)))
+    lotes = [partidas[inicio:inicio + tamanho_lote]
+             for inicio in range(0, len(partidas), tamanho_lote)]
+
+    if workers <= 1:
+        for lote in lotes:
+            yield from jogar_partidas(politicas, lote, max_jogadas)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pendentes = {executor.submit(jogar_partidas, politicas, lote, max_jogadas)
+                     for lote in lotes}
+        while pendentes:
+            prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                yield from futuro.result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+# Num confronto de uma política contra ela mesma as vitórias são contadas por lugar.
+@dataclass
+class ResumoTorneio:
+    politicas: Tuple[str, str]
+    partidas: int = 0
+    vitorias: List[int] = field(default_factory=lambda: [0, 0])
+    empates: int = 0
+    interrompidas: int = 0
+    soma_diferenca: int = 0
+    jogadas: int = 0
+    tempo_partidas: float = 0.0
+
+    def registrar(self, resultado: ResultadoPartida) -> None:
+        self.partidas += 1
+        self.jogadas += resultado.jogadas
+        self.tempo_partidas += resultado.tempo
+        if not resultado.encerrada:
+            self.interrompidas += 1
+            return
+
+        invertida = resultado.jogador1 != self.politicas[0]
+        diferenca = resultado.pontuacao1 - resultado.pontuacao2
+        self.soma_diferenca += -diferenca if invertida else diferenca
+        if resultado.vencedor == 0:
+            self.empates += 1
+        elif resultado.vencedor is not None:
+            lado = resultado.vencedor - 1
+            self.vitorias[1 - lado if invertida else lado] += 1
+
+    @property
+    def diferenca_media(self) -> float:
+        encerradas = self.partidas - self.interrompidas
+        return self.soma_diferenca / encerradas if encerradas else 0.0
@@ -0,0 +1,11 @@
+from src.core.rules import JOGADA_LEGAL, calcular_pontuacao_cartas, pode_empilhar, pontuacao_expedicao
+from src.core.zobrist import TranspositionTable, calcular_hash
+
+__all__ = [
+    'JOGADA_LEGAL',
+    'calcular_pontuacao_cartas',
+    'pode_empilhar',
+    'pontuacao_expedicao',
+    'TranspositionTable',
+    'calcular_hash'
+]
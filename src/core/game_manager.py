@@ -0,0 +1,356 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from config.settings import (
+    Colors,
+    DEFAULT_RANDOM_SEED,
+    GameConfig,
+    get_slot_positions,
+)
+from src.core.zobrist import (
+    CHAVES_DECK,
+    CHAVES_DESCARTE,
+    CHAVES_EXPEDICAO,
+    CHAVES_MAO,
+    calcular_hash,
+    chave_turno_manager,
+)
+from src.game.state import GameState
+from src.game.turn_manager import TurnManager
+from src.models.card_codes import COR_CARTA, INVESTIMENTO_CARTA, NUMERO_CARTA
+from src.models.deck import DeckManager
+from src.models.slot_carta import SlotCarta
+
+if TYPE_CHECKING:
+    from src.game.moves import GameMove
+
+
+@dataclass(frozen=True)
+class UndoToken:
+    move: "GameMove"
+    carta: int
+    indice_mao: int
+    turno: tuple
+    fim_jogo_processado: bool
+    zobrist: int
+    conhecidas: int
+    mensagem: Optional[str]
+
+
+class GameManager:
+    def __init__(self, state: GameState):
+        self.state = state
+
+    @classmethod
+    def create_default(cls, seed: Optional[int] = DEFAULT_RANDOM_SEED) -> 'GameManager':
+        deck_manager = DeckManager(seed=seed)
+        turn_manager = TurnManager()
+        state = GameState(deck_manager=deck_manager, turn_manager=turn_manager)
+        manager = cls(state)
+        manager.start_new_game()
+        return manager
+
+    def start_new_game(self, seed: Optional[int] = None) -> None:
+        if seed is not None:
+            self.state.deck_manager.set_seed(seed)
+        else:
+            self.state.deck_manager.reset_jogo()
+        self.state.turn_manager.reset_jogo()
+        self.state.reset()
+        colors = Colors.get_available_colors()
+        slot_positions = get_slot_positions()
+        self.state.configure_slots(colors, slot_positions)
+        self._distribuir_cartas_iniciais()
+        self.state.fim_jogo_processado = False
+        self.state.zobrist = calcular_hash(self.state)
+
+    def load_state(self, new_state: GameState) -> None:
+        self.state = new_state.clone()
+
+    def _distribuir_cartas_iniciais(self) -> None:
+        for jogador in (1, 2):
+            mao = self.state.deck_manager.distribuir_mao_inicial()
+            self.state.players[jogador].hand = mao
+
+    def get_shared_slots(self) -> List[SlotCarta]:
+        return self.state.shared_slots
+
+    def get_player_slots(self, jogador: int) -> List[SlotCarta]:
+        return self.state.get_player_slots(jogador)
+
+    def get_hand(self, jogador: int) -> List[int]:
+        return self.state.get_player_hand(jogador)
+
+    def get_turn_manager(self) -> TurnManager:
+        return self.state.turn_manager
+
+    def get_deck_manager(self) -> DeckManager:
+        return self.state.deck_manager
+
+    def get_jogador_atual(self) -> int:
+        return self.state.turn_manager.get_jogador_atual()
+
+    def pode_mover_carta(self, jogador: int) -> bool:
+        return self.state.turn_manager.pode_mover_carta(jogador)
+
+    def pode_jogar_carta(self, jogador: int) -> bool:
+        return self.state.turn_manager.pode_jogar_carta(jogador)
+
+    def pode_comprar_carta(self, jogador: int) -> bool:
+        return self.state.turn_manager.pode_comprar_carta(jogador)
+
+    def validar_jogada_em_slot(self, carta: int, slot: SlotCarta) -> bool:
+        jogador = self.get_jogador_atual()
+        slot_jogador = self.state.find_player_slot(jogador, slot.cor)
+        if not slot_jogador:
+            return False
+        return self.state.turn_manager.validar_jogada_em_expedicao(carta, slot_jogador)
+
+    def forcar_proxima_fase(self) -> None:
+        chave_antes = chave_turno_manager(self.state.turn_manager)
+        self.state.turn_manager.forcar_proxima_fase()
+        self._atualizar_hash_turno(chave_antes)
+
+    def pular_turno(self) -> None:
+        chave_antes = chave_turno_manager(self.state.turn_manager)
+        self.state.turn_manager.pular_turno()
+        self._atualizar_hash_turno(chave_antes)
+
+    def _atualizar_hash_turno(self, chave_antes: int) -> None:
+        self.state.zobrist ^= chave_antes ^ chave_turno_manager(
+            self.state.turn_manager)
+
+    def tentar_jogar_em_expedicao(self, carta: int, cor) -> Tuple[bool, str]:
+        jogador = self.get_jogador_atual()
+        if not self.pode_jogar_carta(jogador):
+            return False, 'Complete a fase atual primeiro!'
+
+        slot_jogador = self.state.find_player_slot(jogador, cor)
+        slot_compartilhado = self.state.find_shared_slot(cor)
+        if not slot_jogador or not slot_compartilhado:
+            return False, 'Slot inválido!'
+
+        if not self.state.turn_manager.validar_jogada_em_expedicao(carta, slot_jogador):
+            return False, 'Jogada inválida! Verifique cor e ordem.'
+
+        if slot_jogador.adicionar_carta(carta):
+            slot_compartilhado.adicionar_carta(carta, jogador)
+            self.state.zobrist ^= CHAVES_EXPEDICAO[jogador - 1][carta]
+            mao = self.state.get_player_hand(jogador)
+            if carta in mao:
+                mao.remove(carta)
+                self.state.zobrist ^= CHAVES_MAO[jogador - 1][carta]
+                self.state.players[jogador].conhecidas &= ~(1 << carta)
+            chave_antes = chave_turno_manager(self.state.turn_manager)
+            self.state.turn_manager.registrar_carta_jogada(carta, 'expedicao')
+            self._atualizar_hash_turno(chave_antes)
+            return True, self._mensagem_carta_jogada(carta)
+
+        return False, 'Não foi possível jogar a carta.'
+
+    def tentar_descartar_carta(self, carta: int) -> Tuple[bool, str]:
+        jogador = self.get_jogador_atual()
+        if not self.pode_jogar_carta(jogador):
+            return False, 'Complete a fase atual primeiro!'
+
+        if self.state.deck_manager.descartar_carta(carta):
+            monte = self.state.deck_manager.montes_descarte[COR_CARTA[carta]]
+            self.state.zobrist ^= CHAVES_DESCARTE[carta][monte.quantidade_cartas() - 1]
+            mao = self.state.get_player_hand(jogador)
+            if carta in mao:
+                mao.remove(carta)
+                self.state.zobrist ^= CHAVES_MAO[jogador - 1][carta]
+                self.state.players[jogador].conhecidas &= ~(1 << carta)
+            chave_antes = chave_turno_manager(self.state.turn_manager)
+            self.state.turn_manager.registrar_carta_jogada(carta, 'descarte')
+            self._atualizar_hash_turno(chave_antes)
+            nomes_cores = Colors.get_color_names()
+            cor_nome = nomes_cores.get(COR_CARTA[carta], 'Desconhecida')
+            return True, f'Carta descartada em {cor_nome}!'
+
+        return False, 'Não é possível descartar a carta!'
+
+    def comprar_carta_deck(self) -> Tuple[bool, Optional[int], str]:
+        jogador = self.get_jogador_atual()
+        if not self.pode_comprar_carta(jogador):
+            return False, None, 'Não é possível comprar carta agora!'
+
+        mao = self.state.get_player_hand(jogador)
+        if len(mao) >= GameConfig.STARTING_HAND_SIZE:
+            return False, None, 'Mão cheia!'
+
+        carta = self.state.deck_manager.comprar_do_deck()
+        if carta is None:
+            return False, None, 'Deck vazio!'
+
+        posicao = self.state.deck_manager.deck.quantidade_cartas()
+        self.state.zobrist ^= CHAVES_DECK[posicao][carta] ^ CHAVES_MAO[jogador - 1][carta]
+        mao.append(carta)
+        chave_antes = chave_turno_manager(self.state.turn_manager)
+        self.state.turn_manager.registrar_carta_comprada('deck')
+        self._atualizar_hash_turno(chave_antes)
+        return True, carta, 'Carta comprada do deck!'
+
+    def comprar_carta_descarte(self, cor) -> Tuple[bool, Optional[int], str]:
+        jogador = self.get_jogador_atual()
+        if not self.pode_comprar_carta(jogador):
+            return False, None, 'Não é possível comprar carta agora!'
+
+        mao = self.state.get_player_hand(jogador)
+        if len(mao) >= GameConfig.STARTING_HAND_SIZE:
+            return False, None, 'Mão cheia!'
+
+        carta = self.state.deck_manager.comprar_do_descarte(cor)
+        nomes_cores = Colors.get_color_names()
+        if carta is None:
+            cor_nome = nomes_cores.get(cor, 'Desconhecida')
+            return False, None, f'Descarte {cor_nome} vazio!'
+
+        profundidade = self.state.deck_manager.montes_descarte[cor].quantidade_cartas()
+        self.state.zobrist ^= CHAVES_DESCARTE[carta][profundidade] ^ CHAVES_MAO[jogador - 1][carta]
+        mao.append(carta)
+        self.state.players[jogador].conhecidas |= 1 << carta
+        chave_antes = chave_turno_manager(self.state.turn_manager)
+        self.state.turn_manager.registrar_carta_comprada('descarte')
+        self._atualizar_hash_turno(chave_antes)
+        cor_nome = nomes_cores.get(cor, 'Desconhecida')
+        return True, carta, f'Carta comprada do descarte {cor_nome}!'
+
+    def checar_fim_de_jogo(self) -> Optional[str]:
+        deck_vazio = not self.state.deck_manager.deck.tem_cartas()
+        mao1_vazia = len(self.state.get_player_hand(1)) == 0
+        mao2_vazia = len(self.state.get_player_hand(2)) == 0
+
+        chave_antes = chave_turno_manager(self.state.turn_manager)
+        if self.state.turn_manager.verificar_fim_de_jogo(deck_vazio, mao1_vazia or mao2_vazia):
+            self._atualizar_hash_turno(chave_antes)
+            if not self.state.fim_jogo_processado:
+                return self._processar_fim_de_jogo()
+        return None
+
+    def _processar_fim_de_jogo(self) -> str:
+        pontuacao1 = self.state.calcular_pontuacao_jogador(1)
+        pontuacao2 = self.state.calcular_pontuacao_jogador(2)
+
+        self.state.turn_manager.definir_vencedor(pontuacao1, pontuacao2)
+        self.state.fim_jogo_processado = True
+
+        vencedor = self.state.turn_manager.vencedor
+        if vencedor == 0:
+            return 'Empate!'
+        return f'Jogador {vencedor} venceu!'
+
+    def get_estatisticas(self) -> dict:
+        slots = self.state.shared_slots
+        pontuacao_total = sum(slot.calcular_pontuacao() for slot in slots)
+        cartas_jogadas = sum(slot.get_quantidade_cartas() for slot in slots)
+
+        estatisticas_por_cor: Dict[str, dict] = {}
+        nomes_cores = Colors.get_color_names()
+        for slot in slots:
+            cor_nome = nomes_cores.get(slot.cor, 'Desconhecida')
+            estatisticas_por_cor[cor_nome] = {
+                'cartas': slot.get_quantidade_cartas(),
+                'pontuacao': slot.calcular_pontuacao(),
+            }
+
+        pontuacao_j1 = self.state.calcular_pontuacao_jogador(1)
+        pontuacao_j2 = self.state.calcular_pontuacao_jogador(2)
+
+        return {
+            'pontuacao_total': pontuacao_total,
+            'pontuacao_j1': pontuacao_j1,
+            'pontuacao_j2': pontuacao_j2,
+            'cartas_jogadas': cartas_jogadas,
+            'cartas_mao_j1': len(self.state.get_player_hand(1)),
+            'cartas_mao_j2': len(self.state.get_player_hand(2)),
+            'por_cor': estatisticas_por_cor,
+            'turno': self.state.turn_manager.get_status_turno(),
+            'deck': self.state.deck_manager.get_estatisticas_deck(),
+        }
+
+    def apply(self, move: "GameMove") -> UndoToken:
+        if move.jogador != self.get_jogador_atual():
+            raise ValueError(f"Movimento do jogador {move.jogador} na vez do jogador "
+                             f"{self.get_jogador_atual()}")
+        turno = self.state.turn_manager.capturar_estado()
+        fim_jogo_processado = self.state.fim_jogo_processado
+        zobrist = self.state.zobrist
+        conhecidas = self.state.get_cartas_conhecidas(move.jogador)
+        mao = self.state.get_player_hand(move.jogador)
+
+        if move.tipo == "play":
+            indice_mao = move.carta_index
+            carta = mao[indice_mao]
+            sucesso, mensagem = self.tentar_jogar_em_expedicao(
+                carta, move.destino_cor)
+            if not sucesso:
+                raise ValueError("Falha ao aplicar movimento de jogo de carta")
+
+        elif move.tipo == "discard":
+            indice_mao = move.carta_index
+            carta = mao[indice_mao]
+            sucesso, mensagem = self.tentar_descartar_carta(carta)
+            if not sucesso:
+                raise ValueError("Falha ao descartar carta")
+
+        elif move.tipo == "draw_deck":
+            sucesso, carta, mensagem = self.comprar_carta_deck()
+            if not sucesso:
+                raise ValueError("Falha ao comprar carta do deck")
+            indice_mao = len(mao) - 1
+
+        elif move.tipo == "draw_discard":
+            sucesso, carta, mensagem = self.comprar_carta_descarte(
+                move.destino_cor)
+            if not sucesso:
+                raise ValueError("Falha ao comprar do descarte")
+            indice_mao = len(mao) - 1
+
+        else:
+            raise ValueError(f"Tipo de movimento desconhecido: {move.tipo}")
+
+        mensagem_fim = self.checar_fim_de_jogo()
+        if mensagem_fim:
+            mensagem = f"{mensagem} {mensagem_fim}" if mensagem else mensagem_fim
+
+        return UndoToken(move=move, carta=carta, indice_mao=indice_mao, turno=turno,
+                         fim_jogo_processado=fim_jogo_processado, zobrist=zobrist,
+                         conhecidas=conhecidas, mensagem=mensagem)
+
+    def undo(self, token: UndoToken) -> None:
+        move = token.move
+        carta = token.carta
+        mao = self.state.get_player_hand(move.jogador)
+        deck_manager = self.state.deck_manager
+
+        if move.tipo == "play":
+            cor = COR_CARTA[carta]
+            self.state.find_player_slot(move.jogador, cor).remover_ultima_carta()
+            self.state.find_shared_slot(cor).remover_ultima_carta(move.jogador)
+            mao.insert(token.indice_mao, carta)
+
+        elif move.tipo == "discard":
+            deck_manager.montes_descarte[COR_CARTA[carta]].comprar_carta_topo()
+            mao.insert(token.indice_mao, carta)
+
+        elif move.tipo == "draw_deck":
+            mao.pop(token.indice_mao)
+            deck_manager.deck.cartas.append(carta)
+
+        elif move.tipo == "draw_discard":
+            mao.pop(token.indice_mao)
+            deck_manager.montes_descarte[COR_CARTA[carta]].adicionar_carta(carta)
+
+        self.state.turn_manager.restaurar_estado(token.turno)
+        self.state.fim_jogo_processado = token.fim_jogo_processado
+        self.state.zobrist = token.zobrist
+        self.state.players[move.jogador].conhecidas = token.conhecidas
+
+    @staticmethod
+    def _mensagem_carta_jogada(carta: int) -> str:
+        nomes_cores = Colors.get_color_names()
+        cor_nome = nomes_cores.get(COR_CARTA[carta], 'Desconhecida')
+        if INVESTIMENTO_CARTA[carta]:
+            return f'Investimento {cor_nome} jogado!'
+        return f'Carta {NUMERO_CARTA[carta]} {cor_nome} jogada!'
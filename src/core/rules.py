@@ -0,0 +1,102 @@
+from typing import Optional, Sequence, Tuple
+
+from src.models.card_codes import (
+    CARTAS_POR_COR,
+    INDICE_COR_CARTA,
+    INVESTIMENTO_CARTA,
+    MASCARA_COR,
+    NUM_INVESTIMENTOS,
+    NUM_CORES,
+    NUMERO_CARTA,
+    TOTAL_CARTAS,
+)
+
+
+def pode_empilhar(topo: Optional[int], carta: int) -> bool:
+    if topo is None:
+        return True
+
+    if INVESTIMENTO_CARTA[carta]:
+        return INVESTIMENTO_CARTA[topo]
+    if INVESTIMENTO_CARTA[topo]:
+        return True
+    return NUMERO_CARTA[carta] >= NUMERO_CARTA[topo]
+
+
+def pontuacao_expedicao(soma_cartas: int, cartas_investimento: int, quantidade: int) -> int:
+    if quantidade == 0:
+        return 0
+
+    pontuacao = soma_cartas - 20
+
+    if cartas_investimento == 1:
+        pontuacao *= 2
+    elif cartas_investimento == 2:
+        pontuacao *= 3
+    elif cartas_investimento == 3:
+        pontuacao *= 4
+
+    if quantidade >= 8:
+        pontuacao += 20
+
+    return pontuacao
+
+
+def _mascara_bloqueio(carta: int) -> int:
+    posicao = carta % CARTAS_POR_COR
+    limiar = max(posicao, NUM_INVESTIMENTOS)
+    return (MASCARA_COR >> limiar) << (carta - posicao + limiar)
+
+
+# Cartas da expedição que impedem jogar a carta: investimentos são
+# bloqueados por qualquer numerada e numeradas por qualquer numerada maior.
+MASCARA_BLOQUEIO: Tuple[int, ...] = tuple(
+    _mascara_bloqueio(carta) for carta in range(TOTAL_CARTAS))
+
+# Tabelas por máscara de uma cor (bit = posição na expedição), usadas por
+# todo código que pontua ou avalia expedições em bits.
+_MASCARAS = range(MASCARA_COR + 1)
+_MASCARA_INVESTIMENTOS = (1 << NUM_INVESTIMENTOS) - 1
+
+SOMA_POR_MASCARA: Tuple[int, ...] = tuple(
+    sum(NUMERO_CARTA[bit] for bit in range(CARTAS_POR_COR) if mascara >> bit & 1)
+    for mascara in _MASCARAS)
+QUANTIDADE_POR_MASCARA: Tuple[int, ...] = tuple(
+    bin(mascara).count('1') for mascara in _MASCARAS)
+INVESTIMENTOS_POR_MASCARA: Tuple[int, ...] = tuple(
+    QUANTIDADE_POR_MASCARA[mascara & _MASCARA_INVESTIMENTOS] for mascara in _MASCARAS)
+PONTUACAO_POR_MASCARA: Tuple[int, ...] = tuple(
+    pontuacao_expedicao(SOMA_POR_MASCARA[mascara], INVESTIMENTOS_POR_MASCARA[mascara],
+                        QUANTIDADE_POR_MASCARA[mascara])
+    for mascara in _MASCARAS)
+# Posições que a expedição já não aceita: tudo abaixo da maior numerada.
+BLOQUEADAS_POR_MASCARA: Tuple[int, ...] = tuple(
+    (1 << (mascara.bit_length() - 1)) - 1 if mascara >> NUM_INVESTIMENTOS else 0
+    for mascara in _MASCARAS)
+
+
+def topo_vazio(indice_cor: int) -> int:
+    return TOTAL_CARTAS + indice_cor
+
+
+def _jogada_legal(topo: int, carta: int) -> bool:
+    if topo >= TOTAL_CARTAS:
+        return INDICE_COR_CARTA[carta] == topo - TOTAL_CARTAS
+    return INDICE_COR_CARTA[carta] == INDICE_COR_CARTA[topo] and pode_empilhar(topo, carta)
+
+
+# Indexada por topo * TOTAL_CARTAS + carta; o topo de uma expedição vazia
+# é topo_vazio(indice_cor), de modo que a cor também é validada pela tabela.
+JOGADA_LEGAL: Tuple[bool, ...] = tuple(
+    _jogada_legal(topo, carta)
+    for topo in range(TOTAL_CARTAS + NUM_CORES)
+    for carta in range(TOTAL_CARTAS))
+
+
+def calcular_pontuacao_cartas(cartas: Sequence[int]) -> int:
+    cartas_investimento = sum(
+        1 for carta in cartas if INVESTIMENTO_CARTA[carta])
+
+    soma_cartas = sum(NUMERO_CARTA[carta] for carta in cartas)
+
+    return pontuacao_expedicao(soma_cartas, cartas_investimento, len(cartas))
@@ -0,0 +1,152 @@
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+PENDENTE = 'pendente'
+EXECUTANDO = 'executando'
+CONCLUIDA = 'concluida'
+FALHOU = 'falhou'
+CANCELADA = 'cancelada'
+
+
+class TarefaCancelada(Exception):
+    pass
+
+
+@dataclass(eq=False)
+class Tarefa:
+    nome: str
+    canal: str
+    ao_concluir: Optional[Callable[[Any], None]] = field(default=None, repr=False)
+    ao_progresso: Optional[Callable[["Tarefa"], None]] = field(default=None, repr=False)
+    status: str = PENDENTE
+    progresso: float = 0.0
+    mensagem: str = ''
+    resultado: Any = field(default=None, repr=False)
+    erro: Optional[BaseException] = None
+    inicio: float = 0.0
+    tempo: float = 0.0
+    _cancelar: threading.Event = field(default_factory=threading.Event, repr=False)
+    _interromper: threading.Event = field(default_factory=threading.Event, repr=False)
+    _fila: Optional["queue.SimpleQueue"] = field(default=None, repr=False)
+
+    @property
+    def cancelada(self) -> bool:
+        return self._cancelar.is_set()
+
+    @property
+    def interrompida(self) -> bool:
+        return self._interromper.is_set() or self._cancelar.is_set()
+
+    @property
+    def terminada(self) -> bool:
+        return self.status in (CONCLUIDA, FALHOU, CANCELADA)
+
+    def cancelar(self) -> None:
+        self._cancelar.set()
+
+    def interromper(self) -> None:
+        self._interromper.set()
+
+    def reportar(self, progresso: float, mensagem: str = '') -> None:
+        if self._cancelar.is_set():
+            raise TarefaCancelada(self.nome)
+        self._fila.put((self, EXECUTANDO, min(1.0, max(0.0, progresso)), mensagem))
+
+
+class GerenciadorTarefas:
+    def __init__(self):
+        self._executores: Dict[str, ThreadPoolExecutor] = {}
+        self._fila: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.ativas: List[Tarefa] = []
+
+    def enviar(self, canal: str, nome: str, funcao: Callable[..., Any], *args,
+               ao_concluir: Optional[Callable[[Any], None]] = None,
+               ao_progresso: Optional[Callable[[Tarefa], None]] = None) -> Tarefa:
+        tarefa = Tarefa(nome, canal, ao_concluir, ao_progresso, _fila=self._fila)
+        executor = self._executores.get(canal)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'worker-{canal}')
+            self._executores[canal] = executor
+        self.ativas.append(tarefa)
+        executor.submit(self._executar, tarefa, funcao, args)
+        return tarefa
+
+    def _executar(self, tarefa: Tarefa, funcao: Callable[..., Any], args: tuple) -> None:
+        if tarefa.cancelada:
+            self._fila.put((tarefa, CANCELADA, tarefa.progresso, ''))
+            return
+
+        tarefa.inicio = time.perf_counter()
+        self._fila.put((tarefa, EXECUTANDO, 0.0, ''))
+        try:
+            resultado = funcao(tarefa, *args)
+        except TarefaCancelada:
+            self._fila.put((tarefa, CANCELADA, tarefa.progresso, ''))
+        except Exception as exc:
+            tarefa.erro = exc
+            self._fila.put((tarefa, FALHOU, tarefa.progresso, repr(exc)))
+        else:
+            tarefa.resultado = resultado
+            self._fila.put((tarefa, CONCLUIDA, 1.0, ''))
+
+    def coletar(self) -> List[Tarefa]:
+        terminadas = []
+        while True:
+            try:
+                tarefa, status, progresso, mensagem = self._fila.get_nowait()
+            except queue.Empty:
+                break
+
+            tarefa.progresso = progresso
+            if mensagem:
+                tarefa.mensagem = mensagem
+            if tarefa.terminada:
+                continue
+            tarefa.status = status
+            if status == EXECUTANDO:
+                if tarefa.ao_progresso:
+                    tarefa.ao_progresso(tarefa)
+                continue
+
+            tarefa.tempo = time.perf_counter() - tarefa.inicio if tarefa.inicio else 0.0
+            self.ativas.remove(tarefa)
+            terminadas.append(tarefa)
+            if status == CONCLUIDA and tarefa.ao_concluir and not tarefa.cancelada:
+                tarefa.ao_concluir(tarefa.resultado)
+        return terminadas
+
+    def ocupado(self, canal: Optional[str] = None) -> bool:
+        return any(canal is None or tarefa.canal == canal for tarefa in self.ativas)
+
+    def cancelar(self, canal: Optional[str] = None) -> None:
+        for tarefa in self.ativas:
+            if canal is None or tarefa.canal == canal:
+                tarefa.cancelar()
+
+    def interromper(self, canal: Optional[str] = None) -> None:
+        for tarefa in self.ativas:
+            if canal is None or tarefa.canal == canal:
+                tarefa.interromper()
+
+    def aguardar(self, canal: Optional[str] = None, timeout: Optional[float] = None) -> List[Tarefa]:
+        prazo = None if timeout is None else time.perf_counter() + timeout
+        terminadas = self.coletar()
+        while self.ocupado(canal):
+            if prazo is not None and time.perf_counter() >= prazo:
+                break
+            time.sleep(0.001)
+            terminadas.extend(self.coletar())
+        return terminadas
+
+    def encerrar(self, cancelar: bool = True) -> None:
+        if cancelar:
+            self.cancelar()
+        for executor in self._executores.values():
+            executor.shutdown(wait=True, cancel_futures=cancelar)
+        self._executores.clear()
+        self.coletar()
+        self.ativas.clear()
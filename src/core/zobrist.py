@@ -0,0 +1,101 @@
+import random
+from typing import Any, List, Optional, Tuple
+
+from src.models.card_codes import CARTAS_POR_COR, TOTAL_CARTAS
+
+ZOBRIST_SEED = 0x1C057C17
+
+_rng = random.Random(ZOBRIST_SEED)
+
+
+def _chaves(quantidade: int) -> Tuple[int, ...]:
+    return tuple(_rng.getrandbits(64) for _ in range(quantidade))
+
+
+CHAVES_MAO: Tuple[Tuple[int, ...], ...] = (
+    _chaves(TOTAL_CARTAS), _chaves(TOTAL_CARTAS))
+CHAVES_EXPEDICAO: Tuple[Tuple[int, ...], ...] = (
+    _chaves(TOTAL_CARTAS), _chaves(TOTAL_CARTAS))
+CHAVES_DESCARTE: Tuple[Tuple[int, ...], ...] = tuple(
+    _chaves(CARTAS_POR_COR) for _ in range(TOTAL_CARTAS))
+CHAVES_DECK: Tuple[Tuple[int, ...], ...] = tuple(
+    _chaves(TOTAL_CARTAS) for _ in range(TOTAL_CARTAS))
+CHAVES_TURNO: Tuple[Tuple[int, ...], ...] = (_chaves(2), _chaves(2))
+CHAVE_FIM_DE_JOGO = _rng.getrandbits(64)
+
+
+def chave_turno(jogador: int, fase: int, jogo_terminado: bool) -> int:
+    chave = CHAVES_TURNO[jogador - 1][fase]
+    if jogo_terminado:
+        chave ^= CHAVE_FIM_DE_JOGO
+    return chave
+
+
+def chave_turno_manager(turn_manager) -> int:
+    fase = 1 if turn_manager.fase_turno == 'comprar_carta' else 0
+    return chave_turno(turn_manager.jogador_atual, fase, turn_manager.jogo_terminado)
+
+
+def calcular_hash(state) -> int:
+    valor = 0
+    for jogador in (1, 2):
+        chaves_mao = CHAVES_MAO[jogador - 1]
+        for carta in state.get_player_hand(jogador):
+            valor ^= chaves_mao[carta]
+
+        chaves_expedicao = CHAVES_EXPEDICAO[jogador - 1]
+        for slot in state.get_player_slots(jogador):
+            for carta in slot.cartas:
+                valor ^= chaves_expedicao[carta]
+
+    for monte in state.deck_manager.montes_descarte.values():
+        for profundidade, carta in enumerate(monte.cartas):
+            valor ^= CHAVES_DESCARTE[carta][profundidade]
+
+    for posicao, carta in enumerate(state.deck_manager.deck.cartas):
+        valor ^= CHAVES_DECK[posicao][carta]
+
+    return valor ^ chave_turno_manager(state.turn_manager)
+
+
+class TranspositionTable:
+    def __init__(self, capacidade: int = 1 << 16):
+        tamanho = 1
+        while tamanho < capacidade:
+            tamanho <<= 1
+        self._mascara = tamanho - 1
+        self._chaves: List[Optional[int]] = [None] * tamanho
+        self._valores: List[Any] = [None] * tamanho
+        self._profundidades: List[int] = [0] * tamanho
+        self.consultas = 0
+        self.acertos = 0
+
+    def __len__(self) -> int:
+        return sum(1 for chave in self._chaves if chave is not None)
+
+    def get(self, chave: int, profundidade: int = 0) -> Any:
+        self.consultas += 1
+        indice = chave & self._mascara
+        if self._chaves[indice] == chave and self._profundidades[indice] >= profundidade:
+            self.acertos += 1
+            return self._valores[indice]
+        return None
+
+    def put(self, chave: int, valor: Any, profundidade: int = 0) -> None:
+        indice = chave & self._mascara
+        atual = self._chaves[indice]
+        if atual is None or atual == chave or profundidade >= self._profundidades[indice]:
+            self._chaves[indice] = chave
+            self._valores[indice] = valor
+            self._profundidades[indice] = profundidade
+
+    def clear(self) -> None:
+        for indice in range(len(self._chaves)):
+            self._chaves[indice] = None
+            self._valores[indice] = None
+            self._profundidades[indice] = 0
+        self.consultas = 0
+        self.acertos = 0
+
+    def taxa_acerto(self) -> float:
+        return self.acertos / self.consultas if self.consultas else 0.0
@@ -0,0 +1,316 @@
+import random
+from typing import List, Optional, Tuple
+
+from config.settings import Colors, get_slot_positions
+from src.game.state import GameState
+from src.game.turn_manager import TurnManager
+from src.models.card_codes import CARTAS_POR_COR, INDICE_COR_CARTA, MASCARA_COR, NUM_CORES
+from src.models.deck import Deck, DeckManager, DiscardPile
+from src.core.rules import MASCARA_BLOQUEIO, PONTUACAO_POR_MASCARA
+from src.core.zobrist import (
+    CHAVES_DECK,
+    CHAVES_DESCARTE,
+    CHAVES_EXPEDICAO,
+    CHAVES_MAO,
+    chave_turno,
+)
+from src.game.moves import (
+    MOVIMENTO_COMPRAR_DECK,
+    MOVIMENTO_COMPRAR_DESCARTE,
+    MOVIMENTO_DESCARTAR,
+    MOVIMENTO_JOGAR,
+)
+
+FASE_JOGAR = 0
+FASE_COMPRAR = 1
+
+
+_DESCARTAR = MOVIMENTO_DESCARTAR << 6
+_COMPRAR_DECK = MOVIMENTO_COMPRAR_DECK << 6
+_COMPRAR_DESCARTE = MOVIMENTO_COMPRAR_DESCARTE << 6
+
+
+def cartas_da_mascara(mascara: int) -> List[int]:
+    cartas: List[int] = []
+    while mascara:
+        menor_bit = mascara & -mascara
+        cartas.append(menor_bit.bit_length() - 1)
+        mascara ^= menor_bit
+    return cartas
+
+
+def mascara_das_cartas(cartas) -> int:
+    mascara = 0
+    for carta in cartas:
+        mascara |= 1 << carta
+    return mascara
+
+
+class CompactState:
+    __slots__ = (
+        'maos',
+        'mascaras_mao',
+        'conhecidas',
+        'expedicoes',
+        'descartes',
+        'deck',
+        'cartas_deck',
+        'jogador_atual',
+        'fase',
+        'jogo_terminado',
+        'vencedor',
+        'fim_jogo_processado',
+        'zobrist',
+        'seed',
+        'rng_state',
+    )
+
+    def __init__(self):
+        self.maos: List[Tuple[int, ...]] = [(), ()]
+        self.mascaras_mao: List[int] = [0, 0]
+        self.conhecidas: List[int] = [0, 0]
+        self.expedicoes: List[int] = [0, 0]
+        self.descartes: List[Tuple[int, ...]] = [()] * NUM_CORES
+        self.deck: Tuple[int, ...] = ()
+        self.cartas_deck = 0
+        self.jogador_atual = 1
+        self.fase = FASE_JOGAR
+        self.jogo_terminado = False
+        self.vencedor: Optional[int] = None
+        self.fim_jogo_processado = False
+        self.zobrist = 0
+        self.seed: Optional[int] = None
+        self.rng_state: Optional[tuple] = None
+
+    def clone(self) -> "CompactState":
+        novo = CompactState.__new__(CompactState)
+        novo.maos = self.maos[:]
+        novo.mascaras_mao = self.mascaras_mao[:]
+        novo.conhecidas = self.conhecidas[:]
+        novo.expedicoes = self.expedicoes[:]
+        novo.descartes = self.descartes[:]
+        novo.deck = self.deck
+        novo.cartas_deck = self.cartas_deck
+        novo.jogador_atual = self.jogador_atual
+        novo.fase = self.fase
+        novo.jogo_terminado = self.jogo_terminado
+        novo.vencedor = self.vencedor
+        novo.fim_jogo_processado = self.fim_jogo_processado
+        novo.zobrist = self.zobrist
+        novo.seed = self.seed
+        novo.rng_state = self.rng_state
+        return novo
+
+    def get_player_hand(self, jogador: int) -> Tuple[int, ...]:
+        return self.maos[jogador - 1]
+
+    def get_expedicao(self, jogador: int, indice_cor: int) -> List[int]:
+        base = indice_cor * CARTAS_POR_COR
+        mascara = (self.expedicoes[jogador - 1] >> base) & MASCARA_COR
+        return [base + bit for bit in cartas_da_mascara(mascara)]
+
+    def get_topo_descarte(self, indice_cor: int) -> Optional[int]:
+        monte = self.descartes[indice_cor]
+        return monte[-1] if monte else None
+
+    def get_cartas_deck(self) -> Tuple[int, ...]:
+        return self.deck[:self.cartas_deck]
+
+    def calcular_pontuacao_expedicao(self, jogador: int, indice_cor: int) -> int:
+        mascara = self.expedicoes[jogador - 1] >> (indice_cor * CARTAS_POR_COR)
+        return PONTUACAO_POR_MASCARA[mascara & MASCARA_COR]
+
+    def calcular_pontuacao(self, jogador: int) -> int:
+        mascara = self.expedicoes[jogador - 1]
+        total = 0
+        for _ in range(NUM_CORES):
+            total += PONTUACAO_POR_MASCARA[mascara & MASCARA_COR]
+            mascara >>= CARTAS_POR_COR
+        return total
+
+    def calcular_hash(self) -> int:
+        valor = chave_turno(self.jogador_atual, self.fase, self.jogo_terminado)
+        for indice in (0, 1):
+            chaves_mao = CHAVES_MAO[indice]
+            for carta in self.maos[indice]:
+                valor ^= chaves_mao[carta]
+            chaves_expedicao = CHAVES_EXPEDICAO[indice]
+            for carta in cartas_da_mascara(self.expedicoes[indice]):
+                valor ^= chaves_expedicao[carta]
+
+        for monte in self.descartes:
+            for profundidade, carta in enumerate(monte):
+                valor ^= CHAVES_DESCARTE[carta][profundidade]
+
+        for posicao in range(self.cartas_deck):
+            valor ^= CHAVES_DECK[posicao][self.deck[posicao]]
+
+        return valor
+
+    def gerar_movimentos(self, destino: Optional[List[int]] = None) -> List[int]:
+        movimentos = destino if destino is not None else []
+        if self.jogo_terminado:
+            return movimentos
+
+        indice_jogador = self.jogador_atual - 1
+        if self.fase == FASE_JOGAR:
+            expedicao = self.expedicoes[indice_jogador]
+            indice = 0
+            for carta in self.maos[indice_jogador]:
+                codigo = (indice << 3) | INDICE_COR_CARTA[carta]
+                if not expedicao & MASCARA_BLOQUEIO[carta]:
+                    movimentos.append(codigo)
+                movimentos.append(_DESCARTAR | codigo)
+                indice += 1
+        else:
+            if self.cartas_deck:
+                movimentos.append(_COMPRAR_DECK)
+            descartes = self.descartes
+            for indice_cor in range(NUM_CORES):
+                if descartes[indice_cor]:
+                    movimentos.append(_COMPRAR_DESCARTE | indice_cor)
+
+        return movimentos
+
+    def aplicar(self, codigo: int) -> None:
+        indice_jogador = self.jogador_atual - 1
+        tipo = codigo >> 6
+        zobrist = self.zobrist ^ chave_turno(self.jogador_atual, self.fase, False)
+
+        if tipo <= MOVIMENTO_DESCARTAR:
+            mao = self.maos[indice_jogador]
+            indice_mao = (codigo >> 3) & 7
+            carta = mao[indice_mao]
+            self.maos[indice_jogador] = mao[:indice_mao] + mao[indice_mao + 1:]
+            self.mascaras_mao[indice_jogador] ^= 1 << carta
+            self.conhecidas[indice_jogador] &= ~(1 << carta)
+            zobrist ^= CHAVES_MAO[indice_jogador][carta]
+
+            if tipo == MOVIMENTO_JOGAR:
+                self.expedicoes[indice_jogador] |= 1 << carta
+                zobrist ^= CHAVES_EXPEDICAO[indice_jogador][carta]
+            else:
+                indice_cor = INDICE_COR_CARTA[carta]
+                monte = self.descartes[indice_cor]
+                zobrist ^= CHAVES_DESCARTE[carta][len(monte)]
+                self.descartes[indice_cor] = monte + (carta,)
+            self.fase = FASE_COMPRAR
+        else:
+            if tipo == MOVIMENTO_COMPRAR_DECK:
+                self.cartas_deck -= 1
+                carta = self.deck[self.cartas_deck]
+                zobrist ^= CHAVES_DECK[self.cartas_deck][carta]
+            else:
+                indice_cor = codigo & 7
+                monte = self.descartes[indice_cor]
+                carta = monte[-1]
+                self.descartes[indice_cor] = monte[:-1]
+                self.conhecidas[indice_jogador] |= 1 << carta
+                zobrist ^= CHAVES_DESCARTE[carta][len(monte) - 1]
+            self.maos[indice_jogador] += (carta,)
+            self.mascaras_mao[indice_jogador] |= 1 << carta
+            zobrist ^= CHAVES_MAO[indice_jogador][carta]
+            self.fase = FASE_JOGAR
+            self.jogador_atual = 2 - indice_jogador
+
+        if not self.cartas_deck or not self.maos[0] or not self.maos[1]:
+            self._encerrar()
+
+        self.zobrist = zobrist ^ chave_turno(
+            self.jogador_atual, self.fase, self.jogo_terminado)
+
+    def _encerrar(self) -> None:
+        self.jogo_terminado = True
+        pontuacao1 = self.calcular_pontuacao(1)
+        pontuacao2 = self.calcular_pontuacao(2)
+        if pontuacao1 > pontuacao2:
+            self.vencedor = 1
+        elif pontuacao2 > pontuacao1:
+            self.vencedor = 2
+        else:
+            self.vencedor = 0
+        self.fim_jogo_processado = True
+
+    @classmethod
+    def from_game_state(cls, state: GameState) -> "CompactState":
+        compacto = cls()
+        cores = Colors.get_available_colors()
+
+        for jogador in (1, 2):
+            mao = tuple(state.get_player_hand(jogador))
+            compacto.maos[jogador - 1] = mao
+            compacto.mascaras_mao[jogador - 1] = mascara_das_cartas(mao)
+            compacto.conhecidas[jogador - 1] = state.get_cartas_conhecidas(jogador)
+
+            expedicao = 0
+            for slot in state.get_player_slots(jogador):
+                expedicao |= mascara_das_cartas(slot.cartas)
+            compacto.expedicoes[jogador - 1] = expedicao
+
+        deck_manager = state.deck_manager
+        compacto.descartes = [tuple(deck_manager.montes_descarte[cor].cartas)
+                              for cor in cores]
+        compacto.deck = tuple(deck_manager.deck.cartas)
+        compacto.cartas_deck = len(compacto.deck)
+        compacto.seed = deck_manager._base_seed
+        compacto.rng_state = deck_manager._rng.getstate()
+
+        turn_manager = state.turn_manager
+        compacto.jogador_atual = turn_manager.jogador_atual
+        compacto.fase = FASE_COMPRAR if turn_manager.fase_turno == 'comprar_carta' else FASE_JOGAR
+        compacto.jogo_terminado = turn_manager.jogo_terminado
+        compacto.vencedor = turn_manager.vencedor
+        compacto.fim_jogo_processado = state.fim_jogo_processado
+        compacto.zobrist = compacto.calcular_hash()
+        return compacto
+
+    def to_game_state(self) -> GameState:
+        cores = Colors.get_available_colors()
+
+        deck_manager = DeckManager.__new__(DeckManager)
+        deck_manager._base_seed = self.seed
+        deck_manager._rng = random.Random()
+        if self.rng_state is not None:
+            deck_manager._rng.setstate(self.rng_state)
+        deck_manager.deck = Deck.__new__(Deck)
+        deck_manager.deck._rng = deck_manager._rng
+        deck_manager.deck.cartas = list(self.get_cartas_deck())
+        deck_manager.montes_descarte = {}
+        for indice_cor, cor in enumerate(cores):
+            monte = DiscardPile(cor)
+            monte.restaurar_cartas(self.descartes[indice_cor])
+            deck_manager.montes_descarte[cor] = monte
+
+        turn_manager = TurnManager()
+        turn_manager.jogador_atual = self.jogador_atual
+        turn_manager.fase_turno = 'comprar_carta' if self.fase == FASE_COMPRAR else 'jogar_carta'
+        turn_manager.carta_jogada_neste_turno = self.fase == FASE_COMPRAR
+        turn_manager.jogo_terminado = self.jogo_terminado
+        turn_manager.vencedor = self.vencedor
+
+        state = GameState(deck_manager=deck_manager, turn_manager=turn_manager)
+        state.configure_slots(cores, get_slot_positions())
+        for jogador in (1, 2):
+            state.players[jogador].hand = list(self.maos[jogador - 1])
+            state.players[jogador].conhecidas = self.conhecidas[jogador - 1]
+            for indice_cor, slot in enumerate(state.get_player_slots(jogador)):
+                cartas = self.get_expedicao(jogador, indice_cor)
+                slot.restaurar_cartas(cartas)
+                state.shared_slots[indice_cor].restaurar_cartas(cartas, jogador)
+
+        state.fim_jogo_processado = self.fim_jogo_processado
+        state.zobrist = self.zobrist
+        return state
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactState):
+            return NotImplemented
+        return (self.maos == other.maos
+                and self.conhecidas == other.conhecidas
+                and self.expedicoes == other.expedicoes
+                and self.descartes == other.descartes
+                and self.get_cartas_deck() == other.get_cartas_deck()
+                and self.jogador_atual == other.jogador_atual
+                and self.fase == other.fase
+                and self.jogo_terminado == other.jogo_terminado
+                and self.vencedor == other.vencedor)
@@ -3,245 +3,39 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from config.settings import (
+    AIConfig,
     Colors,
     DEFAULT_RANDOM_SEED,
     FPS,
-    GameConfig,
     WINDOW_HEIGHT,
     WINDOW_TITLE,
     WINDOW_WIDTH,
     get_discard_positions,
     get_hand_positions,
-    get_slot_positions,
 )
-from src.game.state import GameState
-from src.game.turn_manager import TurnManager
+from src.ai.ismcts import ISMCTS
+from src.ai.iterativo import BuscaIterativa, ResultadoIterativo
+from src.ai.mcts import MCTS
+from src.core.game_manager import GameManager, UndoToken
+from src.core.workers import FALHOU, GerenciadorTarefas, Tarefa
+from src.game.compact_state import CompactState
+from src.game.moves import GameMove
+from src.game.registro import RegistroPartida
+from src.models.card_codes import TOTAL_CARTAS, descricao_carta
 from src.models.carta import Carta
-from src.models.deck import DeckManager
 from src.models.slot_carta import SlotCarta
 from src.ui.renderer import GameRenderer, UIManager
 
 if TYPE_CHECKING:
-    from src.game.state_tree import GameStateTree, GameMove
-
-
-class GameManager:
-    def __init__(self, state: GameState):
-        self.state = state
-
-    @classmethod
-    def create_default(cls, seed: Optional[int] = DEFAULT_RANDOM_SEED) -> 'GameManager':
-        deck_manager = DeckManager(seed=seed)
-        turn_manager = TurnManager()
-        state = GameState(deck_manager=deck_manager, turn_manager=turn_manager)
-        manager = cls(state)
-        manager.start_new_game()
-        return manager
-
-    def start_new_game(self, seed: Optional[int] = None) -> None:
-        if seed is not None:
-            self.state.deck_manager.set_seed(seed)
-        else:
-            self.state.deck_manager.reset_jogo()
-        self.state.turn_manager.reset_jogo()
-        self.state.reset()
-        colors = Colors.get_available_colors()
-        slot_positions = get_slot_positions()
-        self.state.configure_slots(colors, slot_positions)
-        self._distribuir_cartas_iniciais()
-        self.state.fim_jogo_processado = False
-
-    def load_state(self, new_state: GameState) -> None:
-        self.state = new_state.clone()
-
-    def _distribuir_cartas_iniciais(self) -> None:
-        for jogador in (1, 2):
-            mao = self.state.deck_manager.distribuir_mao_inicial()
-            self.state.players[jogador].hand = mao
-
-    def get_shared_slots(self) -> List[SlotCarta]:
-        return self.state.shared_slots
-
-    def get_player_slots(self, jogador: int) -> List[SlotCarta]:
-        return self.state.get_player_slots(jogador)
-
-    def get_hand(self, jogador: int) -> List[Carta]:
-        return self.state.get_player_hand(jogador)
-
-    def get_turn_manager(self) -> TurnManager:
-        return self.state.turn_manager
-
-    def get_deck_manager(self) -> DeckManager:
-        return self.state.deck_manager
-
-    def get_jogador_atual(self) -> int:
-        return self.state.turn_manager.get_jogador_atual()
-
-    def pode_mover_carta(self, jogador: int) -> bool:
-        return self.state.turn_manager.pode_mover_carta(jogador)
-
-    def pode_jogar_carta(self, jogador: int) -> bool:
-        return self.state.turn_manager.pode_jogar_carta(jogador)
-
-    def pode_comprar_carta(self, jogador: int) -> bool:
-        return self.state.turn_manager.pode_comprar_carta(jogador)
-
-    def validar_jogada_em_slot(self, carta: Carta, slot: SlotCarta) -> bool:
-        jogador = self.get_jogador_atual()
-        slot_jogador = self.state.find_player_slot(jogador, slot.cor)
-        if not slot_jogador:
-            return False
-        return self.state.turn_manager.validar_jogada_em_expedicao(carta, slot_jogador)
-
-    def forcar_proxima_fase(self) -> None:
-        self.state.turn_manager.forcar_proxima_fase()
-
-    def pular_turno(self) -> None:
-        self.state.turn_manager.pular_turno()
-
-    def tentar_jogar_em_expedicao(self, carta: Carta, cor) -> Tuple[bool, str]:
-        jogador = self.get_jogador_atual()
-        if not self.pode_jogar_carta(jogador):
-            return False, 'Complete a fase atual primeiro!'
-
-        slot_jogador = self.state.find_player_slot(jogador, cor)
-        slot_compartilhado = self.state.find_shared_slot(cor)
-        if not slot_jogador or not slot_compartilhado:
-            return False, 'Slot inválido!'
-
-        if not self.state.turn_manager.validar_jogada_em_expedicao(carta, slot_jogador):
-            return False, 'Jogada inválida! Verifique cor e ordem.'
-
-        if slot_jogador.adicionar_carta(carta):
-            slot_compartilhado.adicionar_carta(carta, jogador)
-            mao = self.state.get_player_hand(jogador)
-            if carta in mao:
-                mao.remove(carta)
-            self.state.turn_manager.registrar_carta_jogada(carta, 'expedicao')
-            return True, self._mensagem_carta_jogada(carta)
-
-        return False, 'Não foi possível jogar a carta.'
-
-    def tentar_descartar_carta(self, carta: Carta) -> Tuple[bool, str]:
-        jogador = self.get_jogador_atual()
-        if not self.pode_jogar_carta(jogador):
-            return False, 'Complete a fase atual primeiro!'
-
-        if self.state.deck_manager.descartar_carta(carta):
-            mao = self.state.get_player_hand(jogador)
-            if carta in mao:
-                mao.remove(carta)
-            self.state.turn_manager.registrar_carta_jogada(carta, 'descarte')
-            carta.parar_arraste()
-            nomes_cores = Colors.get_color_names()
-            cor_nome = nomes_cores.get(carta.cor, 'Desconhecida')
-            return True, f'Carta descartada em {cor_nome}!'
-
-        return False, 'Não é possível descartar a carta!'
-
-    def comprar_carta_deck(self) -> Tuple[bool, Optional[Carta], str]:
-        jogador = self.get_jogador_atual()
-        if not self.pode_comprar_carta(jogador):
-            return False, None, 'Não é possível comprar carta agora!'
-
-        mao = self.state.get_player_hand(jogador)
-        if len(mao) >= GameConfig.STARTING_HAND_SIZE:
-            return False, None, 'Mão cheia!'
-
-        carta = self.state.deck_manager.comprar_do_deck()
-        if not carta:
-            return False, None, 'Deck vazio!'
-
-        mao.append(carta)
-        self.state.turn_manager.registrar_carta_comprada('deck')
-        return True, carta, 'Carta comprada do deck!'
-
-    def comprar_carta_descarte(self, cor) -> Tuple[bool, Optional[Carta], str]:
-        jogador = self.get_jogador_atual()
-        if not self.pode_comprar_carta(jogador):
-            return False, None, 'Não é possível comprar carta agora!'
-
-        mao = self.state.get_player_hand(jogador)
-        if len(mao) >= GameConfig.STARTING_HAND_SIZE:
-            return False, None, 'Mão cheia!'
-
-        carta = self.state.deck_manager.comprar_do_descarte(cor)
-        nomes_cores = Colors.get_color_names()
-        if not carta:
-            cor_nome = nomes_cores.get(cor, 'Desconhecida')
-            return False, None, f'Descarte {cor_nome} vazio!'
-
-        mao.append(carta)
-        self.state.turn_manager.registrar_carta_comprada('descarte')
-        cor_nome = nomes_cores.get(cor, 'Desconhecida')
-        return True, carta, f'Carta comprada do descarte {cor_nome}!'
-
-    def checar_fim_de_jogo(self) -> Optional[str]:
-        deck_vazio = not self.state.deck_manager.deck.tem_cartas()
-        mao1_vazia = len(self.state.get_player_hand(1)) == 0
-        mao2_vazia = len(self.state.get_player_hand(2)) == 0
-
-        if self.state.turn_manager.verificar_fim_de_jogo(deck_vazio, mao1_vazia or mao2_vazia):
-            if not self.state.fim_jogo_processado:
-                return self._processar_fim_de_jogo()
-        return None
-
-    def _processar_fim_de_jogo(self) -> str:
-        pontuacao1 = sum(slot.calcular_pontuacao()
-                         for slot in self.state.get_player_slots(1))
-        pontuacao2 = sum(slot.calcular_pontuacao()
-                         for slot in self.state.get_player_slots(2))
-
-        self.state.turn_manager.definir_vencedor(pontuacao1, pontuacao2)
-        self.state.fim_jogo_processado = True
-
-        vencedor = self.state.turn_manager.vencedor
-        if vencedor == 0:
-            return 'Empate!'
-        return f'Jogador {vencedor} venceu!'
-
-    def get_estatisticas(self) -> dict:
-        slots = self.state.shared_slots
-        pontuacao_total = sum(slot.calcular_pontuacao() for slot in slots)
-        cartas_jogadas = sum(slot.get_quantidade_cartas() for slot in slots)
+    from src.game.state import GameState
+    from src.game.state_tree import GameStateNode, GameStateTree
 
-        estatisticas_por_cor: Dict[str, dict] = {}
-        nomes_cores = Colors.get_color_names()
-        for slot in slots:
-            cor_nome = nomes_cores.get(slot.cor, 'Desconhecida')
-            estatisticas_por_cor[cor_nome] = {
-                'cartas': slot.get_quantidade_cartas(),
-                'pontuacao': slot.calcular_pontuacao(),
-            }
-
-        pontuacao_j1 = sum(slot.calcular_pontuacao()
-                           for slot in self.state.get_player_slots(1))
-        pontuacao_j2 = sum(slot.calcular_pontuacao()
-                           for slot in self.state.get_player_slots(2))
-
-        return {
-            'pontuacao_total': pontuacao_total,
-            'pontuacao_j1': pontuacao_j1,
-            'pontuacao_j2': pontuacao_j2,
-            'cartas_jogadas': cartas_jogadas,
-            'cartas_mao_j1': len(self.state.get_player_hand(1)),
-            'cartas_mao_j2': len(self.state.get_player_hand(2)),
-            'por_cor': estatisticas_por_cor,
-            'turno': self.state.turn_manager.get_status_turno(),
-            'deck': self.state.deck_manager.get_estatisticas_deck(),
-        }
-
-    @staticmethod
-    def _mensagem_carta_jogada(carta: Carta) -> str:
-        nomes_cores = Colors.get_color_names()
-        cor_nome = nomes_cores.get(carta.cor, 'Desconhecida')
-        if carta.tipo_carta == 'investimento':
-            return f'Investimento {cor_nome} jogado!'
-        return f'Carta {carta.numero} {cor_nome} jogada!'
+CANAL_ARVORE = 'arvore'
+CANAL_IA = 'ia'
 
 
 class GameApp:
-    def __init__(self, game_manager: GameManager):
+    def __init__(self, game_manager: GameManager, ia: bool = AIConfig.ENABLED):
         pygame.init()
 
         self.game_manager = game_manager
@@ -261,10 +55,18 @@ class GameApp:
         self.slots: List[SlotCarta] = []
         self.slots_jogador1: List[SlotCarta] = []
         self.slots_jogador2: List[SlotCarta] = []
-        self.cartas_mao_jogador1: List[Carta] = []
-        self.cartas_mao_jogador2: List[Carta] = []
+        self.cartas_mao_jogador1: List[int] = []
+        self.cartas_mao_jogador2: List[int] = []
+        self.cartas_view: Dict[int, Carta] = {
+            carta: Carta(carta) for carta in range(TOTAL_CARTAS)}
 
         self.state_tree: Optional["GameStateTree"] = None
+        self.tarefas = GerenciadorTarefas()
+        self.jogador_ia: Optional[int] = AIConfig.PLAYER if ia else None
+        self.busca_ia: Optional[MCTS] = None
+        self.busca_iterativa = BuscaIterativa()
+        self.reproducao: Optional[RegistroPartida] = None
+        self.passos_reproducao: List[UndoToken] = []
 
         self._sync_state_references()
         self._inicializar_areas_descarte()
@@ -295,17 +97,22 @@ class GameApp:
         for indice, carta in enumerate(mao):
             if indice < len(posicoes):
                 x, y = posicoes[indice]
-                carta.mover_para(x, y)
+                self.cartas_view[carta].mover_para(x, y)
+
+    def _views_da_mao(self, mao: List[int]) -> List[Carta]:
+        return [self.cartas_view[carta] for carta in mao]
 
     def _init_state_tree(self) -> None:
-        from src.game.state_tree import GameStateTree
+        self.tarefas.enviar(CANAL_ARVORE, 'Criar árvore', self._criar_arvore,
+                            self.game_manager.state.clone())
 
-        self.state_tree = GameStateTree(self.game_manager.state)
+    def _criar_arvore(self, _tarefa: Tarefa, estado: "GameState") -> None:
+        from src.game.state_tree import GameStateTree
 
-    def _reset_state_tree(self) -> None:
-        self._init_state_tree()
+        self.state_tree = GameStateTree(estado)
 
-    def _advance_tree_if_matches(self, matcher: Callable[["GameMove"], bool]) -> None:
+    def _advance_tree_if_matches(self, _tarefa: Tarefa, matcher: Callable[["GameMove"], bool],
+                                 estado: "GameState") -> None:
         if not self.state_tree:
             return
 
@@ -315,7 +122,7 @@ class GameApp:
                 try:
                     self.state_tree.advance(idx)
                 except ValueError:
-                    self._reset_state_tree()
+                    self._criar_arvore(_tarefa, estado)
                 return
 
         for idx, child in enumerate(self.state_tree.current.children):
@@ -323,16 +130,13 @@ class GameApp:
                 try:
                     self.state_tree.advance_to_child(idx)
                 except ValueError:
-                    self._reset_state_tree()
+                    self._criar_arvore(_tarefa, estado)
                 return
 
-        self._reset_state_tree()
+        self._criar_arvore(_tarefa, estado)
 
-    def _registrar_movimento_arvore(self, tipo: str, carta: Optional[Carta] = None,
+    def _registrar_movimento_arvore(self, tipo: str, carta: Optional[int] = None,
                                     cor: Optional[Tuple[int, int, int]] = None) -> None:
-        if not self.state_tree:
-            return
-
         nomes_cores = Colors.get_color_names()
 
         def matcher(move: "GameMove") -> bool:
@@ -340,15 +144,15 @@ class GameApp:
                 return False
 
             if tipo == "play":
-                if not carta or cor is None:
+                if carta is None or cor is None:
                     return False
-                descricao = f"Jogar {self._descricao_carta(carta)} em {nomes_cores.get(cor, '?')}"
+                descricao = f"Jogar {descricao_carta(carta)} em {nomes_cores.get(cor, '?')}"
                 return move.descricao == descricao
 
             if tipo == "discard":
-                if not carta or cor is None:
+                if carta is None or cor is None:
                     return False
-                descricao = f"Descartar {self._descricao_carta(carta)} em {nomes_cores.get(cor, '?')}"
+                descricao = f"Descartar {descricao_carta(carta)} em {nomes_cores.get(cor, '?')}"
                 return move.descricao == descricao
 
             if tipo == "draw_deck":
@@ -362,11 +166,8 @@ class GameApp:
 
             return False
 
-        self._advance_tree_if_matches(matcher)
-
-    @staticmethod
-    def _descricao_carta(carta: Carta) -> str:
-        return "INV" if carta.tipo_carta == "investimento" else str(carta.numero)
+        self.tarefas.enviar(CANAL_ARVORE, 'Registrar jogada', self._advance_tree_if_matches,
+                            matcher, self.game_manager.state.clone())
 
     def _desfazer_jogada(self) -> None:
         if not self.state_tree:
@@ -374,13 +175,27 @@ class GameApp:
                 'Árvore indisponível.')
             return
 
-        no_atual = self.state_tree.rewind()
-        if not no_atual:
+        self.tarefas.cancelar(CANAL_IA)
+        self._encerrar_reproducao()
+        self.tarefas.enviar(CANAL_ARVORE, 'Desfazer jogada', self._voltar_arvore,
+                            self.jogador_ia, ao_concluir=self._carregar_estado_desfeito)
+
+    def _voltar_arvore(self, _tarefa: Tarefa, jogador_ia: Optional[int]) -> Optional["GameState"]:
+        no_atual: Optional["GameStateNode"] = self.state_tree.rewind()
+        while no_atual and no_atual.state.turn_manager.jogador_atual == jogador_ia:
+            anterior = self.state_tree.rewind()
+            if not anterior:
+                break
+            no_atual = anterior
+        return no_atual.state.clone() if no_atual else None
+
+    def _carregar_estado_desfeito(self, estado: Optional["GameState"]) -> None:
+        if estado is None:
             self.ui_manager.adicionar_mensagem_temporaria(
                 'Nenhuma jogada para desfazer.')
             return
 
-        self.game_manager.load_state(no_atual.state)
+        self.game_manager.load_state(estado)
         self._sync_state_references()
         self._reposicionar_mao(1)
         self._reposicionar_mao(2)
@@ -395,23 +210,40 @@ class GameApp:
                 'Árvore indisponível.')
             return
 
-        try:
-            from src.game.state_tree_visualizer import render_state_tree
+        base_dir = Path(__file__).resolve().parents[2]
+        destino = base_dir / 'files' / 'state_tree.png'
+        self.tarefas.enviar(CANAL_ARVORE, 'Renderizar árvore', self._exportar_arvore, destino,
+                            ao_concluir=self._arvore_exportada,
+                            ao_progresso=self._progresso_exportacao)
+        self.ui_manager.adicionar_mensagem_temporaria('Renderizando árvore...')
 
-            base_dir = Path(__file__).resolve().parents[2]
-            destino = base_dir / 'files' / 'state_tree.png'
-            destino.parent.mkdir(parents=True, exist_ok=True)
-            caminho = render_state_tree(self.state_tree, destino)
-            self.ui_manager.adicionar_mensagem_temporaria(
-                f'Árvore salva em {caminho.name}'
-            )
-        except Exception as exc:
-            print(f'Erro ao renderizar árvore de estados: {exc!r}')
+    def _exportar_arvore(self, tarefa: Tarefa, destino: Path) -> Path:
+        from src.game.state_tree_visualizer import render_state_tree
+
+        destino.parent.mkdir(parents=True, exist_ok=True)
+        return render_state_tree(self.state_tree, destino, tarefa.reportar)
+
+    def _progresso_exportacao(self, tarefa: Tarefa) -> None:
+        if tarefa.mensagem:
             self.ui_manager.adicionar_mensagem_temporaria(
-                'Erro ao renderizar árvore. Verifique o console.'
-            )
+                f'{tarefa.mensagem} ({tarefa.progresso:.0%})', duracao=60)
+
+    def _arvore_exportada(self, caminho: Path) -> None:
+        self.ui_manager.adicionar_mensagem_temporaria(
+            f'Árvore salva em {caminho.name}'
+        )
+
+    def _atualizar_tarefas(self) -> None:
+        for tarefa in self.tarefas.coletar():
+            if tarefa.status == FALHOU:
+                print(f'Erro na tarefa "{tarefa.nome}": {tarefa.erro!r}')
+                self.ui_manager.adicionar_mensagem_temporaria(
+                    f'Erro em "{tarefa.nome}". Verifique o console.'
+                )
 
     def _novo_jogo(self, seed: Optional[int] = None) -> None:
+        self.tarefas.cancelar(CANAL_IA)
+        self._encerrar_reproducao()
         self.game_manager.start_new_game(seed=seed)
         self._sync_state_references()
         self._reposicionar_mao(1)
@@ -426,6 +258,13 @@ class GameApp:
         if evento.button != 1:
             return
 
+        if self._vez_da_ia():
+            self.ui_manager.adicionar_mensagem_temporaria('Aguarde a IA!')
+            return
+        if self.reproducao is not None:
+            self.ui_manager.adicionar_mensagem_temporaria('Reprodução: use as setas ou R.')
+            return
+
         pos_mouse = pygame.mouse.get_pos()
         jogador_atual = self.game_manager.get_jogador_atual()
 
@@ -442,11 +281,12 @@ class GameApp:
         mao_atual = self.game_manager.get_hand(jogador_atual)
 
         for carta in reversed(mao_atual):
-            if carta.contem_ponto(pos_mouse):
-                self.carta_sendo_arrastada = carta
-                self.posicao_original = (carta.x, carta.y)
+            view = self.cartas_view[carta]
+            if view.contem_ponto(pos_mouse):
+                self.carta_sendo_arrastada = view
+                self.posicao_original = (view.x, view.y)
                 self.jogador_carta_arrastada = jogador_atual
-                carta.iniciar_arraste(pos_mouse)
+                view.iniciar_arraste(pos_mouse)
 
                 mao_atual.remove(carta)
                 mao_atual.append(carta)
@@ -461,9 +301,9 @@ class GameApp:
         jogador = self.jogador_carta_arrastada
 
         for slot in self.slots:
-            if slot.get_rect().collidepoint(pos_mouse):
+            if slot.contem_ponto(pos_mouse):
                 sucesso, mensagem = self.game_manager.tentar_jogar_em_expedicao(
-                    self.carta_sendo_arrastada, slot.cor
+                    self.carta_sendo_arrastada.card_id, slot.cor
                 )
                 if mensagem:
                     self.ui_manager.adicionar_mensagem_temporaria(mensagem)
@@ -473,7 +313,7 @@ class GameApp:
                         self._reposicionar_mao(jogador)
                     self._registrar_movimento_arvore(
                         tipo="play",
-                        carta=self.carta_sendo_arrastada,
+                        carta=self.carta_sendo_arrastada.card_id,
                         cor=slot.cor
                     )
                 break
@@ -482,7 +322,7 @@ class GameApp:
             for cor, area in self.areas_descarte.items():
                 if area.collidepoint(pos_mouse):
                     sucesso, mensagem = self.game_manager.tentar_descartar_carta(
-                        self.carta_sendo_arrastada
+                        self.carta_sendo_arrastada.card_id
                     )
                     if mensagem:
                         self.ui_manager.adicionar_mensagem_temporaria(mensagem)
@@ -493,7 +333,7 @@ class GameApp:
                             self._reposicionar_mao(jogador)
                         self._registrar_movimento_arvore(
                             tipo="discard",
-                            carta=self.carta_sendo_arrastada,
+                            carta=self.carta_sendo_arrastada.card_id,
                             cor=cor
                         )
                     break
@@ -524,14 +364,180 @@ class GameApp:
             self.ui_manager.adicionar_mensagem_temporaria(
                 f'Estatísticas {status}!')
         elif evento.key == pygame.K_d:
-            self._comprar_carta_deck()
-        elif evento.key == pygame.K_SPACE:
+            if not self._vez_da_ia() and self.reproducao is None:
+                self._comprar_carta_deck()
+        elif evento.key == pygame.K_SPACE and not self._vez_da_ia() and self.reproducao is None:
             self.game_manager.forcar_proxima_fase()
             self.ui_manager.adicionar_mensagem_temporaria('Fase avançada!')
         elif evento.key == pygame.K_z:
             self._desfazer_jogada()
         elif evento.key == pygame.K_t:
             self._salvar_visualizacao_arvore()
+        elif evento.key == pygame.K_i:
+            self._alternar_ia()
+        elif evento.key == pygame.K_RETURN and self._vez_da_ia():
+            self._interromper_ia()
+        elif evento.key == pygame.K_RIGHT and self.reproducao is not None:
+            self._avancar_reproducao()
+        elif evento.key == pygame.K_LEFT and self.reproducao is not None:
+            self._voltar_reproducao()
+
+    def carregar_reproducao(self, registro: RegistroPartida, jogada: Optional[int] = None) -> None:
+        self.tarefas.cancelar(CANAL_IA)
+        self.jogador_ia = None
+        self.busca_ia = None
+        self.reproducao = registro
+        self.passos_reproducao = []
+        self.game_manager.start_new_game(seed=registro.seed)
+
+        total = len(registro.movimentos)
+        alvo = total if jogada is None else max(0, min(jogada, total))
+        while len(self.passos_reproducao) < alvo:
+            if not self._aplicar_passo_reproducao():
+                break
+        self._sync_state_references()
+        self._reposicionar_mao(1)
+        self._reposicionar_mao(2)
+        self._init_state_tree()
+        self.ui_manager.adicionar_mensagem_temporaria(
+            f'Reprodução da seed {registro.seed}: jogada {len(self.passos_reproducao)}/{total} '
+            f'(setas para navegar)')
+
+    def _aplicar_passo_reproducao(self) -> Optional[GameMove]:
+        codigo = self.reproducao.movimentos[len(self.passos_reproducao)]
+        jogador = self.game_manager.get_jogador_atual()
+        try:
+            move = GameMove.from_codigo(codigo, jogador, self.game_manager.get_hand(jogador))
+            self.passos_reproducao.append(self.game_manager.apply(move))
+        except (IndexError, ValueError) as exc:
+            self.ui_manager.adicionar_mensagem_temporaria(f'Reprodução interrompida: {exc}')
+            self._encerrar_reproducao()
+            return None
+        return move
+
+    def _avancar_reproducao(self) -> None:
+        total = len(self.reproducao.movimentos)
+        if len(self.passos_reproducao) >= total:
+            self.ui_manager.adicionar_mensagem_temporaria('Fim da reprodução.')
+            return
+
+        move = self._aplicar_passo_reproducao()
+        if move is None:
+            return
+        carta = self.passos_reproducao[-1].carta if move.carta_index is not None else None
+        self._reposicionar_mao(move.jogador)
+        self._registrar_movimento_arvore(move.tipo, carta, move.destino_cor)
+        self.ui_manager.adicionar_mensagem_temporaria(
+            f'Jogada {len(self.passos_reproducao)}/{total}: {move.descricao}')
+
+    def _voltar_reproducao(self) -> None:
+        if not self.passos_reproducao:
+            self.ui_manager.adicionar_mensagem_temporaria('Início da reprodução.')
+            return
+
+        token = self.passos_reproducao.pop()
+        self.game_manager.undo(token)
+        self._reposicionar_mao(token.move.jogador)
+        self._init_state_tree()
+        self.ui_manager.adicionar_mensagem_temporaria(
+            f'Jogada {len(self.passos_reproducao)}/{len(self.reproducao.movimentos)}')
+
+    def _encerrar_reproducao(self) -> None:
+        self.reproducao = None
+        self.passos_reproducao = []
+
+    def _alternar_ia(self) -> None:
+        self.jogador_ia = None if self.jogador_ia is not None else AIConfig.PLAYER
+        self.busca_ia = None
+        self.tarefas.cancelar(CANAL_IA)
+        status = 'ativada' if self.jogador_ia is not None else 'desativada'
+        self.ui_manager.adicionar_mensagem_temporaria(f'IA {status}!')
+
+    def _vez_da_ia(self) -> bool:
+        return (self.jogador_ia is not None and
+                self.game_manager.get_jogador_atual() == self.jogador_ia and
+                not self.game_manager.get_turn_manager().jogo_terminado)
+
+    def _atualizar_ia(self) -> None:
+        if not self._vez_da_ia() or self.carta_sendo_arrastada:
+            return
+        if AIConfig.ALGORITHM == 'iterativo':
+            self._iniciar_busca_iterativa()
+            return
+
+        estado = self.game_manager.state
+        if self.busca_ia is None or self.busca_ia.estado.zobrist != estado.zobrist:
+            self.busca_ia = self._criar_busca(CompactState.from_game_state(estado))
+
+        busca = self.busca_ia
+        restantes = None
+        if AIConfig.MAX_ITERATIONS:
+            restantes = AIConfig.MAX_ITERATIONS - busca.iteracoes
+        busca.buscar(tempo_limite=AIConfig.FRAME_BUDGET, max_iteracoes=restantes)
+
+        if busca.tempo >= AIConfig.TIME_BUDGET or (
+                restantes is not None and busca.iteracoes >= AIConfig.MAX_ITERATIONS):
+            self._executar_movimento_ia()
+
+    def _criar_busca(self, estado: CompactState) -> MCTS:
+        if AIConfig.ALGORITHM == 'ismcts':
+            return ISMCTS(estado)
+        return MCTS(estado)
+
+    def _interromper_ia(self) -> None:
+        if AIConfig.ALGORITHM == 'iterativo':
+            self.tarefas.interromper(CANAL_IA)
+        elif self.busca_ia is not None and self.busca_ia.iteracoes:
+            self._executar_movimento_ia()
+
+    def _iniciar_busca_iterativa(self) -> None:
+        if self.tarefas.ocupado(CANAL_IA):
+            return
+        estado = CompactState.from_game_state(self.game_manager.state)
+        self.tarefas.enviar(CANAL_IA, 'Busca da IA', self._buscar_iterativo, estado,
+                            ao_concluir=self._concluir_busca_iterativa)
+
+    def _buscar_iterativo(self, tarefa: Tarefa, estado: CompactState) -> Tuple[int, ResultadoIterativo]:
+        resultado = self.busca_iterativa.aprofundar(
+            estado, AIConfig.TIME_BUDGET, cancelar=lambda: tarefa.interrompida)
+        return estado.zobrist, resultado
+
+    def _concluir_busca_iterativa(self, resultado: Tuple[int, ResultadoIterativo]) -> None:
+        zobrist, busca = resultado
+        if (not self._vez_da_ia() or zobrist != self.game_manager.state.zobrist or
+                busca.movimento is None):
+            return
+        self._aplicar_movimento_ia(
+            busca.movimento,
+            f'prof. {busca.profundidade}, {busca.nos_por_segundo:.0f} nós/s')
+
+    def _executar_movimento_ia(self) -> None:
+        busca = self.busca_ia
+        codigo = busca.melhor_movimento()
+        if codigo is None:
+            return
+
+        if self._aplicar_movimento_ia(
+                codigo, f'{busca.iteracoes} it, {busca.iteracoes_por_segundo():.0f} it/s'):
+            busca.avancar(codigo)
+
+    def _aplicar_movimento_ia(self, codigo: int, detalhes: str) -> bool:
+        jogador = self.jogador_ia
+        mao = self.game_manager.get_hand(jogador)
+        move = GameMove.from_codigo(codigo, jogador, mao)
+        carta = mao[move.carta_index] if move.carta_index is not None else None
+        try:
+            self.game_manager.apply(move)
+        except ValueError as exc:
+            self.jogador_ia = None
+            self.busca_ia = None
+            self.ui_manager.adicionar_mensagem_temporaria(f'IA desativada: {exc}')
+            return False
+
+        self._reposicionar_mao(jogador)
+        self._registrar_movimento_arvore(move.tipo, carta, move.destino_cor)
+        self.ui_manager.adicionar_mensagem_temporaria(f'IA: {move.descricao} ({detalhes})')
+        return True
 
     def _comprar_carta_descarte(self, cor) -> None:
         jogador = self.game_manager.get_jogador_atual()
@@ -539,7 +545,7 @@ class GameApp:
             cor)
         if mensagem:
             self.ui_manager.adicionar_mensagem_temporaria(mensagem)
-        if sucesso and carta:
+        if sucesso and carta is not None:
             self._reposicionar_mao(jogador)
             self._registrar_movimento_arvore(
                 tipo="draw_discard",
@@ -551,7 +557,7 @@ class GameApp:
         sucesso, carta, mensagem = self.game_manager.comprar_carta_deck()
         if mensagem:
             self.ui_manager.adicionar_mensagem_temporaria(mensagem)
-        if sucesso and carta:
+        if sucesso and carta is not None:
             self._reposicionar_mao(jogador)
             self._registrar_movimento_arvore(tipo="draw_deck")
 
@@ -569,17 +575,21 @@ class GameApp:
                 self._processar_evento_teclado(evento)
 
     def _atualizar_logica(self) -> None:
+        self._atualizar_tarefas()
+
         for slot in self.slots:
             slot.destacar(False)
 
         if self.carta_sendo_arrastada:
             pos_mouse = pygame.mouse.get_pos()
             for slot in self.slots:
-                if slot.get_rect().collidepoint(pos_mouse):
-                    if self.game_manager.validar_jogada_em_slot(self.carta_sendo_arrastada, slot):
+                if slot.contem_ponto(pos_mouse):
+                    if self.game_manager.validar_jogada_em_slot(self.carta_sendo_arrastada.card_id, slot):
                         slot.destacar(True)
                     break
 
+        self._atualizar_ia()
+
         mensagem_fim = self.game_manager.checar_fim_de_jogo()
         if mensagem_fim:
             self.ui_manager.adicionar_mensagem_temporaria(mensagem_fim)
@@ -588,8 +598,8 @@ class GameApp:
         pos_mouse = pygame.mouse.get_pos() if self.carta_sendo_arrastada else None
 
         self.ui_manager.renderizar_completo(
-            cartas_mao_jogador1=self.cartas_mao_jogador1,
-            cartas_mao_jogador2=self.cartas_mao_jogador2,
+            cartas_mao_jogador1=self._views_da_mao(self.cartas_mao_jogador1),
+            cartas_mao_jogador2=self._views_da_mao(self.cartas_mao_jogador2),
             slots=self.slots,
             slots_jogador1=self.slots_jogador1,
             slots_jogador2=self.slots_jogador2,
@@ -613,11 +623,19 @@ class GameApp:
         self._finalizar()
 
     def _finalizar(self) -> None:
+        self.tarefas.encerrar()
         pygame.quit()
 
 
 class GameFactory:
     @staticmethod
-    def criar_jogo_padrao(seed: Optional[int] = DEFAULT_RANDOM_SEED) -> 'GameApp':
+    def criar_jogo_padrao(seed: Optional[int] = DEFAULT_RANDOM_SEED,
+                          ia: bool = AIConfig.ENABLED) -> 'GameApp':
         manager = GameManager.create_default(seed=seed)
-        return GameApp(manager)
+        return GameApp(manager, ia)
+
+    @staticmethod
+    def reproduzir_partida(registro: RegistroPartida, jogada: Optional[int] = None) -> 'GameApp':
+        jogo = GameApp(GameManager.create_default(seed=registro.seed))
+        jogo.carregar_reproducao(registro, jogada)
+        return jogo
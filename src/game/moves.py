@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from config.settings import Colors
+from src.models.card_codes import CORES, COR_CARTA, INDICE_COR, INDICE_COR_CARTA, descricao_carta
+
+# Código de movimento em um byte: tipo (2 bits) | índice na mão (3 bits) | cor (3 bits).
+MOVIMENTO_JOGAR = 0
+MOVIMENTO_DESCARTAR = 1
+MOVIMENTO_COMPRAR_DECK = 2
+MOVIMENTO_COMPRAR_DESCARTE = 3
+
+TIPOS_MOVIMENTO: Tuple[str, ...] = ("play", "discard", "draw_deck", "draw_discard")
+CODIGO_TIPO = {tipo: codigo for codigo, tipo in enumerate(TIPOS_MOVIMENTO)}
+
+NOMES_CORES: Tuple[str, ...] = tuple(
+    Colors.get_color_names().get(cor, '?') for cor in CORES)
+
+
+def codificar_movimento(tipo: int, indice_mao: int = 0, indice_cor: int = 0) -> int:
+    return (tipo << 6) | (indice_mao << 3) | indice_cor
+
+
+def tipo_do_movimento(codigo: int) -> int:
+    return codigo >> 6
+
+
+def indice_mao_do_movimento(codigo: int) -> int:
+    return (codigo >> 3) & 7
+
+
+def indice_cor_do_movimento(codigo: int) -> int:
+    return codigo & 7
+
+
+def descrever_movimento(codigo: int, carta: Optional[int] = None) -> str:
+    tipo = codigo >> 6
+    nome_cor = NOMES_CORES[codigo & 7]
+    if tipo == MOVIMENTO_JOGAR:
+        return f"Jogar {descricao_carta(carta)} em {nome_cor}"
+    if tipo == MOVIMENTO_DESCARTAR:
+        return f"Descartar {descricao_carta(carta)} em {nome_cor}"
+    if tipo == MOVIMENTO_COMPRAR_DECK:
+        return "Comprar do deck"
+    return f"Comprar do descarte {nome_cor}"
+
+
+@dataclass(frozen=True)
+class GameMove:
+    tipo: str
+    jogador: int
+    carta_index: Optional[int] = None
+    destino_cor: Optional[Tuple[int, int, int]] = None
+    descricao: str = ""
+
+    @property
+    def codigo(self) -> int:
+        tipo = CODIGO_TIPO[self.tipo]
+        indice_mao = self.carta_index or 0
+        indice_cor = INDICE_COR[self.destino_cor] if self.destino_cor is not None else 0
+        return codificar_movimento(tipo, indice_mao, indice_cor)
+
+    @classmethod
+    def from_codigo(cls, codigo: int, jogador: int, mao) -> "GameMove":
+        tipo = codigo >> 6
+        if tipo <= MOVIMENTO_DESCARTAR:
+            indice_mao = (codigo >> 3) & 7
+            carta = mao[indice_mao]
+            return cls(tipo=TIPOS_MOVIMENTO[tipo], jogador=jogador,
+                       carta_index=indice_mao, destino_cor=COR_CARTA[carta],
+                       descricao=descrever_movimento(codigo, carta))
+        if tipo == MOVIMENTO_COMPRAR_DECK:
+            return cls(tipo=TIPOS_MOVIMENTO[tipo], jogador=jogador,
+                       descricao=descrever_movimento(codigo))
+        return cls(tipo=TIPOS_MOVIMENTO[tipo], jogador=jogador,
+                   destino_cor=CORES[codigo & 7],
+                   descricao=descrever_movimento(codigo))
+
+
+def gerar_movimentos(state, destino: Optional[List[int]] = None) -> List[int]:
+    movimentos = destino if destino is not None else []
+    turn_manager = state.turn_manager
+    jogador = turn_manager.jogador_atual
+
+    if turn_manager.pode_jogar_carta(jogador):
+        slots = state.get_player_slots(jogador)
+        for indice, carta in enumerate(state.get_player_hand(jogador)):
+            indice_cor = INDICE_COR_CARTA[carta]
+            codigo = (indice << 3) | indice_cor
+            if slots[indice_cor].pode_aceitar_carta(carta):
+                movimentos.append(codigo)
+            movimentos.append((MOVIMENTO_DESCARTAR << 6) | codigo)
+
+    elif turn_manager.pode_comprar_carta(jogador):
+        if state.deck_manager.deck.cartas:
+            movimentos.append(MOVIMENTO_COMPRAR_DECK << 6)
+        for indice_cor, cor in enumerate(CORES):
+            if state.deck_manager.montes_descarte[cor].cartas:
+                movimentos.append((MOVIMENTO_COMPRAR_DESCARTE << 6) | indice_cor)
+
+    return movimentos
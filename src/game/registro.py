@@ -0,0 +1,127 @@
+import struct
+import zlib
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterator, Tuple, Union
+
+from src.core.game_manager import GameManager, UndoToken
+from src.game.moves import GameMove
+
+# Arquivo: MAGICA + versão, seguido das partidas. Cada partida é
+# seed (int64) | quantidade de movimentos (uint16) | um byte por movimento | CRC32.
+MAGICA = b'LCRG'
+VERSAO_REGISTRO = 1
+MAX_MOVIMENTOS = (1 << 16) - 1
+SEED_MINIMA = -(1 << 63)
+SEED_MAXIMA = (1 << 63) - 1
+
+CABECALHO_ARQUIVO = struct.Struct('<4sB3x')
+_CRC = struct.Struct('<I')
+# Versões antigas continuam aqui para que arquivos já gravados sejam lidos.
+CABECALHOS_PARTIDA: Dict[int, struct.Struct] = {
+    1: struct.Struct('<qH'),
+}
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class RegistroCorrompido(ValueError):
+    pass
+
+
+def validar_seed(seed: int) -> None:
+    if not SEED_MINIMA <= seed <= SEED_MAXIMA:
+        raise ValueError(f"Seed {seed} fora do intervalo de 64 bits [{SEED_MINIMA}, {SEED_MAXIMA}]")
+
+
+@dataclass
+class RegistroPartida:
+    seed: int
+    movimentos: bytearray = field(default_factory=bytearray)
+
+    def __post_init__(self) -> None:
+        validar_seed(self.seed)
+
+    def adicionar(self, codigo: int) -> None:
+        if len(self.movimentos) >= MAX_MOVIMENTOS:
+            raise ValueError(f"Partida com mais de {MAX_MOVIMENTOS} movimentos")
+        self.movimentos.append(codigo)
+
+    def para_bytes(self) -> bytes:
+        validar_seed(self.seed)
+        corpo = CABECALHOS_PARTIDA[VERSAO_REGISTRO].pack(self.seed, len(self.movimentos)) + \
+            bytes(self.movimentos)
+        return corpo + _CRC.pack(zlib.crc32(corpo))
+
+
+def tamanho_registro(movimentos: int, versao: int = VERSAO_REGISTRO) -> int:
+    return CABECALHOS_PARTIDA[versao].size + movimentos + _CRC.size
+
+
+def ler_cabecalho(arquivo: BinaryIO) -> int:
+    dados = arquivo.read(CABECALHO_ARQUIVO.size)
+    if len(dados) < CABECALHO_ARQUIVO.size:
+        raise RegistroCorrompido("Arquivo de partidas sem cabeçalho")
+    magica, versao = CABECALHO_ARQUIVO.unpack(dados)
+    if magica != MAGICA:
+        raise RegistroCorrompido("Arquivo não é um registro de partidas")
+    if versao not in CABECALHOS_PARTIDA:
+        raise ValueError(f"Versão de registro não suportada: {versao}")
+    return versao
+
+
+def decodificar_registro(dados: Buffer, deslocamento: int = 0,
+                         versao: int = VERSAO_REGISTRO) -> Tuple[RegistroPartida, int]:
+    cabecalho = CABECALHOS_PARTIDA[versao]
+    fim_cabecalho = deslocamento + cabecalho.size
+    if fim_cabecalho > len(dados):
+        raise RegistroCorrompido("Partida truncada")
+    seed, quantidade = cabecalho.unpack_from(dados, deslocamento)
+    fim = fim_cabecalho + quantidade
+    if fim + _CRC.size > len(dados):
+        raise RegistroCorrompido("Partida truncada")
+    (crc,) = _CRC.unpack_from(dados, fim)
+    if zlib.crc32(dados[deslocamento:fim]) != crc:
+        raise RegistroCorrompido("CRC inválido na partida")
+    return RegistroPartida(seed, bytearray(dados[fim_cabecalho:fim])), fim + _CRC.size
+
+
+class EscritorRegistros:
+    def __init__(self, arquivo: BinaryIO):
+        self.arquivo = arquivo
+        self.partidas = 0
+        if arquivo.tell() == 0:
+            arquivo.write(CABECALHO_ARQUIVO.pack(MAGICA, VERSAO_REGISTRO))
+
+    def escrever(self, registro: RegistroPartida) -> int:
+        deslocamento = self.arquivo.tell()
+        self.arquivo.write(registro.para_bytes())
+        self.partidas += 1
+        return deslocamento
+
+
+def ler_registros(arquivo: BinaryIO) -> Iterator[RegistroPartida]:
+    versao = ler_cabecalho(arquivo)
+    cabecalho = CABECALHOS_PARTIDA[versao]
+    while True:
+        dados = arquivo.read(cabecalho.size)
+        if not dados:
+            return
+        if len(dados) == cabecalho.size:
+            _, quantidade = cabecalho.unpack(dados)
+            dados += arquivo.read(quantidade + _CRC.size)
+        yield decodificar_registro(dados, 0, versao)[0]
+
+
+def reproduzir(registro: RegistroPartida, game_manager: GameManager) -> Iterator[UndoToken]:
+    game_manager.start_new_game(registro.seed)
+    for codigo in registro.movimentos:
+        jogador = game_manager.get_jogador_atual()
+        move = GameMove.from_codigo(codigo, jogador, game_manager.get_hand(jogador))
+        yield game_manager.apply(move)
+
+
+def carregar_partida(registro: RegistroPartida) -> GameManager:
+    game_manager = GameManager.create_default(seed=registro.seed)
+    for _ in reproduzir(registro, game_manager):
+        pass
+    return game_manager
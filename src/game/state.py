@@ -1,7 +1,6 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
-from src.models.carta import Carta
 from src.models.slot_carta import SlotCarta
 from src.models.deck import DeckManager
 from src.game.turn_manager import TurnManager
@@ -9,8 +8,9 @@ from src.game.turn_manager import TurnManager
 
 @dataclass
 class PlayerState:
-    hand: List[Carta] = field(default_factory=list)
+    hand: List[int] = field(default_factory=list)
     slots: List[SlotCarta] = field(default_factory=list)
+    conhecidas: int = 0
 
 
 @dataclass
@@ -20,69 +20,31 @@ class GameState:
     shared_slots: List[SlotCarta] = field(default_factory=list)
     players: Dict[int, PlayerState] = field(default_factory=dict)
     fim_jogo_processado: bool = False
+    zobrist: int = 0
 
     def reset(self) -> None:
         self.shared_slots = []
         self.players = {}
         self.fim_jogo_processado = False
+        self.zobrist = 0
 
     def clone(self) -> "GameState":
-        card_map: Dict[Carta, Carta] = {}
-
-        def garantir_clone(carta: Carta) -> Carta:
-            if carta not in card_map:
-                card_map[carta] = carta.clone()
-            return card_map[carta]
-
-        for player_state in self.players.values():
-            for carta in player_state.hand:
-                garantir_clone(carta)
-            for slot in player_state.slots:
-                for carta in slot.cartas:
-                    garantir_clone(carta)
-                for carta in slot.cartas_jogador1:
-                    garantir_clone(carta)
-                for carta in slot.cartas_jogador2:
-                    garantir_clone(carta)
-
-        for slot in self.shared_slots:
-            for carta in slot.cartas:
-                garantir_clone(carta)
-            for carta in slot.cartas_jogador1:
-                garantir_clone(carta)
-            for carta in slot.cartas_jogador2:
-                garantir_clone(carta)
-
-        for carta in self.deck_manager.deck.cartas:
-            garantir_clone(carta)
-
-        for monte in self.deck_manager.montes_descarte.values():
-            for carta in monte.cartas:
-                garantir_clone(carta)
-
-        deck_clone = self.deck_manager.clone(card_map)
-        turn_clone = self.turn_manager.clone()
-        shared_slots_clone = [slot.clone(card_map)
-                              for slot in self.shared_slots]
-
         players_clone: Dict[int, PlayerState] = {}
         for jogador, player_state in self.players.items():
-            hand_clone = [card_map[carta] for carta in player_state.hand]
-            slots_clone = [slot.clone(card_map)
-                           for slot in player_state.slots]
-            players_clone[jogador] = PlayerState(hand=hand_clone,
-                                                 slots=slots_clone)
-
-        novo_estado = GameState(
-            deck_manager=deck_clone,
-            turn_manager=turn_clone,
-            shared_slots=shared_slots_clone,
+            players_clone[jogador] = PlayerState(
+                hand=player_state.hand[:],
+                slots=[slot.clone() for slot in player_state.slots],
+                conhecidas=player_state.conhecidas)
+
+        return GameState(
+            deck_manager=self.deck_manager.clone(),
+            turn_manager=self.turn_manager.clone(),
+            shared_slots=[slot.clone() for slot in self.shared_slots],
             players=players_clone,
-            fim_jogo_processado=self.fim_jogo_processado
+            fim_jogo_processado=self.fim_jogo_processado,
+            zobrist=self.zobrist
         )
 
-        return novo_estado
-
     def configure_slots(self, colors: List[Tuple[int, int, int]],
                         positions: List[Tuple[int, int]]) -> None:
         self.shared_slots = []
@@ -98,12 +60,18 @@ class GameState:
                 player_slots.append(SlotCarta(x, y, cor))
             self.players[jogador] = PlayerState(hand=[], slots=player_slots)
 
-    def get_player_hand(self, jogador: int) -> List[Carta]:
+    def get_player_hand(self, jogador: int) -> List[int]:
         return self.players[jogador].hand
 
+    def get_cartas_conhecidas(self, jogador: int) -> int:
+        return self.players[jogador].conhecidas
+
     def get_player_slots(self, jogador: int) -> List[SlotCarta]:
         return self.players[jogador].slots
 
+    def calcular_pontuacao_jogador(self, jogador: int) -> int:
+        return sum(slot.calcular_pontuacao() for slot in self.players[jogador].slots)
+
     def find_shared_slot(self, cor) -> Optional[SlotCarta]:
         for slot in self.shared_slots:
             if slot.cor == cor:
@@ -1,26 +1,50 @@
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
-from config.settings import Colors, get_hand_positions
-from src.game.manager import GameManager
+from src.core.game_manager import GameManager
+from src.core.zobrist import TranspositionTable
+from src.game.moves import GameMove, gerar_movimentos
 from src.game.state import GameState
-from src.models.carta import Carta
 
+Assinatura = Tuple[int, int, Optional[int], bool]
 
-@dataclass(frozen=True)
-class GameMove:
-    tipo: str
-    jogador: int
-    carta_index: Optional[int] = None
-    destino_cor: Optional[Tuple[int, int, int]] = None
-    descricao: str = ""
+
+# Campos que o zobrist não cobre; estados com a mesma chave só são
+# reaproveitados quando eles também coincidem.
+def assinatura_estado(state: GameState) -> Assinatura:
+    return (state.get_cartas_conhecidas(1), state.get_cartas_conhecidas(2),
+            state.turn_manager.vencedor, state.fim_jogo_processado)
 
 
 @dataclass
 class PendingMove:
     move: GameMove
-    state: GameState
-    mensagem: Optional[str]
+    origem: GameState = field(repr=False)
+    mensagem: Optional[str] = None
+    zobrist: int = 0
+    assinatura: Optional[Assinatura] = None
+    transposicoes: Optional[TranspositionTable] = field(default=None, repr=False)
+    _state: Optional[GameState] = field(default=None, init=False, repr=False)
+
+    @property
+    def materializado(self) -> bool:
+        return self._state is not None
+
+    @property
+    def state(self) -> GameState:
+        if self._state is None and self.transposicoes is not None:
+            entrada = self.transposicoes.get(self.zobrist)
+            if entrada is not None and entrada[0] == self.assinatura:
+                self._state = entrada[1].clone()
+
+        if self._state is None:
+            gerente = GameManager(self.origem.clone())
+            gerente.apply(self.move)
+            self._state = gerente.state
+            if self.transposicoes is not None:
+                self.transposicoes.put(self.zobrist, (assinatura_estado(self._state),
+                                                      self._state.clone()))
+        return self._state
 
 
 @dataclass
@@ -40,7 +64,8 @@ class GameStateNode:
 
 
 class GameStateTree:
-    def __init__(self, estado_inicial: GameState):
+    def __init__(self, estado_inicial: GameState, capacidade_transposicoes: int = 1 << 12):
+        self.transposicoes = TranspositionTable(capacidade_transposicoes)
         self.root = GameStateNode(state=estado_inicial.clone())
         self.current = self.root
         self._prepare_pending_moves(self.root)
@@ -94,146 +119,28 @@ class GameStateTree:
         if not movimentos:
             return
 
+        gerente = GameManager(node.state)
         for movimento in movimentos:
             if any(child.move == movimento for child in node.children):
                 continue
             try:
-                proximo_estado, mensagem = self._simular_movimento(
-                    node.state, movimento)
+                token = gerente.apply(movimento)
             except ValueError:
                 continue
+            zobrist = node.state.zobrist
+            assinatura = assinatura_estado(node.state)
+            gerente.undo(token)
             node.pending_moves.append(
-                PendingMove(move=movimento, state=proximo_estado,
-                            mensagem=mensagem)
+                PendingMove(move=movimento, origem=node.state,
+                            mensagem=token.mensagem, zobrist=zobrist,
+                            assinatura=assinatura, transposicoes=self.transposicoes)
             )
 
     def _enumerar_movimentos(self, state: GameState) -> List[GameMove]:
-        movimentos: List[GameMove] = []
-        turn_manager = state.turn_manager
-        jogador = turn_manager.get_jogador_atual()
-
-        if turn_manager.pode_jogar_carta(jogador):
-            mao = state.get_player_hand(jogador)
-            slots_por_cor = {
-                slot.cor: slot for slot in state.get_player_slots(jogador)}
-            nomes_cores = Colors.get_color_names()
-
-            for indice, carta in enumerate(mao):
-                slot_destino = slots_por_cor.get(carta.cor)
-                if slot_destino and slot_destino.pode_aceitar_carta(carta, jogador):
-                    descricao = (
-                        f"Jogar {self._descricao_carta(carta)} em {nomes_cores.get(carta.cor, '?')}"
-                    )
-                    movimentos.append(
-                        GameMove(
-                            tipo="play",
-                            jogador=jogador,
-                            carta_index=indice,
-                            destino_cor=carta.cor,
-                            descricao=descricao
-                        )
-                    )
-
-                descricao_descartar = (
-                    f"Descartar {self._descricao_carta(carta)} em {nomes_cores.get(carta.cor, '?')}"
-                )
-                movimentos.append(
-                    GameMove(
-                        tipo="discard",
-                        jogador=jogador,
-                        carta_index=indice,
-                        destino_cor=carta.cor,
-                        descricao=descricao_descartar
-                    )
-                )
-
-        elif turn_manager.pode_comprar_carta(jogador):
-            if state.deck_manager.deck.tem_cartas():
-                movimentos.append(
-                    GameMove(
-                        tipo="draw_deck",
-                        jogador=jogador,
-                        descricao="Comprar do deck"
-                    )
-                )
-
-            nomes_cores = Colors.get_color_names()
-            for cor, monte in state.deck_manager.montes_descarte.items():
-                if not monte.esta_vazio():
-                    descricao = f"Comprar do descarte {nomes_cores.get(cor, '?')}"
-                    movimentos.append(
-                        GameMove(
-                            tipo="draw_discard",
-                            jogador=jogador,
-                            destino_cor=cor,
-                            descricao=descricao
-                        )
-                    )
-
-        return movimentos
-
-    def _simular_movimento(self, state: GameState, movimento: GameMove) -> Tuple[GameState, Optional[str]]:
-        estado_clone = state.clone()
-        gerente = GameManager(estado_clone)
-        mensagem = self._aplicar_movimento(gerente, movimento)
-        mensagem_fim = gerente.checar_fim_de_jogo()
-        if mensagem_fim:
-            mensagem = f"{mensagem} {mensagem_fim}" if mensagem else mensagem_fim
-        return gerente.state, mensagem
-
-    def _aplicar_movimento(self, manager: GameManager, movimento: GameMove) -> Optional[str]:
-        mensagem: Optional[str]
-
-        if movimento.tipo == "play":
-            carta = manager.get_hand(movimento.jogador)[movimento.carta_index]
-            sucesso, mensagem = manager.tentar_jogar_em_expedicao(
-                carta, movimento.destino_cor)
-            if not sucesso:
-                raise ValueError("Falha ao aplicar movimento de jogo de carta")
-            self._reposicionar_mao(manager, movimento.jogador)
-
-        elif movimento.tipo == "discard":
-            carta = manager.get_hand(movimento.jogador)[movimento.carta_index]
-            sucesso, mensagem = manager.tentar_descartar_carta(carta)
-            if not sucesso:
-                raise ValueError("Falha ao descartar carta no estado simulado")
-            self._reposicionar_mao(manager, movimento.jogador)
-
-        elif movimento.tipo == "draw_deck":
-            sucesso, carta, mensagem = manager.comprar_carta_deck()
-            if not sucesso:
-                raise ValueError(
-                    "Falha ao comprar carta do deck no estado simulado")
-            self._reposicionar_mao(manager, movimento.jogador)
-
-        elif movimento.tipo == "draw_discard":
-            sucesso, carta, mensagem = manager.comprar_carta_descarte(
-                movimento.destino_cor)
-            if not sucesso:
-                raise ValueError(
-                    "Falha ao comprar do descarte no estado simulado")
-            self._reposicionar_mao(manager, movimento.jogador)
-
-        else:
-            raise ValueError(
-                f"Tipo de movimento desconhecido: {movimento.tipo}")
-
-        return mensagem
-
-    @staticmethod
-    def _reposicionar_mao(manager: GameManager, jogador: int) -> None:
-        posicoes = get_hand_positions(jogador)
-        mao = manager.get_hand(jogador)
-        for indice, carta in enumerate(mao):
-            if indice < len(posicoes):
-                x, y = posicoes[indice]
-                carta.mover_para(x, y)
-
-    @staticmethod
-    def _descricao_carta(carta: Carta) -> str:
-        if carta.tipo_carta == "investimento":
-            return "INV"
-        return str(carta.numero)
+        jogador = state.turn_manager.get_jogador_atual()
+        mao = state.get_player_hand(jogador)
+        return [GameMove.from_codigo(codigo, jogador, mao)
+                for codigo in gerar_movimentos(state)]
 
     def render_tree(self) -> str:
         linhas: List[str] = []
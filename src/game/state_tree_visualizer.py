@@ -2,17 +2,25 @@ from __future__ import annotations
 
 from collections import deque
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Optional
 
-import matplotlib.pyplot as plt
 import networkx as nx
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from src.game.state_tree import GameStateNode, GameStateTree
 
 
-def render_state_tree(tree: GameStateTree, output_path: Path | str) -> Path:
+Progresso = Callable[[float, str], None]
+
+
+def render_state_tree(tree: GameStateTree, output_path: Path | str,
+                      progresso: Optional[Progresso] = None) -> Path:
     if tree.root is None:
         raise ValueError("Árvore de estados vazia")
+    if progresso is None:
+        progresso = _sem_progresso
 
     graph = nx.DiGraph()
     graph.graph['rankdir'] = 'TB'
@@ -59,23 +67,31 @@ def render_state_tree(tree: GameStateTree, output_path: Path | str) -> Path:
             graph.add_edge(current_id, node_id, pending=True)
             max_layer = max(max_layer, tree.current.depth + 1)
 
+    progresso(0.2, "Calculando layout")
     pos = _compute_layout(graph)
-    figura = plt.figure(figsize=_suggest_figsize(len(graph.nodes), max_layer))
+    figura = Figure(figsize=_suggest_figsize(len(graph.nodes), max_layer))
+    FigureCanvasAgg(figura)
+    ax = figura.add_subplot()
 
-    _draw_nodes(graph, pos)
-    _draw_edges(graph, pos)
-    _draw_labels(graph, pos)
+    progresso(0.4, "Desenhando")
+    _draw_nodes(graph, pos, ax)
+    _draw_edges(graph, pos, ax)
+    _draw_labels(graph, pos, ax)
 
-    plt.axis('off')
-    plt.tight_layout()
+    ax.axis('off')
+    figura.tight_layout()
 
+    progresso(0.6, "Salvando imagem")
     destino = Path(output_path)
     destino.parent.mkdir(parents=True, exist_ok=True)
     figura.savefig(destino, dpi=220, bbox_inches='tight')
-    plt.close(figura)
     return destino
 
 
+def _sem_progresso(_fracao: float, _mensagem: str) -> None:
+    pass
+
+
 def _build_node_label(node: GameStateNode) -> str:
     descricao = node.describe()
     status_turno = node.state.turn_manager.get_status_turno()
@@ -132,7 +148,7 @@ def _fallback_vertical_layout(graph: nx.DiGraph) -> Dict[str, tuple[float, float
     return positions
 
 
-def _draw_nodes(graph: nx.DiGraph, pos: Dict[str, tuple[float, float]]) -> None:
+def _draw_nodes(graph: nx.DiGraph, pos: Dict[str, tuple[float, float]], ax: Axes) -> None:
     palettes = {
         "visited": {"color": "#90caf9", "size": 1600, "shape": "o"},
         "current": {"color": "#ffcc80", "size": 1800, "shape": "o"},
@@ -153,10 +169,11 @@ def _draw_nodes(graph: nx.DiGraph, pos: Dict[str, tuple[float, float]]) -> None:
                 node_shape=style["shape"],
                 linewidths=1.2,
                 edgecolors="#37474f",
+                ax=ax,
             )
 
 
-def _draw_edges(graph: nx.DiGraph, pos: Dict[str, tuple[float, float]]) -> None:
+def _draw_edges(graph: nx.DiGraph, pos: Dict[str, tuple[float, float]], ax: Axes) -> None:
     real_edges = [(u, v) for u, v, data in graph.edges(
         data=True) if not data.get("pending")]
     pending_edges = [(u, v) for u, v, data in graph.edges(
@@ -172,6 +189,7 @@ def _draw_edges(graph: nx.DiGraph, pos: Dict[str, tuple[float, float]]) -> None:
             arrowstyle='-|>',
             arrowsize=14,
             edge_color="#455a64",
+            ax=ax,
         )
 
     if pending_edges:
@@ -185,14 +203,15 @@ def _draw_edges(graph: nx.DiGraph, pos: Dict[str, tuple[float, float]]) -> None:
             arrowstyle='-|>',
             arrowsize=12,
             edge_color="#66bb6a",
+            ax=ax,
         )
 
 
-def _draw_labels(graph: nx.DiGraph, pos: Dict[str, tuple[float, float]]) -> None:
+def _draw_labels(graph: nx.DiGraph, pos: Dict[str, tuple[float, float]], ax: Axes) -> None:
     labels = {node: data.get("label", "")
               for node, data in graph.nodes(data=True)}
     nx.draw_networkx_labels(graph, pos, labels=labels,
-                            font_size=8, font_weight='bold')
+                            font_size=8, font_weight='bold', ax=ax)
 
 
 def _suggest_figsize(num_nodes: int, depth: int) -> tuple[float, float]:
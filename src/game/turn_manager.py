@@ -1,4 +1,3 @@
-from src.models.carta import Carta
 from src.models.slot_carta import SlotCarta
 
 
@@ -34,10 +33,10 @@ class TurnManager:
         return (jogador == self.jogador_atual and
                 not self.jogo_terminado)
 
-    def validar_jogada_em_expedicao(self, carta: Carta, slot: SlotCarta) -> bool:
-        return slot.pode_aceitar_carta(carta, self.jogador_atual)
+    def validar_jogada_em_expedicao(self, carta: int, slot: SlotCarta) -> bool:
+        return slot.pode_aceitar_carta(carta)
 
-    def registrar_carta_jogada(self, carta: Carta, tipo_jogada: str) -> bool:
+    def registrar_carta_jogada(self, carta: int, tipo_jogada: str) -> bool:
         if not self.pode_jogar_carta(self.jogador_atual):
             return False
 
@@ -103,6 +102,14 @@ class TurnManager:
     def pular_turno(self) -> None:
         self._finalizar_turno()
 
+    def capturar_estado(self) -> tuple:
+        return (self.jogador_atual, self.fase_turno, self.carta_jogada_neste_turno,
+                self.carta_comprada_neste_turno, self.jogo_terminado, self.vencedor)
+
+    def restaurar_estado(self, estado: tuple) -> None:
+        (self.jogador_atual, self.fase_turno, self.carta_jogada_neste_turno,
+         self.carta_comprada_neste_turno, self.jogo_terminado, self.vencedor) = estado
+
     def clone(self) -> "TurnManager":
         novo = TurnManager()
         novo.jogador_atual = self.jogador_atual
@@ -0,0 +1,82 @@
+from typing import Dict, List, Tuple
+
+from config.settings import CardConfig, Colors
+
+# Cada carta é um inteiro 0..59: indice_cor * CARTAS_POR_COR + posicao.
+# Posições 0..2 são investimentos e 3..11 são as cartas numeradas 2..10,
+# de modo que a ordem dos ids dentro de uma cor é a ordem de uma expedição.
+
+CORES: Tuple[Tuple[int, int, int], ...] = tuple(
+    Colors.get_available_colors())
+NUM_CORES = len(CORES)
+INDICE_COR: Dict[Tuple[int, int, int], int] = {
+    cor: indice for indice, cor in enumerate(CORES)}
+
+NUM_INVESTIMENTOS = CardConfig.INVESTMENT_CARDS_PER_COLOR
+NUM_NUMERADAS = CardConfig.MAX_CARD_NUMBER - CardConfig.MIN_CARD_NUMBER + 1
+CARTAS_POR_COR = NUM_INVESTIMENTOS + NUM_NUMERADAS
+TOTAL_CARTAS = NUM_CORES * CARTAS_POR_COR
+MASCARA_COR = (1 << CARTAS_POR_COR) - 1
+
+TIPO_NUMERADA = 'numerada'
+TIPO_INVESTIMENTO = 'investimento'
+
+
+def codificar_carta(indice_cor: int, numero: int, indice_investimento: int = 0) -> int:
+    base = indice_cor * CARTAS_POR_COR
+    if numero == 0:
+        return base + indice_investimento
+    return base + NUM_INVESTIMENTOS + numero - CardConfig.MIN_CARD_NUMBER
+
+
+INDICE_COR_CARTA: Tuple[int, ...] = tuple(
+    carta // CARTAS_POR_COR for carta in range(TOTAL_CARTAS))
+COR_CARTA: Tuple[Tuple[int, int, int], ...] = tuple(
+    CORES[indice] for indice in INDICE_COR_CARTA)
+INVESTIMENTO_CARTA: Tuple[bool, ...] = tuple(
+    carta % CARTAS_POR_COR < NUM_INVESTIMENTOS for carta in range(TOTAL_CARTAS))
+NUMERO_CARTA: Tuple[int, ...] = tuple(
+    0 if INVESTIMENTO_CARTA[carta]
+    else carta % CARTAS_POR_COR - NUM_INVESTIMENTOS + CardConfig.MIN_CARD_NUMBER
+    for carta in range(TOTAL_CARTAS))
+TIPO_CARTA: Tuple[str, ...] = tuple(
+    TIPO_INVESTIMENTO if INVESTIMENTO_CARTA[carta] else TIPO_NUMERADA
+    for carta in range(TOTAL_CARTAS))
+
+
+def cor_da_carta(carta: int) -> Tuple[int, int, int]:
+    return COR_CARTA[carta]
+
+
+def indice_cor_da_carta(carta: int) -> int:
+    return INDICE_COR_CARTA[carta]
+
+
+def numero_da_carta(carta: int) -> int:
+    return NUMERO_CARTA[carta]
+
+
+def tipo_da_carta(carta: int) -> str:
+    return TIPO_CARTA[carta]
+
+
+def eh_investimento(carta: int) -> bool:
+    return INVESTIMENTO_CARTA[carta]
+
+
+def descricao_carta(carta: int) -> str:
+    return "INV" if INVESTIMENTO_CARTA[carta] else str(NUMERO_CARTA[carta])
+
+
+def ids_em_ordem_de_criacao() -> List[int]:
+    cartas: List[int] = []
+    for indice_cor in range(NUM_CORES):
+        for numero in range(CardConfig.MIN_CARD_NUMBER, CardConfig.MAX_CARD_NUMBER + 1):
+            cartas.append(codificar_carta(indice_cor, numero))
+
+    for indice_cor in range(NUM_CORES):
+        for indice_investimento in range(NUM_INVESTIMENTOS):
+            cartas.append(codificar_carta(
+                indice_cor, 0, indice_investimento))
+
+    return cartas
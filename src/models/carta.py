@@ -1,20 +1,32 @@
 import pygame
 from typing import Tuple
 
+from src.models.card_codes import COR_CARTA, NUMERO_CARTA, TIPO_CARTA
+
 
 class Carta:
-    def __init__(self, numero: int, cor: Tuple[int, int, int], x: int, y: int, tipo_carta: str = 'numerada'):
-        self.numero = numero
-        self.cor = cor
+    def __init__(self, card_id: int, x: int = 0, y: int = 0):
+        self.card_id = card_id
         self.x = x
         self.y = y
-        self.tipo_carta = tipo_carta
         self.largura = 60
         self.altura = 90
         self.sendo_arrastada = False
         self.offset_x = 0
         self.offset_y = 0
 
+    @property
+    def numero(self) -> int:
+        return NUMERO_CARTA[self.card_id]
+
+    @property
+    def cor(self) -> Tuple[int, int, int]:
+        return COR_CARTA[self.card_id]
+
+    @property
+    def tipo_carta(self) -> str:
+        return TIPO_CARTA[self.card_id]
+
     def get_rect(self) -> pygame.Rect:
         return pygame.Rect(self.x, self.y, self.largura, self.altura)
 
@@ -75,13 +87,7 @@ class Carta:
                               self.largura, self.altura))
 
     def clone(self) -> "Carta":
-        nova_carta = Carta(
-            numero=self.numero,
-            cor=self.cor,
-            x=self.x,
-            y=self.y,
-            tipo_carta=self.tipo_carta
-        )
+        nova_carta = Carta(self.card_id, x=self.x, y=self.y)
         nova_carta.largura = self.largura
         nova_carta.altura = self.altura
         nova_carta.sendo_arrastada = self.sendo_arrastada
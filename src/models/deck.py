@@ -1,36 +1,23 @@
 import random
-from typing import Dict, List, Optional
-from src.models.carta import Carta
-from config.settings import Colors, GameConfig, CardConfig
+from typing import Iterable, List, Optional
+from src.models.card_codes import CARTAS_POR_COR, COR_CARTA, NUMERO_CARTA, ids_em_ordem_de_criacao
+from config.settings import Colors, GameConfig
 
 
 class Deck:
     def __init__(self, rng: Optional[random.Random] = None):
         self._rng = rng or random.Random()
-        self.cartas: List[Carta] = []
+        self.cartas: List[int] = []
         self._criar_deck_completo()
         self.embaralhar()
 
     def _criar_deck_completo(self) -> None:
-        self.cartas.clear()
-        cores_disponiveis = Colors.get_available_colors()
-
-        for cor in cores_disponiveis:
-            for numero in range(CardConfig.MIN_CARD_NUMBER, CardConfig.MAX_CARD_NUMBER + 1):
-                carta = Carta(numero=numero, cor=cor, x=0,
-                              y=0, tipo_carta='numerada')
-                self.cartas.append(carta)
-
-        for cor in cores_disponiveis:
-            for _ in range(CardConfig.INVESTMENT_CARDS_PER_COLOR):
-                carta = Carta(numero=0, cor=cor, x=0, y=0,
-                              tipo_carta='investimento')
-                self.cartas.append(carta)
+        self.cartas[:] = ids_em_ordem_de_criacao()
 
     def embaralhar(self) -> None:
         self._rng.shuffle(self.cartas)
 
-    def comprar_carta(self) -> Optional[Carta]:
+    def comprar_carta(self) -> Optional[int]:
         if self.cartas:
             return self.cartas.pop()
         return None
@@ -49,20 +36,37 @@ class Deck:
 class DiscardPile:
     def __init__(self, cor):
         self.cor = cor
-        self.cartas: List[Carta] = []
+        self.cartas: List[int] = []
+        self._mascara = 0
 
-    def adicionar_carta(self, carta: Carta) -> bool:
-        if carta.cor == self.cor:
+    def adicionar_carta(self, carta: int) -> bool:
+        if COR_CARTA[carta] == self.cor:
             self.cartas.append(carta)
+            self._mascara |= 1 << (carta % CARTAS_POR_COR)
             return True
         return False
 
-    def comprar_carta_topo(self) -> Optional[Carta]:
+    def comprar_carta_topo(self) -> Optional[int]:
         if self.cartas:
-            return self.cartas.pop()
+            carta = self.cartas.pop()
+            self._mascara &= ~(1 << (carta % CARTAS_POR_COR))
+            return carta
         return None
 
-    def ver_carta_topo(self) -> Optional[Carta]:
+    def restaurar_cartas(self, cartas: Iterable[int]) -> None:
+        self.cartas = list(cartas)
+        self._mascara = 0
+        for carta in self.cartas:
+            self._mascara |= 1 << (carta % CARTAS_POR_COR)
+
+    def limpar(self) -> None:
+        self.cartas.clear()
+        self._mascara = 0
+
+    def get_mascara(self) -> int:
+        return self._mascara
+
+    def ver_carta_topo(self) -> Optional[int]:
         if self.cartas:
             return self.cartas[-1]
         return None
@@ -85,31 +89,32 @@ class DeckManager:
         for cor in Colors.get_available_colors():
             self.montes_descarte[cor] = DiscardPile(cor)
 
-    def distribuir_mao_inicial(self) -> List[Carta]:
+    def distribuir_mao_inicial(self) -> List[int]:
         mao = []
         for _ in range(GameConfig.STARTING_HAND_SIZE):
             carta = self.deck.comprar_carta()
-            if carta:
+            if carta is not None:
                 mao.append(carta)
             else:
                 break
 
         return mao
 
-    def comprar_do_deck(self) -> Optional[Carta]:
+    def comprar_do_deck(self) -> Optional[int]:
         return self.deck.comprar_carta()
 
-    def comprar_do_descarte(self, cor) -> Optional[Carta]:
+    def comprar_do_descarte(self, cor) -> Optional[int]:
         if cor in self.montes_descarte:
             return self.montes_descarte[cor].comprar_carta_topo()
         return None
 
-    def descartar_carta(self, carta: Carta) -> bool:
-        if carta.cor in self.montes_descarte:
-            return self.montes_descarte[carta.cor].adicionar_carta(carta)
+    def descartar_carta(self, carta: int) -> bool:
+        cor = COR_CARTA[carta]
+        if cor in self.montes_descarte:
+            return self.montes_descarte[cor].adicionar_carta(carta)
         return False
 
-    def ver_topo_descarte(self, cor) -> Optional[Carta]:
+    def ver_topo_descarte(self, cor) -> Optional[int]:
         if cor in self.montes_descarte:
             return self.montes_descarte[cor].ver_carta_topo()
         return None
@@ -124,7 +129,7 @@ class DeckManager:
             nome_cor = Colors.get_color_names().get(cor, "Desconhecida")
             stats['montes_descarte'][nome_cor] = {
                 'quantidade': monte.quantidade_cartas(),
-                'topo': monte.ver_carta_topo().numero if not monte.esta_vazio() else None
+                'topo': NUMERO_CARTA[monte.ver_carta_topo()] if not monte.esta_vazio() else None
             }
 
         return stats
@@ -134,7 +139,7 @@ class DeckManager:
             self._rng.seed(self._base_seed)
         self.deck.reset()
         for monte in self.montes_descarte.values():
-            monte.cartas.clear()
+            monte.limpar()
 
     def set_seed(self, seed: Optional[int]) -> None:
         self._base_seed = seed
@@ -142,9 +147,9 @@ class DeckManager:
             seed) if seed is not None else random.Random()
         self.deck = Deck(self._rng)
         for monte in self.montes_descarte.values():
-            monte.cartas.clear()
+            monte.limpar()
 
-    def clone(self, card_map: Dict[Carta, Carta]) -> "DeckManager":
+    def clone(self) -> "DeckManager":
         novo_manager = DeckManager.__new__(DeckManager)
         novo_manager._base_seed = self._base_seed
         novo_manager._rng = random.Random()
@@ -152,15 +157,14 @@ class DeckManager:
 
         novo_manager.deck = Deck.__new__(Deck)
         novo_manager.deck._rng = novo_manager._rng
-        novo_manager.deck.cartas = [card_map[carta]
-                                    for carta in self.deck.cartas]
+        novo_manager.deck.cartas = self.deck.cartas[:]
 
         novo_manager.montes_descarte = {}
         for cor, monte in self.montes_descarte.items():
             novo_monte = DiscardPile.__new__(DiscardPile)
             novo_monte.cor = cor
-            novo_monte.cartas = [card_map[carta]
-                                 for carta in monte.cartas]
+            novo_monte.cartas = monte.cartas[:]
+            novo_monte._mascara = monte._mascara
             novo_manager.montes_descarte[cor] = novo_monte
 
         return novo_manager
@@ -1,6 +1,8 @@
-from src.models.carta import Carta
-import pygame
-from typing import Dict, List, Tuple, Optional
+from src.core.rules import JOGADA_LEGAL, pontuacao_expedicao, topo_vazio
+from src.models.card_codes import CARTAS_POR_COR, INDICE_COR, INVESTIMENTO_CARTA, NUMERO_CARTA, TOTAL_CARTAS
+from typing import Iterable, List, Tuple, Optional
+
+_JOGADORES = (None, 1, 2)
 
 
 class SlotCarta:
@@ -10,83 +12,101 @@ class SlotCarta:
         self.cor = cor
         self.largura = 80
         self.altura = 140
-        self.cartas: List[Carta] = []
-        self.cartas_jogador1: List[Carta] = []
-        self.cartas_jogador2: List[Carta] = []
+        self.cartas: List[int] = []
+        self.cartas_jogador1: List[int] = []
+        self.cartas_jogador2: List[int] = []
         self._destacado = False
-
-    def get_rect(self) -> pygame.Rect:
-        return pygame.Rect(self.x, self.y, self.largura, self.altura)
-
-    def pode_aceitar_carta(self, carta: Carta, jogador: int = None) -> bool:
-        if carta.cor != self.cor:
+        self._soma_numeradas = 0
+        self._investimentos = 0
+        self._pontuacao = 0
+        self._mascara = 0
+        self._topo_vazio = topo_vazio(INDICE_COR[cor])
+        self._topos = [self._topo_vazio] * 3
+
+    def get_area(self) -> Tuple[int, int, int, int]:
+        return (self.x, self.y, self.largura, self.altura)
+
+    def contem_ponto(self, pos: Tuple[int, int]) -> bool:
+        return (self.x <= pos[0] < self.x + self.largura and
+                self.y <= pos[1] < self.y + self.altura)
+
+    def pode_aceitar_carta(self, carta: int, jogador: int = None) -> bool:
+        if jogador not in _JOGADORES:
             return False
+        return JOGADA_LEGAL[self._topos[jogador or 0] * TOTAL_CARTAS + carta]
 
-        if self.esta_vazio():
-            return True
-
-        if jogador is None:
-            ultima_carta = self.get_ultima_carta()
-
-            if carta.tipo_carta == 'numerada' and ultima_carta.tipo_carta == 'investimento':
-                return True
-            elif carta.tipo_carta == 'investimento' and ultima_carta.tipo_carta == 'numerada':
-                return False
-            elif carta.tipo_carta == 'investimento' and ultima_carta.tipo_carta == 'investimento':
-                return True
-            else:
-                return carta.numero >= ultima_carta.numero
-
-        if jogador == 1:
-            ultima_carta = self.get_ultima_carta_jogador1()
-        elif jogador == 2:
-            ultima_carta = self.get_ultima_carta_jogador2()
-        else:
-            return False
-
-        if not ultima_carta:
-            return True
-
-        if carta.tipo_carta == 'investimento':
-            return ultima_carta.tipo_carta != 'numerada'
-        elif carta.tipo_carta == 'numerada':
-            if ultima_carta.tipo_carta == 'investimento':
-                return True
-            else:
-                return carta.numero >= ultima_carta.numero
-
-        return False
-
-    def adicionar_carta(self, carta: Carta, jogador: int = None) -> bool:
+    def adicionar_carta(self, carta: int, jogador: int = None) -> bool:
         if self.pode_aceitar_carta(carta, jogador):
-            self.cartas.append(carta)
-
-            if jogador == 1:
-                self.cartas_jogador1.append(carta)
-            elif jogador == 2:
-                self.cartas_jogador2.append(carta)
-
-            carta.mover_para(
-                self.x + (self.largura - carta.largura) // 2,
-                self.y + (self.altura - carta.altura) // 2
-            )
-            carta.parar_arraste()
+            self._empilhar(carta, jogador)
             return True
         return False
 
-    def remover_carta(self, carta: Carta) -> bool:
+    def restaurar_cartas(self, cartas: Iterable[int], jogador: int = None) -> None:
+        for carta in cartas:
+            self._empilhar(carta, jogador)
+
+    def remover_carta(self, carta: int) -> bool:
         if carta in self.cartas:
             self.cartas.remove(carta)
+            self._atualizar_pontuacao(carta, -1)
+            self._atualizar_topos()
             return True
         return False
 
-    def get_ultima_carta(self) -> Optional[Carta]:
+    # Com jogador, remove a última carta daquele jogador: a ordem intercalada
+    # das jogadas dos dois nem sempre é conhecida (ex.: CompactState.to_game_state).
+    def remover_ultima_carta(self, jogador: int = None) -> Optional[int]:
+        cartas_jogador = {1: self.cartas_jogador1, 2: self.cartas_jogador2}.get(jogador)
+        if cartas_jogador is None:
+            if not self.cartas:
+                return None
+            carta = self.cartas.pop()
+        else:
+            if not cartas_jogador:
+                return None
+            carta = cartas_jogador.pop()
+            if self.cartas[-1] == carta:
+                self.cartas.pop()
+            else:
+                self.cartas.remove(carta)
+        self._atualizar_pontuacao(carta, -1)
+        self._atualizar_topos()
+        return carta
+
+    def _empilhar(self, carta: int, jogador: Optional[int]) -> None:
+        self.cartas.append(carta)
+        self._topos[0] = carta
+
+        if jogador == 1:
+            self.cartas_jogador1.append(carta)
+            self._topos[1] = carta
+        elif jogador == 2:
+            self.cartas_jogador2.append(carta)
+            self._topos[2] = carta
+        self._atualizar_pontuacao(carta, 1)
+
+    def _atualizar_topos(self) -> None:
+        vazio = self._topo_vazio
+        self._topos[0] = self.cartas[-1] if self.cartas else vazio
+        self._topos[1] = self.cartas_jogador1[-1] if self.cartas_jogador1 else vazio
+        self._topos[2] = self.cartas_jogador2[-1] if self.cartas_jogador2 else vazio
+
+    def _atualizar_pontuacao(self, carta: int, sinal: int) -> None:
+        self._mascara ^= 1 << (carta % CARTAS_POR_COR)
+        if INVESTIMENTO_CARTA[carta]:
+            self._investimentos += sinal
+        else:
+            self._soma_numeradas += sinal * NUMERO_CARTA[carta]
+        self._pontuacao = pontuacao_expedicao(
+            self._soma_numeradas, self._investimentos, len(self.cartas))
+
+    def get_ultima_carta(self) -> Optional[int]:
         return self.cartas[-1] if self.cartas else None
 
-    def get_ultima_carta_jogador1(self) -> Optional[Carta]:
+    def get_ultima_carta_jogador1(self) -> Optional[int]:
         return self.cartas_jogador1[-1] if self.cartas_jogador1 else None
 
-    def get_ultima_carta_jogador2(self) -> Optional[Carta]:
+    def get_ultima_carta_jogador2(self) -> Optional[int]:
         return self.cartas_jogador2[-1] if self.cartas_jogador2 else None
 
     def esta_vazio(self) -> bool:
@@ -98,126 +118,32 @@ class SlotCarta:
     def destacar(self, destacado: bool = True) -> None:
         self._destacado = destacado
 
-    def calcular_pontuacao(self) -> int:
-        if not self.cartas:
-            return 0
+    def esta_destacado(self) -> bool:
+        return self._destacado
 
-        cartas_investimento = sum(
-            1 for carta in self.cartas if carta.tipo_carta == 'investimento')
+    def get_soma_numeradas(self) -> int:
+        return self._soma_numeradas
 
-        soma_cartas = sum(
-            carta.numero for carta in self.cartas if carta.tipo_carta == 'numerada')
+    def get_mascara(self) -> int:
+        return self._mascara
 
-        pontuacao = soma_cartas - 20
+    def get_quantidade_investimentos(self) -> int:
+        return self._investimentos
 
-        if cartas_investimento == 1:
-            pontuacao *= 2
-        elif cartas_investimento == 2:
-            pontuacao *= 3
-        elif cartas_investimento == 3:
-            pontuacao *= 4
-
-        if len(self.cartas) >= 8:
-            pontuacao += 20
-
-        return pontuacao
-
-    def desenhar(self, tela: pygame.Surface, fonte_pequena: pygame.font.Font) -> None:
-        cor_fundo = self.cor
-        if self._destacado:
-            cor_fundo = tuple(min(255, c + 50) for c in self.cor)
-
-        pygame.draw.rect(tela, cor_fundo, (self.x, self.y,
-                         self.largura, self.altura))
-
-        cor_borda = (0, 0, 0)
-        espessura_borda = 4 if self._destacado else 2
-        pygame.draw.rect(tela, cor_borda, (self.x, self.y,
-                         self.largura, self.altura), espessura_borda)
+    def calcular_pontuacao(self) -> int:
+        return self._pontuacao
 
-        if self.esta_vazio():
-            texto = fonte_pequena.render("Vazio", True, (255, 255, 255))
-            texto_rect = texto.get_rect(
-                center=(self.x + self.largura//2, self.y + self.altura//2))
-            tela.blit(texto, texto_rect)
-        else:
-            quantidade = self.get_quantidade_cartas()
-
-            texto_qtd = fonte_pequena.render(f"{quantidade} carta{'s' if quantidade > 1 else ''}",
-                                             True, (255, 255, 255))
-            texto_rect = texto_qtd.get_rect(
-                center=(self.x + self.largura//2, self.y + 20))
-            tela.blit(texto_qtd, texto_rect)
-
-            y_offset = 35
-
-            ultima_carta_j1 = self.get_ultima_carta_jogador1()
-            if ultima_carta_j1:
-                if ultima_carta_j1.tipo_carta == 'investimento':
-                    texto_j1 = fonte_pequena.render(
-                        "J1: INV", True, (255, 255, 255))
-                else:
-                    texto_j1 = fonte_pequena.render(
-                        f"J1: {ultima_carta_j1.numero}", True, (255, 255, 255))
-            else:
-                texto_j1 = fonte_pequena.render(
-                    "J1: --", True, (255, 255, 255))
-
-            texto_rect = texto_j1.get_rect(
-                center=(self.x + self.largura//2, self.y + y_offset))
-            tela.blit(texto_j1, texto_rect)
-
-            y_offset += 15
-            ultima_carta_j2 = self.get_ultima_carta_jogador2()
-            if ultima_carta_j2:
-                if ultima_carta_j2.tipo_carta == 'investimento':
-                    texto_j2 = fonte_pequena.render(
-                        "J2: INV", True, (255, 255, 255))
-                else:
-                    texto_j2 = fonte_pequena.render(
-                        f"J2: {ultima_carta_j2.numero}", True, (255, 255, 255))
-            else:
-                texto_j2 = fonte_pequena.render(
-                    "J2: --", True, (255, 255, 255))
-
-            texto_rect = texto_j2.get_rect(
-                center=(self.x + self.largura//2, self.y + y_offset))
-            tela.blit(texto_j2, texto_rect)
-
-            y_offset += 20
-
-            if self.cartas_jogador1:
-                cartas_j1_str = ",".join([
-                    "I" if c.tipo_carta == 'investimento' else str(c.numero)
-                    for c in self.cartas_jogador1
-                ])
-                texto_lista_j1 = fonte_pequena.render(
-                    f"J1:[{cartas_j1_str}]", True, (200, 200, 200))
-                texto_rect = texto_lista_j1.get_rect(
-                    center=(self.x + self.largura//2, self.y + y_offset))
-                tela.blit(texto_lista_j1, texto_rect)
-
-            y_offset += 12
-
-            if self.cartas_jogador2:
-                cartas_j2_str = ",".join([
-                    "I" if c.tipo_carta == 'investimento' else str(c.numero)
-                    for c in self.cartas_jogador2
-                ])
-                texto_lista_j2 = fonte_pequena.render(
-                    f"J2:[{cartas_j2_str}]", True, (200, 200, 200))
-                texto_rect = texto_lista_j2.get_rect(
-                    center=(self.x + self.largura//2, self.y + y_offset))
-                tela.blit(texto_lista_j2, texto_rect)
-
-    def clone(self, card_map: Dict[Carta, Carta]) -> "SlotCarta":
+    def clone(self) -> "SlotCarta":
         novo_slot = SlotCarta(self.x, self.y, self.cor)
         novo_slot.largura = self.largura
         novo_slot.altura = self.altura
         novo_slot._destacado = self._destacado
-        novo_slot.cartas = [card_map[carta] for carta in self.cartas]
-        novo_slot.cartas_jogador1 = [card_map[carta]
-                                     for carta in self.cartas_jogador1]
-        novo_slot.cartas_jogador2 = [card_map[carta]
-                                     for carta in self.cartas_jogador2]
+        novo_slot.cartas = self.cartas[:]
+        novo_slot.cartas_jogador1 = self.cartas_jogador1[:]
+        novo_slot.cartas_jogador2 = self.cartas_jogador2[:]
+        novo_slot._soma_numeradas = self._soma_numeradas
+        novo_slot._investimentos = self._investimentos
+        novo_slot._pontuacao = self._pontuacao
+        novo_slot._mascara = self._mascara
+        novo_slot._topos = self._topos[:]
         return novo_slot
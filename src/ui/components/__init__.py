@@ -2,10 +2,12 @@ from .hand_renderer import HandRenderer
 from .scoreboard_renderer import ScoreboardRenderer
 from .game_info_renderer import GameInfoRenderer
 from .ui_effects_renderer import UIEffectsRenderer
+from .slot_renderer import SlotRenderer
 
 __all__ = [
     'HandRenderer',
     'ScoreboardRenderer',
     'GameInfoRenderer',
-    'UIEffectsRenderer'
+    'UIEffectsRenderer',
+    'SlotRenderer'
 ]
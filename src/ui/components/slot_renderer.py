@@ -0,0 +1,89 @@
+import pygame
+from src.models.card_codes import INVESTIMENTO_CARTA, NUMERO_CARTA, descricao_carta
+from src.models.slot_carta import SlotCarta
+
+
+class SlotRenderer:
+    def __init__(self, tela: pygame.Surface, fonte_pequena: pygame.font.Font):
+        self.tela = tela
+        self.fonte_pequena = fonte_pequena
+
+    def desenhar_slot(self, slot: SlotCarta) -> None:
+        cor_fundo = slot.cor
+        if slot.esta_destacado():
+            cor_fundo = tuple(min(255, c + 50) for c in slot.cor)
+
+        pygame.draw.rect(self.tela, cor_fundo, (slot.x, slot.y,
+                         slot.largura, slot.altura))
+
+        cor_borda = (0, 0, 0)
+        espessura_borda = 4 if slot.esta_destacado() else 2
+        pygame.draw.rect(self.tela, cor_borda, (slot.x, slot.y,
+                         slot.largura, slot.altura), espessura_borda)
+
+        if slot.esta_vazio():
+            texto = self.fonte_pequena.render("Vazio", True, (255, 255, 255))
+            texto_rect = texto.get_rect(
+                center=(slot.x + slot.largura//2, slot.y + slot.altura//2))
+            self.tela.blit(texto, texto_rect)
+        else:
+            quantidade = slot.get_quantidade_cartas()
+
+            texto_qtd = self.fonte_pequena.render(f"{quantidade} carta{'s' if quantidade > 1 else ''}",
+                                             True, (255, 255, 255))
+            texto_rect = texto_qtd.get_rect(
+                center=(slot.x + slot.largura//2, slot.y + 20))
+            self.tela.blit(texto_qtd, texto_rect)
+
+            y_offset = 35
+
+            ultima_carta_j1 = slot.get_ultima_carta_jogador1()
+            if ultima_carta_j1 is not None:
+                texto_j1 = self.fonte_pequena.render(
+                    f"J1: {descricao_carta(ultima_carta_j1)}", True, (255, 255, 255))
+            else:
+                texto_j1 = self.fonte_pequena.render(
+                    "J1: --", True, (255, 255, 255))
+
+            texto_rect = texto_j1.get_rect(
+                center=(slot.x + slot.largura//2, slot.y + y_offset))
+            self.tela.blit(texto_j1, texto_rect)
+
+            y_offset += 15
+            ultima_carta_j2 = slot.get_ultima_carta_jogador2()
+            if ultima_carta_j2 is not None:
+                texto_j2 = self.fonte_pequena.render(
+                    f"J2: {descricao_carta(ultima_carta_j2)}", True, (255, 255, 255))
+            else:
+                texto_j2 = self.fonte_pequena.render(
+                    "J2: --", True, (255, 255, 255))
+
+            texto_rect = texto_j2.get_rect(
+                center=(slot.x + slot.largura//2, slot.y + y_offset))
+            self.tela.blit(texto_j2, texto_rect)
+
+            y_offset += 20
+
+            if slot.cartas_jogador1:
+                cartas_j1_str = ",".join([
+                    "I" if INVESTIMENTO_CARTA[c] else str(NUMERO_CARTA[c])
+                    for c in slot.cartas_jogador1
+                ])
+                texto_lista_j1 = self.fonte_pequena.render(
+                    f"J1:[{cartas_j1_str}]", True, (200, 200, 200))
+                texto_rect = texto_lista_j1.get_rect(
+                    center=(slot.x + slot.largura//2, slot.y + y_offset))
+                self.tela.blit(texto_lista_j1, texto_rect)
+
+            y_offset += 12
+
+            if slot.cartas_jogador2:
+                cartas_j2_str = ",".join([
+                    "I" if INVESTIMENTO_CARTA[c] else str(NUMERO_CARTA[c])
+                    for c in slot.cartas_jogador2
+                ])
+                texto_lista_j2 = self.fonte_pequena.render(
+                    f"J2:[{cartas_j2_str}]", True, (200, 200, 200))
+                texto_rect = texto_lista_j2.get_rect(
+                    center=(slot.x + slot.largura//2, slot.y + y_offset))
+                self.tela.blit(texto_lista_j2, texto_rect)
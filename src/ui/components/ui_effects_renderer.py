@@ -1,5 +1,5 @@
 import pygame
-from typing import List
+from typing import List, Optional
 from src.models.carta import Carta
 from src.models.slot_carta import SlotCarta
 from config.settings import Colors
@@ -10,7 +10,8 @@ class UIEffectsRenderer:
         self.tela = tela
         self.fonte_carta = fonte_carta
 
-    def desenhar_feedback_arraste(self, carta_arrastada: Carta, slots: List[SlotCarta], pos_mouse: tuple) -> None:
+    def desenhar_feedback_arraste(self, carta_arrastada: Carta, slots: List[SlotCarta], pos_mouse: tuple,
+                                  jogador: Optional[int] = None) -> None:
         if not carta_arrastada:
             return
 
@@ -18,8 +19,8 @@ class UIEffectsRenderer:
         slot_invalido = None
 
         for slot in slots:
-            if slot.get_rect().collidepoint(pos_mouse):
-                if slot.pode_aceitar_carta(carta_arrastada):
+            if slot.contem_ponto(pos_mouse):
+                if slot.pode_aceitar_carta(carta_arrastada.card_id, jogador):
                     slot_valido = slot
                 else:
                     slot_invalido = slot
@@ -27,10 +28,10 @@ class UIEffectsRenderer:
 
         if slot_valido:
             pygame.draw.rect(self.tela, Colors.LIGHT_GREEN,
-                             slot_valido.get_rect(), 5)
+                             slot_valido.get_area(), 5)
         elif slot_invalido:
             pygame.draw.rect(self.tela, Colors.LIGHT_RED,
-                             slot_invalido.get_rect(), 5)
+                             slot_invalido.get_area(), 5)
 
     def desenhar_mensagem_temporaria(self, mensagem: str, x: int, y: int, cor: tuple = None) -> None:
         if cor is None:
@@ -3,14 +3,15 @@ from config.settings import (
 )
 from src.models.slot_carta import SlotCarta
 from src.models.carta import Carta
-from .components import HandRenderer, ScoreboardRenderer, GameInfoRenderer, UIEffectsRenderer
+from .components import HandRenderer, ScoreboardRenderer, GameInfoRenderer, UIEffectsRenderer, SlotRenderer
 import pygame
-from typing import List
+from typing import Dict, List, Optional
 
 
 class GameRenderer:
     def __init__(self, tela: pygame.Surface):
         self.tela = tela
+        self.cartas_descarte: Dict[int, Carta] = {}
         self._inicializar_fontes()
         self._inicializar_componentes()
 
@@ -29,6 +30,7 @@ class GameRenderer:
             self.tela, self.fonte_carta, self.fonte_pequena)
         self.ui_effects_renderer = UIEffectsRenderer(
             self.tela, self.fonte_carta)
+        self.slot_renderer = SlotRenderer(self.tela, self.fonte_pequena)
 
     def limpar_tela(self) -> None:
         self.tela.fill(Colors.LIGHT_GRAY)
@@ -62,7 +64,7 @@ class GameRenderer:
 
     def desenhar_slots(self, slots: List[SlotCarta]) -> None:
         for slot in slots:
-            slot.desenhar(self.tela, self.fonte_pequena)
+            self.slot_renderer.desenhar_slot(slot)
 
     def desenhar_area_mao_jogador1(self, cartas: List[Carta], jogador_ativo: bool) -> None:
         self.hand_renderer.desenhar_area_mao_jogador1(cartas, jogador_ativo)
@@ -81,10 +83,12 @@ class GameRenderer:
             pygame.draw.rect(self.tela, Colors.BLACK, area, 2)
 
             carta_topo = deck_manager.ver_topo_descarte(cor)
-            if carta_topo:
-                carta_topo.x = area.x
-                carta_topo.y = area.y
-                carta_topo.desenhar(self.tela, self.fonte_pequena)
+            if carta_topo is not None:
+                view = self.cartas_descarte.get(carta_topo)
+                if view is None:
+                    view = self.cartas_descarte[carta_topo] = Carta(carta_topo)
+                view.mover_para(area.x, area.y)
+                view.desenhar(self.tela, self.fonte_pequena)
             else:
                 nome_cor = nomes_cores.get(cor, "?")
                 texto = self.fonte_pequena.render(
@@ -99,9 +103,9 @@ class GameRenderer:
         self.game_info_renderer.desenhar_info_deck(deck_manager)
 
     def desenhar_feedback_arraste(self, carta_arrastada: Carta, slots: List[SlotCarta],
-                                  pos_mouse: tuple) -> None:
+                                  pos_mouse: tuple, jogador: Optional[int] = None) -> None:
         self.ui_effects_renderer.desenhar_feedback_arraste(
-            carta_arrastada, slots, pos_mouse)
+            carta_arrastada, slots, pos_mouse, jogador)
 
     def desenhar_instrucoes(self, instrucoes_customizadas: List[str] = None) -> None:
         if instrucoes_customizadas is None:
@@ -205,13 +209,13 @@ class UIManager:
 
         if carta_arrastada and pos_mouse and turn_manager:
             self.renderer.desenhar_feedback_arraste(
-                carta_arrastada, slots, pos_mouse)
+                carta_arrastada, slots, pos_mouse, turn_manager.jogador_atual)
 
         if self.mostrar_estatisticas:
             self.renderer.desenhar_estatisticas(slots_jogador1, slots_jogador2)
 
         instrucoes = [
-            "ESC: Sair | R: Novo Jogo | S: Estatísticas | D: Comprar do Deck | ESPAÇO: Avançar Fase | Z: Desfazer | T: Salvar Árvore"
+            "ESC: Sair | R: Novo Jogo | S: Estatísticas | D: Comprar do Deck | ESPAÇO: Avançar Fase | Z: Desfazer | T: Salvar Árvore | I: IA | ENTER: IA joga já"
         ]
         self.renderer.desenhar_instrucoes(instrucoes)
 
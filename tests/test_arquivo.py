@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from src.analysis.arquivo import ArquivoPartidas, EscritorArquivo, caminho_indice
+from src.analysis.torneio import jogar_partida
+from src.game.registro import RegistroPartida
+
+POLITICAS = ('aleatoria', 'leve')
+
+
+def _gravar(escritor: EscritorArquivo, seed: int) -> RegistroPartida:
+    resultado = jogar_partida(POLITICAS, 0, seed, False)
+    registro = RegistroPartida(resultado.seed, bytearray(resultado.movimentos))
+    escritor.adicionar(registro, resultado.pontuacao1, resultado.pontuacao2, resultado.vencedor)
+    return registro
+
+
+@pytest.fixture
+def arquivo(tmp_path):
+    caminho = tmp_path / 'partidas.lcr'
+    with EscritorArquivo(caminho) as escritor:
+        registros = [_gravar(escritor, seed) for seed in range(3)]
+    with ArquivoPartidas(caminho) as leitor:
+        indice = np.array(leitor.indice)
+    return caminho, registros, indice
+
+
+def test_escritor_reconstroi_indice_ausente(arquivo):
+    caminho, registros, indice = arquivo
+    caminho_indice(caminho).unlink()
+
+    with EscritorArquivo(caminho) as escritor:
+        assert escritor.partidas == len(registros)
+        registros.append(_gravar(escritor, 3))
+
+    with ArquivoPartidas(caminho) as leitor:
+        assert len(leitor) == len(registros)
+        assert np.array_equal(leitor.indice[:len(indice)], indice)
+        assert list(leitor.registros(range(len(leitor)))) == registros
+
+
+def test_reconstrucao_descarta_partida_incompleta(arquivo):
+    caminho, registros, indice = arquivo
+    caminho_indice(caminho).unlink()
+    with caminho.open('r+b') as dados:
+        dados.truncate(int(indice[-1]['deslocamento']) + 5)
+
+    with EscritorArquivo(caminho) as escritor:
+        assert escritor.partidas == len(registros) - 1
+
+    with ArquivoPartidas(caminho) as leitor:
+        assert np.array_equal(leitor.indice, indice[:-1])
+        assert caminho.stat().st_size == int(indice[-1]['deslocamento'])
@@ -0,0 +1,76 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.ai.playout import simular
+from src.analysis.batch_scoring import extrair_expedicoes, pontuar_estados, pontuar_expedicoes
+from src.core.game_manager import GameManager
+from src.core.rules import calcular_pontuacao_cartas, pontuacao_expedicao
+from src.game.compact_state import CompactState
+from src.models.card_codes import CARTAS_POR_COR, INVESTIMENTO_CARTA, MASCARA_COR, NUM_CORES, NUMERO_CARTA
+
+MASCARAS = range(MASCARA_COR + 1)
+
+
+def _cartas(mascara: int, indice_cor: int = 0):
+    return [indice_cor * CARTAS_POR_COR + bit for bit in range(CARTAS_POR_COR) if mascara >> bit & 1]
+
+
+def test_pontuar_expedicoes_em_todas_as_mascaras():
+    cartas = [_cartas(mascara) for mascara in MASCARAS]
+    somas = [sum(NUMERO_CARTA[carta] for carta in lista) for lista in cartas]
+    investimentos = [sum(INVESTIMENTO_CARTA[carta] for carta in lista) for lista in cartas]
+    quantidades = [len(lista) for lista in cartas]
+
+    esperado = [pontuacao_expedicao(*valores) for valores in zip(somas, investimentos, quantidades)]
+    assert pontuar_expedicoes(somas, investimentos, quantidades).tolist() == esperado
+
+
+@pytest.mark.parametrize('indice_cor', range(NUM_CORES))
+def test_extrair_expedicoes_em_todas_as_mascaras(indice_cor):
+    deslocamento = indice_cor * CARTAS_POR_COR
+    expedicoes = [(mascara << deslocamento, 0) for mascara in MASCARAS]
+    somas, investimentos, quantidades = extrair_expedicoes(expedicoes)
+
+    for mascara in MASCARAS:
+        cartas = _cartas(mascara, indice_cor)
+        assert somas[mascara, 0, indice_cor] == sum(NUMERO_CARTA[carta] for carta in cartas)
+        assert investimentos[mascara, 0, indice_cor] == sum(INVESTIMENTO_CARTA[carta] for carta in cartas)
+        assert quantidades[mascara, 0, indice_cor] == len(cartas)
+    assert not somas[:, 1].any() and not quantidades[:, 1].any()
+
+    pontuacoes = pontuar_expedicoes(somas, investimentos, quantidades)[:, 0, indice_cor]
+    assert pontuacoes.tolist() == [calcular_pontuacao_cartas(_cartas(mascara, indice_cor))
+                                   for mascara in MASCARAS]
+
+
+def test_grade_de_soma_investimentos_e_quantidade():
+    somas, investimentos, quantidades = np.meshgrid(
+        np.arange(0, 55), np.arange(0, 4), np.arange(0, CARTAS_POR_COR + 1), indexing='ij')
+    pontuacoes = pontuar_expedicoes(somas, investimentos, quantidades)
+
+    assert pontuacoes.shape == somas.shape
+    for indice in np.ndindex(somas.shape):
+        assert pontuacoes[indice] == pontuacao_expedicao(
+            int(somas[indice]), int(investimentos[indice]), int(quantidades[indice]))
+
+
+def _estados_aleatorios(quantidade: int, seed: int):
+    rng = random.Random(seed)
+    estados = []
+    for indice in range(quantidade):
+        estado = CompactState.from_game_state(GameManager.create_default(seed=indice).state)
+        simular(estado, rng.random, rng.randrange(0, 120))
+        estados.append(estado)
+    return estados
+
+
+def test_pontuar_estados_igual_a_calcular_pontuacao():
+    estados = _estados_aleatorios(200, seed=7)
+    pontuacoes = pontuar_estados(estados)
+
+    assert pontuacoes.shape == (len(estados), 2)
+    for estado, (pontuacao1, pontuacao2) in zip(estados, pontuacoes.tolist()):
+        assert pontuacao1 == estado.calcular_pontuacao(1)
+        assert pontuacao2 == estado.calcular_pontuacao(2)
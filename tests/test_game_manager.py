@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from src.core.game_manager import GameManager
+from src.game.compact_state import CompactState
+from src.game.moves import GameMove
+
+SEED = 3
+
+
+def _retrato(game_manager: GameManager) -> CompactState:
+    return CompactState.from_game_state(game_manager.state)
+
+
+def test_apply_recusa_movimento_fora_da_vez():
+    game_manager = GameManager.create_default(seed=SEED)
+    assert game_manager.get_jogador_atual() == 1
+    antes = _retrato(game_manager)
+
+    with pytest.raises(ValueError):
+        game_manager.apply(GameMove('discard', 2, 0))
+    assert _retrato(game_manager) == antes
+
+
+def test_apply_e_undo_restauram_o_estado():
+    game_manager = GameManager.create_default(seed=SEED)
+    rng = random.Random(SEED)
+    retratos = []
+    tokens = []
+    for _ in range(60):
+        estado = _retrato(game_manager)
+        if estado.jogo_terminado:
+            break
+        retratos.append(estado)
+        jogador = game_manager.get_jogador_atual()
+        codigo = rng.choice(estado.gerar_movimentos())
+        tokens.append(game_manager.apply(
+            GameMove.from_codigo(codigo, jogador, game_manager.get_hand(jogador))))
+
+    for token, estado in zip(reversed(tokens), reversed(retratos)):
+        game_manager.undo(token)
+        assert _retrato(game_manager) == estado
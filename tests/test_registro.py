@@ -0,0 +1,37 @@
+import io
+
+import pytest
+
+from src.game.registro import (
+    SEED_MAXIMA,
+    SEED_MINIMA,
+    EscritorRegistros,
+    RegistroPartida,
+    ler_registros,
+)
+
+
+@pytest.mark.parametrize('seed', [SEED_MAXIMA + 1, SEED_MINIMA - 1, 2 ** 64])
+def test_registro_recusa_seed_fora_de_64_bits(seed):
+    with pytest.raises(ValueError, match='Seed'):
+        RegistroPartida(seed)
+
+
+def test_escrita_recusa_seed_alterada_sem_gravar_nada():
+    arquivo = io.BytesIO()
+    escritor = EscritorRegistros(arquivo)
+    registro = RegistroPartida(0, bytearray(b'\x00\x80'))
+    registro.seed = SEED_MAXIMA + 1
+    tamanho = arquivo.tell()
+
+    with pytest.raises(ValueError, match='Seed'):
+        escritor.escrever(registro)
+    assert arquivo.tell() == tamanho
+
+
+@pytest.mark.parametrize('seed', [SEED_MINIMA, SEED_MAXIMA])
+def test_seeds_nos_limites_fazem_ida_e_volta(seed):
+    arquivo = io.BytesIO()
+    EscritorRegistros(arquivo).escrever(RegistroPartida(seed, bytearray(b'\x01')))
+    arquivo.seek(0)
+    assert list(ler_registros(arquivo)) == [RegistroPartida(seed, bytearray(b'\x01'))]
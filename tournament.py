@@ -0,0 +1,102 @@
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+from config.settings import AIConfig, DEFAULT_RANDOM_SEED
+from src.ai.politicas import POLITICAS, validar_especificacao
+from src.analysis.arquivo import EscritorArquivo
+from src.analysis.classificacao import Classificacao
+from src.analysis.torneio import MAX_JOGADAS, ResumoTorneio, executar_torneio, gerar_partidas
+from src.game.registro import RegistroPartida
+
+
+def especificacao_politica(valor: str) -> str:
+    try:
+        return validar_especificacao(valor)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Torneio entre duas políticas sem interface gráfica.',
+        epilog=f"Políticas: {', '.join(sorted(POLITICAS))} (use nome:parametro, ex. mcts:500).")
+    parser.add_argument('politica1', type=especificacao_politica)
+    parser.add_argument('politica2', type=especificacao_politica)
+    parser.add_argument('--partidas', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=DEFAULT_RANDOM_SEED)
+    parser.add_argument('--workers', type=int, default=AIConfig.WORKERS)
+    parser.add_argument('--lote', type=int, default=0,
+                        help='partidas por tarefa enviada ao pool (0: automático)')
+    parser.add_argument('--max-jogadas', type=int, default=MAX_JOGADAS)
+    parser.add_argument('--sem-alternar', action='store_true',
+                        help='não repete cada seed com os lugares trocados')
+    parser.add_argument('--saida', type=Path, default=Path('files') / 'torneio.jsonl')
+    parser.add_argument('--arquivo', type=Path,
+                        help='acrescenta as partidas (seed e movimentos) a este arquivo indexado')
+    parser.add_argument('--classificacao', type=Path,
+                        help='checkpoint JSON da classificação Glicko (carregado se existir)')
+    parser.add_argument('--checkpoint', type=int, default=500,
+                        help='salva a classificação a cada N partidas')
+    parser.add_argument('--rd-alvo', type=float, default=0.0,
+                        help='para quando o RD das duas políticas ficar abaixo deste valor')
+    args = parser.parse_args()
+
+    partidas = gerar_partidas(args.partidas, args.seed, not args.sem_alternar)
+    resumo = ResumoTorneio((args.politica1, args.politica2))
+    args.saida.parent.mkdir(parents=True, exist_ok=True)
+    classificacao = Classificacao()
+    if args.classificacao and args.classificacao.exists():
+        classificacao = Classificacao.carregar(args.classificacao)
+    nomes = [args.politica1, args.politica2]
+
+    arquivo = EscritorArquivo(args.arquivo) if args.arquivo else None
+
+    inicio = time.perf_counter()
+    with args.saida.open('w', encoding='utf-8') as saida:
+        for resultado in executar_torneio((args.politica1, args.politica2), partidas,
+                                          max(1, args.workers), args.lote, args.max_jogadas):
+            saida.write(json.dumps(resultado.para_dict()) + '\n')
+            saida.flush()
+            if arquivo:
+                arquivo.adicionar(RegistroPartida(resultado.seed, bytearray(resultado.movimentos)),
+                                  resultado.pontuacao1, resultado.pontuacao2, resultado.vencedor)
+            resumo.registrar(resultado)
+            classificacao.registrar(resultado.jogador1, resultado.jogador2, resultado.vencedor)
+            if args.classificacao and resumo.partidas % args.checkpoint == 0:
+                classificacao.salvar(args.classificacao)
+            if args.rd_alvo and classificacao.convergiu(args.rd_alvo, nomes):
+                print(f'Classificação convergiu após {resumo.partidas} partidas.', file=sys.stderr)
+                break
+            if resumo.partidas % 100 == 0:
+                decorrido = time.perf_counter() - inicio
+                print(f'{resumo.partidas}/{len(partidas)} partidas '
+                      f'({resumo.partidas / decorrido:.1f}/s)', file=sys.stderr)
+    decorrido = time.perf_counter() - inicio
+    if arquivo:
+        arquivo.fechar()
+    if args.classificacao:
+        classificacao.salvar(args.classificacao)
+
+    vitorias1, vitorias2 = resumo.vitorias
+    print(f'{args.politica1} x {args.politica2}: {vitorias1} x {vitorias2}, '
+          f'{resumo.empates} empates, {resumo.interrompidas} interrompidas')
+    print(f'diferença média: {resumo.diferenca_media:+.2f} pontos para {args.politica1}')
+    print(f'{resumo.partidas} partidas em {decorrido:.2f}s: '
+          f'{resumo.partidas / decorrido:.1f} partidas/s, '
+          f'{resumo.jogadas / decorrido:.0f} jogadas/s, '
+          f'{args.workers} workers, resultados em {args.saida}')
+    if classificacao.partidas:
+        for jogador in classificacao.ranking():
+            inferior, superior = jogador.intervalo()
+            print(f'{jogador.nome:>16} {jogador.rating:7.1f} ± {jogador.rd * 1.96:5.1f} '
+                  f'[{inferior:.0f}, {superior:.0f}] {jogador.partidas} partidas')
+        if args.politica1 != args.politica2:
+            status = 'separados' if classificacao.separados(*nomes) else 'sobrepostos'
+            print(f'intervalos de 95% {status}')
+
+
+if __name__ == '__main__':
+    main()